@@ -0,0 +1,36 @@
+"""
+This example shows how to detect gestures such as double clicks, auto-repeat and chords
+with the buttons of the Modulino Buttons.
+
+Button A reacts to single and double clicks, holding button B counts up faster and faster
+and pressing A and C together resets the counter.
+
+Initial author: Sebastian Romero (s.romero@arduino.cc)
+"""
+
+from modulino import ModulinoButtons
+from time import sleep_ms
+
+buttons = ModulinoButtons()
+counter = 0
+
+def count_up(repetition):
+    global counter
+    counter += 1
+    print(f"🔢 Counter: {counter}")
+
+def reset_counter():
+    global counter
+    counter = 0
+    print("🔄 Counter reset")
+
+gestures = buttons.gestures
+gestures.add_click(0, lambda: print("👆 Button A clicked"))
+gestures.add_click(0, lambda: print("✌️ Button A double clicked"), count=2)
+gestures.add_click(1, lambda: count_up(0))
+gestures.add_repeat(1, count_up, delay_ms=500, interval_ms=200, min_interval_ms=40)
+gestures.add_chord((0, 2), reset_counter)
+
+while True:
+    buttons.update()
+    sleep_ms(10)
@@ -313,7 +313,7 @@ def run(bus: I2C):
         return
 
     device_manager = DeviceManager(i2c_bus=bus)
-    devices = device_manager.available_devices()
+    devices = device_manager.available_devices(defer_init=True) # The devices are only listed, no need to initialize them
     device_scan_timestamp = time.ticks_ms() # Remeber when the scan was performed
     device = select_device(devices)
 
@@ -0,0 +1,18 @@
+"""
+This example shows how to react to Modulinos that are connected or disconnected at runtime.
+
+The HotplugWatcher probes the known Modulinos and a small part of the remaining addresses
+every half second instead of scanning the whole bus.
+A Modulino that is plugged in again is reported with the same object it had before.
+
+Initial author: Sebastian Romero (s.romero@arduino.cc)
+"""
+
+from modulino import HotplugWatcher
+import asyncio
+
+watcher = HotplugWatcher()
+watcher.on_attach = lambda device: print(f"🔌 {device.name} connected at {hex(device.address)}")
+watcher.on_detach = lambda device: print(f"❌ {device.name} disconnected from {hex(device.address)}")
+
+asyncio.run(watcher.run(interval_ms=500))
@@ -0,0 +1,38 @@
+"""
+This example shows how to poll several input Modulinos with the InputHub.
+
+The hub polls the Buttons, Knob and Joystick from a single asyncio task.
+Modules that don't change are polled less often, so an idle setup barely uses the I2C bus.
+The callbacks of the modules are executed as usual, changes can additionally be awaited.
+
+Initial author: Sebastian Romero (s.romero@arduino.cc)
+"""
+
+from modulino import ModulinoButtons, ModulinoKnob, ModulinoJoystick, InputHub
+import asyncio
+
+buttons = ModulinoButtons()
+knob = ModulinoKnob()
+joystick = ModulinoJoystick()
+
+buttons.on_button_a_press = lambda: print("🔘 Button A pressed!")
+knob.on_rotate_clockwise = lambda steps, value: print(f"🎛️ Rotated {steps} steps clockwise! Value: {value}")
+knob.on_rotate_counter_clockwise = lambda steps, value: print(f"🎛️ Rotated {steps} steps counter clockwise! Value: {value}")
+
+hub = InputHub()
+hub.add(buttons)
+hub.add(knob, interval_ms=10) # Poll the knob more often while it's being turned
+hub.add(joystick)
+
+async def print_joystick():
+    while True:
+        await hub.wait(joystick)
+        print(f"🕹️ x: {joystick.x}, y: {joystick.y}")
+
+async def main():
+    await asyncio.gather(
+        hub.run(),
+        print_joystick()
+    )
+
+asyncio.run(main())
@@ -35,7 +35,7 @@ async def blink_led():
     
 async def read_knob():
     while True:
-        if(knob.update()):
+        if(await knob.aupdate()):
             print("👀 Knob value or state changed!")
         await asyncio.sleep_ms(20)
 
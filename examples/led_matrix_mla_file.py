@@ -0,0 +1,21 @@
+"""
+This example demonstrates how to stream an MLA animation file onto the Modulino LED Matrix.
+MLA files are created from MPJ files, images or videos with tools/led-matrix/convert_to_mla.py, e.g.:
+  python tools/led-matrix/convert_to_mla.py clip.mp4 -o animation.mla --fps 25
+Only one frame is kept in memory at a time, so long animations can be played as well.
+"""
+
+from modulino import ModulinoLEDMatrix, MLAAnimation
+
+led_matrix = ModulinoLEDMatrix(use_grayscale=True)
+led_matrix.clear().show()
+
+try:
+    animation = MLAAnimation(led_matrix, '/animation.mla')
+    print(f"Playing animation with {animation.frame_count} frames.")
+    print("Press Ctrl+C to stop.")
+    animation.play(loop=True)
+
+except KeyboardInterrupt:
+    print("Animation stopped by user.")
+    led_matrix.clear().show()
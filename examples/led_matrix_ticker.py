@@ -0,0 +1,48 @@
+"""
+This example shows how to combine eight Modulino LED Matrices into one 48x16 display
+with the LEDMatrixCanvas class and scroll a text across it.
+
+The matrices are arranged in two rows of four. The matrices of the second row are mounted upside down,
+so that their cables point to the middle. Change the addresses and rotations to match your setup.
+Use the 'change_address.py' example to give every LED Matrix its own address.
+
+Initial author: Sebastian Romero (s.romero@arduino.cc)
+"""
+
+from modulino import ModulinoLEDMatrix, LEDMatrixCanvas
+from time import ticks_ms, ticks_add, ticks_diff, sleep_ms
+
+ADDRESSES = (0x72, 0x40, 0x41, 0x42, 0x43, 0x44, 0x45, 0x46)
+ROTATIONS = (0, 0, 0, 0, 180, 180, 180, 180)
+FRAME_TIME_MS = 40
+
+matrices = [ModulinoLEDMatrix(address=address) for address in ADDRESSES]
+canvas = LEDMatrixCanvas(matrices, columns=4, rotations=list(ROTATIONS))
+
+# Send the frames of all matrices back to back
+queue = matrices[0].command_queue
+queue.start()
+
+message = "Hello from the Modulino LED Matrix!"
+text_width = len(message) * 8
+x = canvas.width
+deadline = ticks_ms()
+
+while True:
+    canvas.clear()
+    canvas.text(x, 0, message)
+    canvas.text(x + text_width // 2, 8, message)
+    canvas.show()
+    queue.flush()
+
+    x -= 1
+    if x < -text_width:
+        x = canvas.width
+
+    # Keep a steady frame rate regardless of how many matrices changed
+    deadline = ticks_add(deadline, FRAME_TIME_MS)
+    wait = ticks_diff(deadline, ticks_ms())
+    if wait > 0:
+        sleep_ms(wait)
+    else:
+        deadline = ticks_ms()
@@ -0,0 +1,35 @@
+"""
+This example shows how to play effects on the Modulino Pixels with the PixelAnimator.
+It cycles through a fade, a chase, a rainbow and a breathing light
+and blends from a two-colored frame into a gradient at the end.
+
+Initial author: Sebastian Romero (s.romero@arduino.cc)
+"""
+
+from modulino import ModulinoPixels, PixelAnimator, FadeEffect, ChaseEffect, RainbowEffect, BreatheEffect, BlendEffect
+from time import ticks_ms, ticks_diff, sleep_ms
+
+pixels = ModulinoPixels()
+animator = PixelAnimator(pixels, fps=50, brightness=30)
+
+red = ModulinoPixels.pack_rgb(255, 0, 0)
+blue = ModulinoPixels.pack_rgb(0, 0, 255)
+green = ModulinoPixels.pack_rgb(0, 255, 0)
+gradient = [ModulinoPixels.pack_rgb(255 - i * 36, 0, i * 36) for i in range(8)]
+
+effects = [
+    ("🌅 Fade", FadeEffect(0, ModulinoPixels.pack_rgb(255, 128, 0), duration_ms=2000)),
+    ("🏃 Chase", ChaseEffect(green, period_ms=800, tail=3)),
+    ("🌈 Rainbow", RainbowEffect(period_ms=2000)),
+    ("😮‍💨 Breathe", BreatheEffect(blue, period_ms=2500, minimum=5)),
+    ("🎨 Blend", BlendEffect([red] * 4 + [blue] * 4, gradient, duration_ms=1500)),
+]
+
+while True:
+    for name, effect in effects:
+        print(name)
+        animator.play(effect)
+        start = ticks_ms()
+        while ticks_diff(ticks_ms(), start) < 5000:
+            animator.tick()
+            sleep_ms(5)
@@ -5,17 +5,71 @@ __maintainer__ = "Arduino"
 
 # Import core classes and/or functions to expose them at the package level
 from .helpers import map_value, map_value_int, constrain
-from .modulino import Modulino
-from .device_manager import DeviceManager
-from .pixels import ModulinoPixels, ModulinoColor
-from .thermo import ModulinoThermo
-from .buzzer import ModulinoBuzzer
-from .buttons import ModulinoButtons
-from .knob import ModulinoKnob
-from .movement import ModulinoMovement
-from .distance import ModulinoDistance
-from .joystick import ModulinoJoystick
-from .latch_relay import ModulinoLatchRelay
-from .vibro import ModulinoVibro, PowerLevel
-from .led_matrix import ModulinoLEDMatrix, MPJAnimation, FPSAnimation, Animation
-from .light import ModulinoLight
+from .modulino import Modulino, RetryPolicy
+from .bus_arbiter import BusArbiter
+
+# The device drivers are only imported when they are accessed for the first time.
+# This way an application only pays (RAM, startup time) for the Modulinos it uses
+# and the third party sensor drivers don't need to be installed if they aren't used.
+# Maps the exposed names to the submodule that implements them.
+_LAZY_ATTRIBUTES = {
+    "DeviceManager": "device_manager",
+    "ModulinoPixels": "pixels",
+    "ModulinoColor": "pixels",
+    "ModulinoThermo": "thermo",
+    "ModulinoBuzzer": "buzzer",
+    "ModulinoButtons": "buttons",
+    "ModulinoKnob": "knob",
+    "ModulinoMovement": "movement",
+    "ModulinoDistance": "distance",
+    "ModulinoJoystick": "joystick",
+    "ModulinoLatchRelay": "latch_relay",
+    "ModulinoVibro": "vibro",
+    "PowerLevel": "vibro",
+    "ModulinoLEDMatrix": "led_matrix",
+    "MPJAnimation": "led_matrix",
+    "MLAAnimation": "led_matrix",
+    "FPSAnimation": "led_matrix",
+    "DeltaAnimation": "led_matrix",
+    "Animation": "led_matrix",
+    "LEDMatrixCanvas": "led_matrix_canvas",
+    "ModulinoLight": "light",
+    "InputHub": "input_hub",
+    "CommandQueue": "command_queue",
+    "HealthMonitor": "health",
+    "HotplugWatcher": "hotplug",
+    "GestureRecognizer": "gestures",
+    "PixelAnimator": "pixel_effects",
+    "PixelEffect": "pixel_effects",
+    "FadeEffect": "pixel_effects",
+    "GradientEffect": "pixel_effects",
+    "RainbowEffect": "pixel_effects",
+    "ChaseEffect": "pixel_effects",
+    "BreatheEffect": "pixel_effects",
+    "BlendEffect": "pixel_effects",
+}
+
+# `from modulino import *` exports the same names as the eager imports used to, importing all drivers.
+# Ports that don't support __all__ only export the names that have been imported or accessed so far.
+__all__ = ["map_value", "map_value_int", "constrain", "Modulino", "RetryPolicy", "BusArbiter"] + list(_LAZY_ATTRIBUTES)
+
+def _import_submodule(module_name: str):
+    """
+    Imports a submodule of this package and returns it.
+
+    Parameters:
+        module_name (str): The name of the submodule, e.g. 'pixels'.
+    """
+    from sys import modules
+    full_name = "modulino." + module_name
+    if full_name not in modules:
+        __import__(full_name)
+    return modules[full_name]
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError("module 'modulino' has no attribute '" + name + "'")
+    value = getattr(_import_submodule(module_name), name)
+    globals()[name] = value # Cache it so that the next access doesn't go through __getattr__
+    return value
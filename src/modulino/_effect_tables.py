@@ -0,0 +1,75 @@
+# This file is generated by tools/generate_gamma.py. Do not edit it manually.
+
+# Lookup tables of the pixel effects, so that rendering a frame needs integer math only.
+
+# The red, green and blue byte of the fully saturated color of each of the 256 hues.
+HUE_TABLE = (
+    b'\xff\x00\x00\xff\x06\x00\xff\x0c\x00\xff\x12\x00\xff\x18\x00\xff'
+    b'\x1e\x00\xff\x24\x00\xff\x2a\x00\xff\x30\x00\xff\x36\x00\xff\x3c'
+    b'\x00\xff\x42\x00\xff\x48\x00\xff\x4e\x00\xff\x54\x00\xff\x5a\x00'
+    b'\xff\x60\x00\xff\x66\x00\xff\x6c\x00\xff\x72\x00\xff\x78\x00\xff'
+    b'\x7e\x00\xff\x84\x00\xff\x8a\x00\xff\x90\x00\xff\x96\x00\xff\x9c'
+    b'\x00\xff\xa2\x00\xff\xa8\x00\xff\xae\x00\xff\xb4\x00\xff\xba\x00'
+    b'\xff\xc0\x00\xff\xc6\x00\xff\xcc\x00\xff\xd2\x00\xff\xd8\x00\xff'
+    b'\xde\x00\xff\xe4\x00\xff\xea\x00\xff\xf0\x00\xff\xf6\x00\xff\xfc'
+    b'\x00\xfd\xff\x00\xf7\xff\x00\xf1\xff\x00\xeb\xff\x00\xe5\xff\x00'
+    b'\xdf\xff\x00\xd9\xff\x00\xd3\xff\x00\xcd\xff\x00\xc7\xff\x00\xc1'
+    b'\xff\x00\xbb\xff\x00\xb5\xff\x00\xaf\xff\x00\xa9\xff\x00\xa3\xff'
+    b'\x00\x9d\xff\x00\x97\xff\x00\x91\xff\x00\x8b\xff\x00\x85\xff\x00'
+    b'\x7f\xff\x00\x79\xff\x00\x73\xff\x00\x6d\xff\x00\x67\xff\x00\x61'
+    b'\xff\x00\x5b\xff\x00\x55\xff\x00\x4f\xff\x00\x49\xff\x00\x43\xff'
+    b'\x00\x3d\xff\x00\x37\xff\x00\x31\xff\x00\x2b\xff\x00\x25\xff\x00'
+    b'\x1f\xff\x00\x19\xff\x00\x13\xff\x00\x0d\xff\x00\x07\xff\x00\x01'
+    b'\xff\x00\x00\xff\x04\x00\xff\x0a\x00\xff\x10\x00\xff\x16\x00\xff'
+    b'\x1c\x00\xff\x22\x00\xff\x28\x00\xff\x2e\x00\xff\x34\x00\xff\x3a'
+    b'\x00\xff\x40\x00\xff\x46\x00\xff\x4c\x00\xff\x52\x00\xff\x58\x00'
+    b'\xff\x5e\x00\xff\x64\x00\xff\x6a\x00\xff\x70\x00\xff\x76\x00\xff'
+    b'\x7c\x00\xff\x82\x00\xff\x88\x00\xff\x8e\x00\xff\x94\x00\xff\x9a'
+    b'\x00\xff\xa0\x00\xff\xa6\x00\xff\xac\x00\xff\xb2\x00\xff\xb8\x00'
+    b'\xff\xbe\x00\xff\xc4\x00\xff\xca\x00\xff\xd0\x00\xff\xd6\x00\xff'
+    b'\xdc\x00\xff\xe2\x00\xff\xe8\x00\xff\xee\x00\xff\xf4\x00\xff\xfa'
+    b'\x00\xff\xff\x00\xf9\xff\x00\xf3\xff\x00\xed\xff\x00\xe7\xff\x00'
+    b'\xe1\xff\x00\xdb\xff\x00\xd5\xff\x00\xcf\xff\x00\xc9\xff\x00\xc3'
+    b'\xff\x00\xbd\xff\x00\xb7\xff\x00\xb1\xff\x00\xab\xff\x00\xa5\xff'
+    b'\x00\x9f\xff\x00\x99\xff\x00\x93\xff\x00\x8d\xff\x00\x87\xff\x00'
+    b'\x81\xff\x00\x7b\xff\x00\x75\xff\x00\x6f\xff\x00\x69\xff\x00\x63'
+    b'\xff\x00\x5d\xff\x00\x57\xff\x00\x51\xff\x00\x4b\xff\x00\x45\xff'
+    b'\x00\x3f\xff\x00\x39\xff\x00\x33\xff\x00\x2d\xff\x00\x27\xff\x00'
+    b'\x21\xff\x00\x1b\xff\x00\x15\xff\x00\x0f\xff\x00\x09\xff\x00\x03'
+    b'\xff\x02\x00\xff\x08\x00\xff\x0e\x00\xff\x14\x00\xff\x1a\x00\xff'
+    b'\x20\x00\xff\x26\x00\xff\x2c\x00\xff\x32\x00\xff\x38\x00\xff\x3e'
+    b'\x00\xff\x44\x00\xff\x4a\x00\xff\x50\x00\xff\x56\x00\xff\x5c\x00'
+    b'\xff\x62\x00\xff\x68\x00\xff\x6e\x00\xff\x74\x00\xff\x7a\x00\xff'
+    b'\x80\x00\xff\x86\x00\xff\x8c\x00\xff\x92\x00\xff\x98\x00\xff\x9e'
+    b'\x00\xff\xa4\x00\xff\xaa\x00\xff\xb0\x00\xff\xb6\x00\xff\xbc\x00'
+    b'\xff\xc2\x00\xff\xc8\x00\xff\xce\x00\xff\xd4\x00\xff\xda\x00\xff'
+    b'\xe0\x00\xff\xe6\x00\xff\xec\x00\xff\xf2\x00\xff\xf8\x00\xff\xfe'
+    b'\x00\xff\xff\x00\xfb\xff\x00\xf5\xff\x00\xef\xff\x00\xe9\xff\x00'
+    b'\xe3\xff\x00\xdd\xff\x00\xd7\xff\x00\xd1\xff\x00\xcb\xff\x00\xc5'
+    b'\xff\x00\xbf\xff\x00\xb9\xff\x00\xb3\xff\x00\xad\xff\x00\xa7\xff'
+    b'\x00\xa1\xff\x00\x9b\xff\x00\x95\xff\x00\x8f\xff\x00\x89\xff\x00'
+    b'\x83\xff\x00\x7d\xff\x00\x77\xff\x00\x71\xff\x00\x6b\xff\x00\x65'
+    b'\xff\x00\x5f\xff\x00\x59\xff\x00\x53\xff\x00\x4d\xff\x00\x47\xff'
+    b'\x00\x41\xff\x00\x3b\xff\x00\x35\xff\x00\x2f\xff\x00\x29\xff\x00'
+    b'\x23\xff\x00\x1d\xff\x00\x17\xff\x00\x11\xff\x00\x0b\xff\x00\x05'
+)
+
+# One period of a raised cosine (0 -> 255 -> 0) in 256 steps, used for breathing.
+WAVE_TABLE = (
+    b'\x00\x00\x00\x00\x01\x01\x01\x02\x02\x03\x04\x05\x05\x06\x07\x09'
+    b'\x0a\x0b\x0c\x0e\x0f\x11\x12\x14\x15\x17\x19\x1b\x1d\x1f\x21\x23'
+    b'\x25\x28\x2a\x2c\x2f\x31\x34\x36\x39\x3b\x3e\x41\x43\x46\x49\x4c'
+    b'\x4f\x52\x55\x58\x5a\x5d\x61\x64\x67\x6a\x6d\x70\x73\x76\x79\x7c'
+    b'\x7f\x83\x86\x89\x8c\x8f\x92\x95\x98\x9b\x9e\xa2\xa5\xa7\xaa\xad'
+    b'\xb0\xb3\xb6\xb9\xbc\xbe\xc1\xc4\xc6\xc9\xcb\xce\xd0\xd3\xd5\xd7'
+    b'\xda\xdc\xde\xe0\xe2\xe4\xe6\xe8\xea\xeb\xed\xee\xf0\xf1\xf3\xf4'
+    b'\xf5\xf6\xf8\xf9\xfa\xfa\xfb\xfc\xfd\xfd\xfe\xfe\xfe\xff\xff\xff'
+    b'\xff\xff\xff\xff\xfe\xfe\xfe\xfd\xfd\xfc\xfb\xfa\xfa\xf9\xf8\xf6'
+    b'\xf5\xf4\xf3\xf1\xf0\xee\xed\xeb\xea\xe8\xe6\xe4\xe2\xe0\xde\xdc'
+    b'\xda\xd7\xd5\xd3\xd0\xce\xcb\xc9\xc6\xc4\xc1\xbe\xbc\xb9\xb6\xb3'
+    b'\xb0\xad\xaa\xa7\xa5\xa2\x9e\x9b\x98\x95\x92\x8f\x8c\x89\x86\x83'
+    b'\x80\x7c\x79\x76\x73\x70\x6d\x6a\x67\x64\x61\x5d\x5a\x58\x55\x52'
+    b'\x4f\x4c\x49\x46\x43\x41\x3e\x3b\x39\x36\x34\x31\x2f\x2c\x2a\x28'
+    b'\x25\x23\x21\x1f\x1d\x1b\x19\x17\x15\x14\x12\x11\x0f\x0e\x0c\x0b'
+    b'\x0a\x09\x07\x06\x05\x05\x04\x03\x02\x02\x01\x01\x01\x00\x00\x00'
+)
@@ -0,0 +1,37 @@
+# This file is generated by tools/generate_registry.py. Do not edit it manually.
+
+# Maps the default addresses of the discoverable Modulinos to (module, class name).
+# Modulinos with an MCU are listed with their pinstrap address.
+ADDRESS_TO_CLASS = {
+  0x04: ("latch_relay", "ModulinoLatchRelay"),
+  0x29: ("distance", "ModulinoDistance"),
+  0x3C: ("buzzer", "ModulinoBuzzer"),
+  0x53: ("light", "ModulinoLight"),
+  0x58: ("joystick", "ModulinoJoystick"),
+  0x6A: ("movement", "ModulinoMovement"),
+  0x6B: ("movement", "ModulinoMovement"),
+  0x6C: ("pixels", "ModulinoPixels"),
+  0x70: ("vibro", "ModulinoVibro"),
+  0x72: ("led_matrix", "ModulinoLEDMatrix"),
+  0x74: ("knob", "ModulinoKnob"),
+  0x76: ("knob", "ModulinoKnob"),
+  0x7C: ("buttons", "ModulinoButtons"),
+}
+
+# 7-bit addresses of all Modulinos at their default address.
+KNOWN_ADDRESSES = (
+  0x02, # ModulinoLatchRelay
+  0x1E, # ModulinoBuzzer
+  0x29, # ModulinoDistance
+  0x2C, # ModulinoJoystick
+  0x36, # ModulinoPixels
+  0x38, # ModulinoVibro
+  0x39, # ModulinoLEDMatrix
+  0x3A, # ModulinoKnob
+  0x3B, # ModulinoKnob
+  0x3E, # ModulinoButtons
+  0x44, # ModulinoThermo
+  0x53, # ModulinoLight
+  0x6A, # ModulinoMovement
+  0x6B, # ModulinoMovement
+)
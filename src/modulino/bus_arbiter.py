@@ -0,0 +1,178 @@
+from time import ticks_us, ticks_diff, sleep_us
+
+try:
+    import _thread
+except ImportError:
+    _thread = None # Ports without threads only need to arbitrate between asyncio tasks
+
+class BusArbiter:
+    """
+    Serializes the access to an I2C bus so that a logical transaction (e.g. writing a register
+    address and reading the register) can't be interleaved by another thread or asyncio task.
+    There is one arbiter per bus, see BusArbiter.for_bus().
+
+    Threads (e.g. a second core on the RP2040 or ESP32) use it as a context manager:
+
+        with BusArbiter.for_bus(bus):
+            bus.writeto(address, register, False)
+            bus.readfrom_into(address, buffer)
+
+    Asyncio tasks that need to keep the bus across awaits use it as an asynchronous context manager.
+    The tasks get the bus in the order they asked for it.
+
+        async with BusArbiter.for_bus(bus):
+            await modulino.awrite(command)
+            await asyncio.sleep_ms(5)
+            await modulino.aread(response)
+
+    The arbiter is reentrant, so the drivers can use it inside a transaction that spans multiple calls.
+    Tasks on the same thread as a task that holds the bus across awaits can only be held off
+    by the asynchronous API (e.g. aread() instead of read()), because a blocking wait would stall the event loop.
+    """
+
+    _arbiters: dict = {} # id(bus) -> arbiter
+
+    def __init__(self, bus):
+        """
+        Initializes the arbiter. Use BusArbiter.for_bus() to get the shared arbiter of a bus.
+
+        Parameters:
+            bus (I2C): The bus to arbitrate.
+        """
+        self.bus = bus
+        self._lock = _thread.allocate_lock() if _thread else None
+        self._owner = None # Identifier of the thread that holds the bus
+        self._depth = 0
+        self._waiting = 0 # Threads that are blocked in acquire()
+        self._async_lock = None # Created on first use so that asyncio is only imported when needed
+        self._async_owner = None
+        self._async_depth = 0
+        self.command_queue = None # The CommandQueue of the bus, see CommandQueue.for_bus()
+        self.health_monitor = None # The HealthMonitor of the bus, see HealthMonitor.for_bus()
+        self.replacement = None # The new bus object after the bus has been recovered
+        self.reset_stats()
+
+    @staticmethod
+    def for_bus(bus) -> "BusArbiter":
+        """
+        Returns the arbiter of the given bus. It's created on first use.
+
+        Parameters:
+            bus (I2C): The bus to arbitrate.
+        """
+        arbiter = BusArbiter._arbiters.get(id(bus))
+        if arbiter is None or arbiter.bus is not bus:
+            arbiter = BusArbiter(bus)
+            BusArbiter._arbiters[id(bus)] = arbiter
+        return arbiter
+
+    def acquire(self) -> None:
+        """
+        Waits until the bus is available and reserves it for the calling thread.
+        """
+        lock = self._lock
+        ident = _thread.get_ident() if lock else 0
+        if self._depth > 0 and self._owner == ident:
+            self._depth += 1
+            return
+
+        if lock and not lock.acquire(0):
+            self._contentions += 1
+            self._waiting += 1
+            start = ticks_us()
+            lock.acquire()
+            wait_us = ticks_diff(ticks_us(), start)
+            self._waiting -= 1
+            self._wait_us += wait_us
+            if wait_us > self._max_wait_us:
+                self._max_wait_us = wait_us
+
+        self._owner = ident
+        self._depth = 1
+        self._acquisitions += 1
+
+    def release(self) -> None:
+        """
+        Releases the bus after a call of acquire().
+        """
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        self._owner = None
+        if self._lock:
+            self._lock.release()
+            if self._waiting:
+                # Give the waiting thread the chance to take over before this thread reserves the bus again
+                sleep_us(1)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+    async def __aenter__(self):
+        import asyncio
+        task = asyncio.current_task()
+        if self._async_depth > 0 and self._async_owner is task:
+            self._async_depth += 1
+            return self
+
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        if self._async_lock.locked():
+            self._contentions += 1
+        await self._async_lock.acquire()
+
+        # Another thread may hold the bus. Wait for it without blocking the event loop.
+        lock = self._lock
+        if lock and not lock.acquire(0):
+            self._contentions += 1
+            start = ticks_us()
+            while not lock.acquire(0):
+                await asyncio.sleep_ms(0)
+            wait_us = ticks_diff(ticks_us(), start)
+            self._wait_us += wait_us
+            if wait_us > self._max_wait_us:
+                self._max_wait_us = wait_us
+
+        # Calls of the synchronous API from the holding task are nested transactions
+        self._owner = _thread.get_ident() if lock else 0
+        self._depth = 1
+        self._acquisitions += 1
+        self._async_owner = task
+        self._async_depth = 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._async_depth -= 1
+        if self._async_depth > 0:
+            return False
+        self._async_owner = None
+        self.release()
+        self._async_lock.release()
+        return False
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the contention statistics of the bus: the amount of reservations,
+        how many of them had to wait for another thread or task and the total and longest wait in microseconds.
+        """
+        return {
+            "acquisitions": self._acquisitions,
+            "contentions": self._contentions,
+            "wait_us": self._wait_us,
+            "max_wait_us": self._max_wait_us,
+        }
+
+    def reset_stats(self) -> None:
+        """
+        Resets the contention statistics.
+        """
+        self._acquisitions = 0
+        self._contentions = 0
+        self._wait_us = 0
+        self._max_wait_us = 0
@@ -1,5 +1,5 @@
 from .modulino import Modulino
-from time import ticks_ms
+from time import ticks_ms, ticks_diff
 from micropython import const
 
 class ModulinoButtonsLED():
@@ -40,7 +40,7 @@ class ModulinoButtons(Modulino):
   default_addresses = [0x7C]
   default_long_press_duration = const(1000)
 
-  def __init__(self, i2c_bus = None, address = None, check_connection: bool = True):
+  def __init__(self, i2c_bus = None, address = None, check_connection: bool = True, defer_init: bool = False):
     """
     Initializes the Modulino Buttons.
 
@@ -48,30 +48,31 @@ class ModulinoButtons(Modulino):
         i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
         address (int): The I2C address of the module. If not provided, the default address will be used.
         check_connection (bool): Whether to check the connection to the module.
+        defer_init (bool): Accepted for compatibility with the other Modulinos. The constructor doesn't communicate with the module.
     """
 
     super().__init__(i2c_bus, address, "Buttons", check_connection=check_connection)
     self._read_buffer = bytearray(4) # 3 bytes for buttons status + 1 byte for pinstrap address
     self.long_press_duration = self.default_long_press_duration
 
-    self._current_buttons_status = [None, None, None]
-    self._last_press_timestamps = [None, None, None]
+    # The button states are packed into a bitmask (bit 0 = A, bit 1 = B, bit 2 = C)
+    # so that the edges can be computed with a single XOR. Nothing is allocated while polling.
+    self._buttons_status = 0
+    self._status_read = False
+    self._long_press_pending = 0 # Buttons that are pressed and haven't reached the long press duration yet
+    self._last_press_timestamps = [0, 0, 0]
 
-    # Button callbacks
-    self._on_button_a_press = None
-    self._on_button_a_release = None
-    self._on_button_b_press = None
-    self._on_button_b_release = None
-    self._on_button_c_press = None
-    self._on_button_c_release = None
-    self._on_button_a_long_press = None
-    self._on_button_b_long_press = None
-    self._on_button_c_long_press = None
+    # Button callbacks, indexed by button
+    self._press_callbacks = [None, None, None]
+    self._release_callbacks = [None, None, None]
+    self._long_press_callbacks = [None, None, None]
 
     # LEDs
     self._led_a = ModulinoButtonsLED(self)
     self._led_b = ModulinoButtonsLED(self)
     self._led_c = ModulinoButtonsLED(self)
+    self._led_buffer = bytearray(3)
+    self._gestures = None
   
   @property
   def send_buffer_size(self) -> int:
@@ -96,10 +97,10 @@ class ModulinoButtons(Modulino):
     """
     Update the physical status of the button LEDs by writing the current values to the module.
     """
-    data = bytearray(3)
-    data[0] = self._led_a.value
-    data[1] = self._led_b.value
-    data[2] = self._led_c.value
+    data = self._led_buffer
+    data[0] = self._led_a._value
+    data[1] = self._led_b._value
+    data[2] = self._led_c._value
     self.write(data)
 
   def set_led_status(self, a: bool, b: bool, c: bool) -> None:
@@ -116,6 +117,17 @@ class ModulinoButtons(Modulino):
     self._led_c._value = 1 if c else 0
     self._update_leds()
 
+  @property
+  def gestures(self):
+    """
+    The GestureRecognizer of the buttons (A = 0, B = 1, C = 2), e.g. to detect double clicks,
+    auto-repeat or chords such as A+C. It's created on first access and fed by update().
+    """
+    if self._gestures is None:
+      from .gestures import GestureRecognizer
+      self._gestures = GestureRecognizer(3)
+    return self._gestures
+
   @property
   def long_press_duration(self) -> int:
     """    
@@ -137,126 +149,126 @@ class ModulinoButtons(Modulino):
     """
     Returns the callback for the press event of button A.    
     """
-    return self._on_button_a_press
+    return self._press_callbacks[0]
   
   @on_button_a_press.setter
   def on_button_a_press(self, value) -> None:
     """
     Sets the callback for the press event of button A.
     """
-    self._on_button_a_press = value
+    self._press_callbacks[0] = value
 
   @property
   def on_button_a_release(self):
     """
     Returns the callback for the release event of button A.
     """
-    return self._on_button_a_release
+    return self._release_callbacks[0]
   
   @on_button_a_release.setter
   def on_button_a_release(self, value) -> None:
     """
     Sets the callback for the release event of button A.
     """
-    self._on_button_a_release = value
+    self._release_callbacks[0] = value
 
   @property
   def on_button_a_long_press(self):
     """
     Returns the callback for the long press event of button A.
     """
-    return self._on_button_a_long_press
+    return self._long_press_callbacks[0]
   
   @on_button_a_long_press.setter
   def on_button_a_long_press(self, value) -> None:
     """
     Sets the callback for the long press event of button A.
     """
-    self._on_button_a_long_press = value
+    self._long_press_callbacks[0] = value
 
   @property
   def on_button_b_press(self):
     """
     Returns the callback for the press event of button B.
     """
-    return self._on_button_b_press
+    return self._press_callbacks[1]
   
   @on_button_b_press.setter
   def on_button_b_press(self, value) -> None:
     """
     Sets the callback for the press event of button B.
     """
-    self._on_button_b_press = value
+    self._press_callbacks[1] = value
 
   @property
   def on_button_b_release(self):
     """
     Returns the callback for the release event of button B.
     """
-    return self._on_button_b_release
+    return self._release_callbacks[1]
   
   @on_button_b_release.setter
   def on_button_b_release(self, value) -> None:
     """
     Sets the callback for the release event of button B.
     """
-    self._on_button_b_release = value
+    self._release_callbacks[1] = value
 
   @property
   def on_button_b_long_press(self):
     """
     Returns the callback for the long press event of button B.
     """
-    return self._on_button_b_long_press
+    return self._long_press_callbacks[1]
   
   @on_button_b_long_press.setter
   def on_button_b_long_press(self, value) -> None:
     """
     Sets the callback for the long press event of button B.
     """
-    self._on_button_b_long_press = value
+    self._long_press_callbacks[1] = value
 
   @property
   def on_button_c_press(self):
     """
     Returns the callback for the press event of button C.
     """
-    return self._on_button_c_press
+    return self._press_callbacks[2]
   
   @on_button_c_press.setter
   def on_button_c_press(self, value) -> None:
     """
     Sets the callback for the press event of button C.
     """
-    self._on_button_c_press = value
+    self._press_callbacks[2] = value
 
   @property
   def on_button_c_release(self):
     """
     Returns the callback for the release event of button C.
     """
-    return self._on_button_c_release
+    return self._release_callbacks[2]
   
   @on_button_c_release.setter
   def on_button_c_release(self, value) -> None:
     """
     Sets the callback for the release event of button C.
     """
-    self._on_button_c_release = value
+    self._release_callbacks[2] = value
 
   @property
   def on_button_c_long_press(self):
     """
     Returns the callback for the long press event of button C.
     """
-    return self._on_button_c_long_press
+    return self._long_press_callbacks[2]
   
   @on_button_c_long_press.setter
   def on_button_c_long_press(self, value) -> None:
     """
     Sets the callback for the long press event of button C.
     """
-    self._on_button_c_long_press = value
+    self._long_press_callbacks[2] = value
 
   def update(self) -> bool:
     """
@@ -267,55 +279,79 @@ class ModulinoButtons(Modulino):
       bool: True if any of the buttons has changed its state.
     """
     self.read(self._read_buffer)
-    new_status = self._read_buffer[1:] # Skip pinstrap address
-    button_states_changed = new_status != self._current_buttons_status
-    previous_status = self._current_buttons_status
-    current_timestamp = ticks_ms()
+    return self._process_status()
+
+  async def aupdate(self) -> bool:
+    """
+    Coroutine version of update().
+
+    Returns:
+      bool: True if any of the buttons has changed its state.
+    """
+    await self.aread(self._read_buffer)
+    return self._process_status()
+
+  def _process_status(self) -> bool:
+    """
+    Evaluates the button status in the read buffer and calls the corresponding callbacks.
+
+    Returns:
+      bool: True if any of the buttons has changed its state.
+    """
+    data = self._read_buffer # The first byte is the pinstrap address
+    new_status = (1 if data[1] else 0) | (2 if data[2] else 0) | (4 if data[3] else 0)
+    previous_status = self._buttons_status
     
     # Update status already in case it's accessed in one of the button callbacks
-    self._current_buttons_status = new_status    
+    self._buttons_status = new_status
+
+    if not self._status_read:
+      # There are no edges without a previous status
+      self._status_read = True
+      if self._gestures is not None:
+        self._gestures.feed(new_status)
+      return True
+
+    changed = new_status ^ previous_status
+    pending = self._long_press_pending & new_status
+    if not changed and not pending:
+      if self._gestures is not None:
+        self._gestures.feed(new_status)
+      return False
+
+    current_timestamp = ticks_ms()
+    timestamps = self._last_press_timestamps
 
     # Check for long press
-    if(new_status[0] == 1 and previous_status[0] == 1 and self._last_press_timestamps[0] and current_timestamp - self._last_press_timestamps[0] > self.long_press_duration):
-      self._last_press_timestamps[0] = None
-      if self._on_button_a_long_press:
-        self._on_button_a_long_press()
-
-    if(new_status[1] == 1 and previous_status[1] == 1 and self._last_press_timestamps[1] and current_timestamp - self._last_press_timestamps[1] > self.long_press_duration):
-      self._last_press_timestamps[1] = None
-      if self._on_button_b_long_press:
-        self._on_button_b_long_press()
-
-    if(new_status[2] == 1 and previous_status[2] == 1 and self._last_press_timestamps[2] and current_timestamp - self._last_press_timestamps[2] > self.long_press_duration):
-      self._last_press_timestamps[2] = None
-      if self._on_button_c_long_press:
-        self._on_button_c_long_press()
-      
+    if pending:
+      for i in range(3):
+        bit = 1 << i
+        if pending & bit and ticks_diff(current_timestamp, timestamps[i]) > self._long_press_duration:
+          pending &= ~bit
+          callback = self._long_press_callbacks[i]
+          if callback:
+            callback()
+
     # Check for press and release
-    if(button_states_changed):
-
-      if(new_status[0] == 1 and previous_status[0] == 0):
-        self._last_press_timestamps[0] = ticks_ms()
-        if(self._on_button_a_press):
-          self._on_button_a_press()
-      elif(new_status[0] == 0 and previous_status[0] == 1 and self._on_button_a_release):
-        self._on_button_a_release()
-      
-      if(new_status[1] == 1 and previous_status[1] == 0):
-        self._last_press_timestamps[1] = ticks_ms()        
-        if(self._on_button_b_press):
-          self._on_button_b_press()
-      elif(new_status[1] == 0 and previous_status[1] == 1 and self._on_button_b_release):
-        self._on_button_b_release()
-      
-      if(new_status[2] == 1 and previous_status[2] == 0):
-        self._last_press_timestamps[2] = ticks_ms()
-        if(self._on_button_c_press):
-          self._on_button_c_press()
-      elif(new_status[2] == 0 and previous_status[2] == 1 and self._on_button_c_release):
-        self._on_button_c_release()
-
-    return button_states_changed
+    if changed:
+      for i in range(3):
+        bit = 1 << i
+        if not changed & bit:
+          continue
+        if new_status & bit:
+          timestamps[i] = current_timestamp
+          pending |= bit
+          callback = self._press_callbacks[i]
+        else:
+          pending &= ~bit
+          callback = self._release_callbacks[i]
+        if callback:
+          callback()
+
+    self._long_press_pending = pending
+    if self._gestures is not None:
+      self._gestures.feed(new_status, current_timestamp)
+    return changed != 0
 
   def is_pressed(self, index: int) -> bool:
     """
@@ -324,7 +360,9 @@ class ModulinoButtons(Modulino):
     Parameters:
         index (int): The index of the button. A = 0, B = 1, C = 2.
     """
-    return self._current_buttons_status[index]
+    if not self._status_read:
+      return None
+    return (self._buttons_status >> index) & 1 == 1
   
   @property
   def button_a_pressed(self) -> bool:
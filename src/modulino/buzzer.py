@@ -82,7 +82,7 @@ class ModulinoBuzzer(Modulino):
 
   default_addresses = [0x3C]
 
-  def __init__(self, i2c_bus=None, address=None, check_connection: bool = True):
+  def __init__(self, i2c_bus=None, address=None, check_connection: bool = True, defer_init: bool = False):
     """
     Initializes the Modulino Buzzer.
 
@@ -90,15 +90,29 @@ class ModulinoBuzzer(Modulino):
         i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
         address (int): The I2C address of the module. If not provided, the default address will be used.
         check_connection (bool): Whether to check the connection to the module.
+        defer_init (bool): Whether to skip silencing the buzzer on initialization.
+                           The buzzer keeps its current state until the first tone is played or stopped.
     """
     super().__init__(i2c_bus, address, "Buzzer", check_connection=check_connection)
     self.data = bytearray(8)
-    self.no_tone()
+    if not defer_init:
+      self.no_tone()
 
   @property
   def send_buffer_size(self) -> int:
     return 8
 
+  def _encode_tone(self, frequency: int, lenght_ms: int) -> None:
+    """
+    Validates the tone and encodes it into the send buffer.
+    Shared by tone() and atone(), which only differ in how they wait.
+    """
+    if frequency < 180 and frequency != 0:
+      raise ValueError("Frequency must be greater than 180 Hz")
+
+    self.data[0:4] = frequency.to_bytes(4, 'little')
+    self.data[4:8] = lenght_ms.to_bytes(4, 'little')
+
   def tone(self, frequency: int, lenght_ms: int = 0xFFFF, blocking: bool = False) -> None:
     """
     Plays a tone with the given frequency and duration.
@@ -109,11 +123,7 @@ class ModulinoBuzzer(Modulino):
         lenght_ms: The duration of the tone in milliseconds. If omitted, the tone will play indefinitely
         blocking: If set to True, the function will wait until the tone is finished
     """
-    if frequency < 180 and frequency != 0:
-      raise ValueError("Frequency must be greater than 180 Hz")
-    
-    self.data[0:4] = frequency.to_bytes(4, 'little')
-    self.data[4:8] = lenght_ms.to_bytes(4, 'little')
+    self._encode_tone(frequency, lenght_ms)
     self.write(self.data)
     
     if blocking:
@@ -121,6 +131,24 @@ class ModulinoBuzzer(Modulino):
       # Those pauses are caused by the time it takes to send the data to the buzzer
       sleep_ms(lenght_ms - 5)
 
+  async def atone(self, frequency: int, lenght_ms: int = 0xFFFF, blocking: bool = False) -> None:
+    """
+    Coroutine version of tone().
+    If blocking is set to True, it waits for the tone to finish without blocking the event loop.
+
+    Parameters:
+        frequency: The frequency of the tone in Hz (freuqencies below 180 Hz are not supported)
+        lenght_ms: The duration of the tone in milliseconds. If omitted, the tone will play indefinitely
+        blocking: If set to True, the coroutine will return once the tone is finished
+    """
+    self._encode_tone(frequency, lenght_ms)
+    await self.awrite(self.data)
+
+    if blocking:
+      import asyncio
+      # Subtract 5ms to avoid unwanted pauses between tones
+      await asyncio.sleep_ms(lenght_ms - 5)
+
   def no_tone(self) -> None:
     """
     Stops the current tone from playing.
@@ -0,0 +1,247 @@
+from time import ticks_us, ticks_diff
+from .bus_arbiter import BusArbiter
+
+class CommandQueue:
+    """
+    Collects the writes of the Modulinos on a bus (e.g. LED matrix frames, pixel colors,
+    button LEDs, buzzer tones) and sends them back-to-back when flush() is called.
+    There is one queue per bus, see CommandQueue.for_bus() or Modulino.command_queue.
+
+    A write replaces the last queued write to the same device if both have the same length,
+    because every such write carries the complete state of the device.
+    Writes of different lengths (e.g. a display mode change followed by a frame) are kept in order,
+    and a write never overtakes an earlier write of a different length to the same device.
+    Reading from a device with queued writes flushes the queue first, so reads always see the written state.
+    Commands that bypass Modulino.write() (e.g. change_address()) aren't queued.
+    Failed writes are retried with the retry policy of the Modulino that queued them (see Modulino.retry_policy).
+
+    The buffers of the queue are reused across batches, so a control loop that writes
+    the same devices in every frame doesn't allocate memory.
+
+    Example:
+
+        queue = led_matrix.command_queue
+        queue.start()
+        while True:
+            led_matrix.set_frame(frame).show()
+            pixels.set_all_rgb(r, g, b).show()
+            queue.flush()
+            sleep_ms(16)
+    """
+
+    def __init__(self, bus):
+        """
+        Initializes the queue. Use CommandQueue.for_bus() to get the shared queue of a bus.
+
+        Parameters:
+            bus (I2C): The bus to send the writes to.
+        """
+        self.bus = bus
+        self._arbiter = BusArbiter.for_bus(bus)
+        self._entries = [] # [address, buffer, retry policy] entries. The first _count entries are queued.
+        self._count = 0
+        self._active = False
+        self.reset_stats()
+
+    @staticmethod
+    def for_bus(bus) -> "CommandQueue":
+        """
+        Returns the queue of the given bus. It's created on first use.
+
+        Parameters:
+            bus (I2C): The bus the queue sends the writes to.
+        """
+        arbiter = BusArbiter.for_bus(bus)
+        queue = arbiter.command_queue
+        if queue is None:
+            queue = CommandQueue(bus)
+            arbiter.command_queue = queue
+        return queue
+
+    def _move_to(self, bus) -> None:
+        """
+        Sends the queued writes to a new bus object from now on, e.g. after the bus has been recovered.
+
+        Parameters:
+            bus (I2C): The new bus object.
+        """
+        self.bus = bus
+        self._arbiter = BusArbiter.for_bus(bus)
+        self._arbiter.command_queue = self
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns True if writes are queued instead of being sent immediately.
+        """
+        return self._active
+
+    @property
+    def pending(self) -> int:
+        """
+        Returns the amount of writes that are waiting to be sent.
+        """
+        return self._count
+
+    def start(self) -> None:
+        """
+        Starts queuing the writes to the bus until stop() is called.
+        """
+        self._active = True
+
+    def stop(self) -> None:
+        """
+        Sends the queued writes and goes back to sending writes immediately.
+        """
+        self.flush()
+        self._active = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def enqueue(self, address: int, data, retry_policy=None) -> None:
+        """
+        Queues a write. If the last queued write to the same address has the same length, it's replaced.
+
+        Parameters:
+            address (int): The 7-bit address of the device.
+            data (bytes | bytearray): The data to write. It's copied, so the buffer can be reused right away.
+            retry_policy (RetryPolicy): The policy that handles a failure of this write. None raises the error right away.
+        """
+        entries = self._entries
+        count = self._count
+        length = len(data)
+
+        # Only the last write to the device can be replaced. Replacing an earlier one
+        # would move the new state in front of the writes that were queued after it.
+        for i in range(count - 1, -1, -1):
+            entry = entries[i]
+            if entry[0] == address:
+                if len(entry[1]) == length:
+                    entry[1][:] = data
+                    entry[2] = retry_policy
+                    self._deduplicated += 1
+                    return
+                break
+
+        # Reuse a buffer of an earlier batch if possible
+        for i in range(count, len(entries)):
+            entry = entries[i]
+            if entry[0] == address and len(entry[1]) == length:
+                entries[i] = entries[count]
+                entries[count] = entry
+                break
+        else:
+            entry = [address, bytearray(length), None]
+            entries.append(entry)
+            entries[-1] = entries[count]
+            entries[count] = entry
+        entry[1][:] = data
+        entry[2] = retry_policy
+        self._count = count + 1
+
+    def has_pending(self, address: int) -> bool:
+        """
+        Returns True if writes to the given address are waiting to be sent.
+
+        Parameters:
+            address (int): The 7-bit address of the device.
+        """
+        entries = self._entries
+        for i in range(self._count):
+            if entries[i][0] == address:
+                return True
+        return False
+
+    def flush(self) -> int:
+        """
+        Sends the queued writes in the order they were queued.
+        The bus is reserved for the whole batch so that no other thread or task can interleave.
+        A failed write is handled by the retry policy it was queued with, like a direct write:
+        it's repeated (after recovering the bus if needed) and the batch continues with it.
+        If the error isn't retried, the remaining writes of the batch are discarded and the error is raised.
+
+        Returns:
+            int: The amount of writes that have been sent.
+        """
+        count = self._count
+        if count == 0:
+            return 0
+
+        entries = self._entries
+        start = ticks_us()
+        sent = 0
+        attempt = 0
+        try:
+            while sent < count:
+                # The bus may have been replaced by a recovery in the meantime
+                arbiter = self._arbiter
+                writeto = self.bus.writeto
+                monitor = arbiter.health_monitor
+                if monitor is not None and not monitor._active:
+                    monitor = None
+                try:
+                    with arbiter:
+                        while sent < count:
+                            entry = entries[sent]
+                            if monitor is None:
+                                writeto(entry[0], entry[1])
+                            else:
+                                write_start = ticks_us()
+                                writeto(entry[0], entry[1])
+                                monitor.record(entry[0], len(entry[1]), ticks_diff(ticks_us(), write_start))
+                            sent += 1
+                            attempt = 0
+                except OSError as error:
+                    entry = entries[sent]
+                    if monitor is not None:
+                        monitor.record_error(entry[0], error)
+                    attempt += 1
+                    policy = entry[2]
+                    if policy is None or not policy._handle(self.bus, error, attempt):
+                        raise
+        finally:
+            self._count = 0
+            duration = ticks_diff(ticks_us(), start)
+            self._last_batch_us = duration
+            self._total_batch_us += duration
+            self._batches += 1
+            self._writes += sent
+        return sent
+
+    @property
+    def last_batch_us(self) -> int:
+        """
+        Returns the time in microseconds the last flush() occupied the bus.
+        """
+        return self._last_batch_us
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the queue: the amount of batches, the writes that have been sent,
+        the writes that have been replaced by a later write to the same device, and the total
+        and last time in microseconds the batches occupied the bus.
+        """
+        return {
+            "batches": self._batches,
+            "writes": self._writes,
+            "deduplicated": self._deduplicated,
+            "bus_time_us": self._total_batch_us,
+            "last_batch_us": self._last_batch_us,
+        }
+
+    def reset_stats(self) -> None:
+        """
+        Resets the statistics of the queue.
+        """
+        self._batches = 0
+        self._writes = 0
+        self._deduplicated = 0
+        self._total_batch_us = 0
+        self._last_batch_us = 0
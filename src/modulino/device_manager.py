@@ -1,117 +1,168 @@
-import sys
 from micropython import const
 from machine import I2C
-from .modulino import _I2CHelper
-from . import *
+from .modulino import Modulino, _I2CHelper, _ScanCache
+from .bus_arbiter import BusArbiter
+from . import _import_submodule
+from ._registry import ADDRESS_TO_CLASS
 
 _BOOTLOADER_ADDRESS = const(0x64)
 
 class DeviceManager:
 
-    # Modules to exclude from discovery
-    _excluded_modules = ["modulino.modulino", 
-                         "modulino.helpers", 
-                         "modulino.lib"]
+    # Device classes that have been resolved from the registry, shared by all instances.
+    # Maps the default or pinstrap address to the class.
+    _class_cache = {}
 
     def __init__(self, i2c_bus: I2C = None) -> None:
         if i2c_bus is None:
             i2c_bus = _I2CHelper.get_interface()
         self.i2c_bus = i2c_bus
-        self._address_to_class_map = {}        
-        self._init_address_to_class_map()
 
-    def _init_address_to_class_map(self):
+    def _read_pin_strap_address(self, address: int) -> int:
         """
-        Initializes the mapping of I2C addresses to Modulino device classes.
-        Note that Modulinos with an MCU (custom firmware) expose a different 7-bit address
-        derived from their pinstrap / default address. Consequently,
-        this map can only be used to lookup devices without an MCU.
-        """
-        modules = self._modulino_modules()
-
-        for module in modules:
-            classes = self._modulino_classes(module)
-            for cls in classes:
-                if hasattr(cls, 'default_addresses'):
-                    for address in cls.default_addresses:
-                        self._address_to_class_map[address] = cls
-
-    def _modulino_modules(self) -> list:
-        """
-        Returns a list of all loaded Modulino modules.
-
-        Returns:
-            list: A list of Modulino module objects.
-        """
-        modulino_modules = []
-        for module_name, module in sys.modules.items():
-            # Skip submodules
-            if module_name.count('.') > 1:
-                continue
-            if not module_name.startswith('modulino.'):
-                continue
-            if module_name in self._excluded_modules:
-                continue            
-            modulino_modules.append(module)
-        return modulino_modules
-
-    def _modulino_classes(self, module) -> list:
-        """
-        Returns a list of all classes in the given module that start with 'Modulino'.
+        Reads the pinstrap address of the Modulino with an MCU at the given I2C address.
         Parameters:
-            module (module): The module to inspect.
+            address (int): The I2C address of the device.
         Returns:
-            list: A list of class objects.
+            int: The pinstrap address reported by the device.
         """
-        classes = dir(module) if module else []
-        modulino_class_names = [cls for cls in classes if cls.startswith('Modulino') and cls != 'Modulino']
-        modulino_classes = []
-        
-        for cls_name in modulino_class_names:
-            cls = getattr(module, cls_name)
-            if issubclass(cls, Modulino):
-                modulino_classes.append(cls)
+        # The first byte of every read is the pinstrap address
+        with BusArbiter.for_bus(self.i2c_bus):
+            return self.i2c_bus.readfrom(address, 1, True)[0]
 
-        return modulino_classes
-
-    def _class_from_address(self, address: int):
+    def _class_from_address(self, address: int, pin_strap_address: int = None):
         """
         Returns the Modulino device class for the given I2C address.
         Parameters:
             address (int): The I2C address of the device.
+            pin_strap_address (int): The pinstrap address of the device if it has already been read.
         Returns:
             class: The Modulino device class.
         """
-        if address in self._address_to_class_map:
-            return self._address_to_class_map[address]
+        if address in ADDRESS_TO_CLASS:
+            return self._class_from_registry(address)
         
         # Get pinstrap address from device, because all modulinos with an MCU
         # expose a 7-bit address that is different from their pinstrap address.
         # Also, they may have changed their default address to a custom one.
-        dev = Modulino(i2c_bus=self.i2c_bus, address=address, check_connection=False)
-        pinstrap_address = dev.pin_strap_address
+        if pin_strap_address is None:
+            pin_strap_address = self._read_pin_strap_address(address)
         
-        if pinstrap_address in self._address_to_class_map:
-            return self._address_to_class_map[pinstrap_address]
+        if pin_strap_address in ADDRESS_TO_CLASS:
+            return self._class_from_registry(pin_strap_address)
         
         return None
 
-    def available_devices(self) -> list[Modulino]:
+    def _class_from_registry(self, address: int):
+        """
+        Returns the Modulino device class registered for the given address.
+        The module that implements it is imported on first use.
+        Parameters:
+            address (int): The default or pinstrap address of the device.
+        Returns:
+            class: The Modulino device class.
+        """
+        cls = DeviceManager._class_cache.get(address)
+        if cls is None:
+            module_name, class_name = ADDRESS_TO_CLASS[address]
+            cls = getattr(_import_submodule(module_name), class_name)
+            DeviceManager._class_cache[address] = cls
+        return cls
+
+    def available_devices(self, rescan: bool = True, defer_init: bool = False) -> list[Modulino]:
         """
         Finds all devices on the i2c bus and returns them as 
         a list of Modulino subclass objects.
+        The pinstrap address of every Modulino with an MCU is read once
+        and handed to the created object, so it doesn't need to be read again.
+
+        Parameters:
+            rescan (bool): Whether to probe the whole bus. If False, addresses that have already been probed
+                           during this session (e.g. by the auto discovery of other Modulinos) are not probed again,
+                           so Modulinos that have been connected or disconnected since then may be missed.
+            defer_init (bool): Whether to create the objects without communicating with the devices.
+                               Any initialization (e.g. stopping the buzzer or configuring sensors)
+                               is postponed until a device is used for the first time.
+                               This reduces the enumeration to one transaction per Modulino with an MCU.
 
         Returns:
         list: A list of Modulino subclass objects or empty list if no devices are found.
         """
-        device_addresses = Modulino.scan(self.i2c_bus)
+        if rescan:
+            Modulino.invalidate_scan_cache(self.i2c_bus)
+        device_addresses = Modulino.scan(self.i2c_bus, use_cache=True)
         devices = []
         for address in device_addresses:
-            if address == _BOOTLOADER_ADDRESS:
-                devices.append(Modulino(i2c_bus=self.i2c_bus, address=address, name="Unknown (Bootloader Mode)", check_connection=False))
-                continue
-            device_class = self._class_from_address(address)
-            if device_class is not None:
-                device = device_class(i2c_bus=self.i2c_bus, address=address, check_connection=False)
+            device = self._create_device(address, defer_init)
+            if device is not None:
                 devices.append(device)
         return devices
+
+    def _create_device(self, address: int, defer_init: bool = False, resolved: tuple = None) -> Modulino | None:
+        """
+        Creates the Modulino object for the device at the given address.
+        Parameters:
+            address (int): The I2C address of the device.
+            defer_init (bool): Whether to create the object without communicating with the device.
+            resolved (tuple): The result of _resolve_class() if the class has already been resolved.
+        Returns:
+            Modulino: The Modulino subclass object or None if the device is not a Modulino.
+        """
+        if address == _BOOTLOADER_ADDRESS:
+            return Modulino(i2c_bus=self.i2c_bus, address=address, name="Unknown (Bootloader Mode)", check_connection=False)
+        if resolved is None:
+            resolved = self._resolve_class(address)
+        device_class, pin_strap_address = resolved
+        if device_class is None:
+            return None
+        device = device_class(i2c_bus=self.i2c_bus, address=address, check_connection=False, defer_init=defer_init)
+        if pin_strap_address is not None:
+            device._pin_strap = (address, pin_strap_address)
+        return device
+
+    def _resolve_class(self, address: int) -> tuple:
+        """
+        Returns the Modulino device class for the device at the given I2C address
+        and its pinstrap address if it had to be read (None otherwise).
+        """
+        if address == _BOOTLOADER_ADDRESS:
+            return Modulino, None
+        pin_strap_address = None
+        if address not in ADDRESS_TO_CLASS:
+            pin_strap_address = self._read_pin_strap_address(address)
+        return self._class_from_address(address, pin_strap_address), pin_strap_address
+
+    def health_snapshot(self, probe: bool = True) -> dict:
+        """
+        Returns the health of the whole chain: the statistics recorded by the HealthMonitor of the bus
+        (see HealthMonitor.device()) for every device that has been used or found by an earlier scan
+        (e.g. by available_devices()).
+        The monitor has to be started (e.g. with `modulino.health_monitor.start()`) to record statistics.
+
+        Parameters:
+            probe (bool): Whether to probe the devices to find out if they are present right now.
+                          This costs one short transaction per device.
+
+        Returns:
+            dict: Maps the 7-bit address to the statistics of the device. If probe is True,
+                  each entry contains the key "present". Devices without recorded transactions only contain that key.
+        """
+        arbiter = BusArbiter.for_bus(self.i2c_bus)
+        while arbiter.replacement is not None:
+            # The bus has been recovered in the meantime
+            arbiter = BusArbiter.for_bus(arbiter.replacement)
+        self.i2c_bus = arbiter.bus
+
+        monitor = arbiter.health_monitor
+        snapshot = monitor.snapshot() if monitor is not None else {}
+        # Include the devices that have been found by earlier scans but haven't been used yet
+        for address, present in _ScanCache.get(self.i2c_bus).items():
+            if present and address not in snapshot:
+                snapshot[address] = {}
+
+        if probe:
+            with arbiter:
+                present_addresses = Modulino.scan(self.i2c_bus, list(snapshot))
+            for address, health in snapshot.items():
+                health["present"] = address in present_addresses
+        return snapshot
@@ -10,7 +10,7 @@ class ModulinoDistance(Modulino):
     default_addresses = [0x29]
     has_mcu = False
 
-    def __init__(self, i2c_bus = None, address: int | None = None, check_connection: bool = True) -> None:
+    def __init__(self, i2c_bus = None, address: int | None = None, check_connection: bool = True, defer_init: bool = False) -> None:
         """
         Initializes the Modulino Distance.
 
@@ -18,33 +18,86 @@ class ModulinoDistance(Modulino):
             i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
             address (int): The I2C address of the module. If not provided, the default address will be used.
             check_connection (bool): Whether to check the connection to the module.
+            defer_init (bool): Whether to postpone the configuration of the sensor until the sensor is used for the first time.
         """
         
         super().__init__(i2c_bus, address, "Distance", check_connection=check_connection)
-        self.sensor = VL53L4CD(self.i2c_bus, self.address) 
-        self.sensor.timing_budget = 20     
-        self.sensor.inter_measurement = 0
-        self.sensor.start_ranging()
+        self._sensor = None
+        if not defer_init:
+            self._init_sensor()
+
+    def _init_sensor(self) -> None:
+        """
+        Configures the sensor and starts the continuous ranging.
+        """
+        sensor = VL53L4CD(self.i2c_bus, self.address, self.bus_arbiter)
+        sensor.timing_budget = 20
+        sensor.inter_measurement = 0
+        sensor.start_ranging()
+        self._sensor = sensor
+
+    @property
+    def sensor(self) -> VL53L4CD:
+        """
+        The underlying VL53L4CD driver.
+        It's created on first access if the initialization was deferred.
+        """
+        self._rebind_bus()
+        if self._sensor is None:
+            self._init_sensor()
+        return self._sensor
+
+    def _on_bus_replaced(self) -> None:
+        # The sensor keeps its configuration across a bus recovery, only the driver needs the new bus
+        if self._sensor is not None:
+            self._sensor._i2c = self.i2c_bus
+            self._sensor._arbiter = self._arbiter
+
+    def _on_reconnected(self) -> None:
+        # The sensor has been power cycled, configure it again on next use
+        self._sensor = None
+
+    def _poll_distance(self, sensor: VL53L4CD, start: int, timeout: int) -> int | None:
+        """
+        Checks once whether a measurement is available and reads it.
+        Shared by _distance_raw() and _adistance_raw(), which only differ in how they wait between checks.
+
+        Returns:
+            int: The distance in centimeters or None if the measurement isn't ready yet.
+
+        Raises:
+            OSError: If no measurement became available within the timeout.
+        """
+        if sensor.data_ready:
+            sensor.clear_interrupt()
+            return sensor.distance
+        if ticks_diff(ticks_ms(), start) > timeout:
+            raise OSError("Timeout waiting for sensor data")
+        return None
 
     def _distance_raw(self, timeout = 1000) -> int | None:
         """
         Reads the raw distance value from the sensor and clears the interrupt.
 
         Returns:
-            int: The distance in centimeters.
+            int: The distance in centimeters or None if the sensor timed out.
         """
+        sensor = self.sensor
+        start = ticks_ms()
         try:
-            start = ticks_ms()
-            while not self.sensor.data_ready:
-                if ticks_diff(ticks_ms(), start) > timeout:
-                    raise OSError("Timeout waiting for sensor data")
+            while True:
+                distance = self._poll_distance(sensor, start, timeout)
+                if distance is not None:
+                    return distance
                 sleep_ms(1)
-            self.sensor.clear_interrupt()
-            return self.sensor.distance
         except OSError:
             # Catch timeout errors
             return None
 
+    @staticmethod
+    def _is_valid(raw_distance: int | None) -> bool:
+        return raw_distance is not None and raw_distance > 0
+
     @property
     def distance(self) -> int:
         """
@@ -54,8 +107,46 @@ class ModulinoDistance(Modulino):
         raw_distance = self._distance_raw()
 
         # Retry once if the reading is invalid
-        if raw_distance <= 0:
+        if not self._is_valid(raw_distance):
             raw_distance = self._distance_raw()
-        
+
+        # Filter out invalid readings
+        return raw_distance if self._is_valid(raw_distance) else None
+
+    async def _adistance_raw(self, timeout = 1000) -> int | None:
+        """
+        Coroutine version of _distance_raw().
+        Other tasks keep running while the sensor is busy with the measurement.
+
+        Returns:
+            int: The distance in centimeters.
+        """
+        import asyncio
+        sensor = self.sensor
+        start = ticks_ms()
+        try:
+            while True:
+                distance = self._poll_distance(sensor, start, timeout)
+                if distance is not None:
+                    return distance
+                await asyncio.sleep_ms(1)
+        except OSError:
+            # Catch timeout errors
+            return None
+
+    async def adistance(self) -> int | None:
+        """
+        Coroutine version of the distance property.
+        Waits for the measurement without blocking the event loop.
+
+        Returns:
+            int: The distance in centimeters or None if no valid reading is available.
+        """
+        raw_distance = await self._adistance_raw()
+
+        # Retry once if the reading is invalid
+        if not self._is_valid(raw_distance):
+            raw_distance = await self._adistance_raw()
+
         # Filter out invalid readings
-        return raw_distance if raw_distance > 0 else None
\ No newline at end of file
+        return raw_distance if self._is_valid(raw_distance) else None
\ No newline at end of file
@@ -0,0 +1,58 @@
+# This file is generated by tools/generate_gamma.py. Do not edit it manually.
+
+# Gamma correction tables shared by the Pixels, the LED Matrix and the conversion tools.
+# The eye perceives brightness roughly logarithmically, so fades between linear values seem to jump
+# at the dark end and to stall at the bright end. The tables map a perceived intensity to the value to send.
+# They use a gamma of 2.7. This module doesn't import anything, the tools load it on the host.
+
+# Maps an 8-bit intensity (0..255) to an 8-bit color value, e.g. for the colors of the Pixels.
+GAMMA_8BIT = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01'
+    b'\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02\x02\x02\x02\x02\x03\x03'
+    b'\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x05\x05\x05\x05\x06\x06'
+    b'\x06\x06\x07\x07\x07\x07\x08\x08\x08\x09\x09\x09\x0a\x0a\x0a\x0b'
+    b'\x0b\x0c\x0c\x0c\x0d\x0d\x0e\x0e\x0e\x0f\x0f\x10\x10\x11\x11\x12'
+    b'\x12\x13\x13\x14\x14\x15\x15\x16\x17\x17\x18\x18\x19\x1a\x1a\x1b'
+    b'\x1c\x1c\x1d\x1e\x1e\x1f\x20\x21\x21\x22\x23\x24\x24\x25\x26\x27'
+    b'\x28\x29\x29\x2a\x2b\x2c\x2d\x2e\x2f\x30\x31\x32\x33\x33\x34\x35'
+    b'\x37\x38\x39\x3a\x3b\x3c\x3d\x3e\x3f\x40\x41\x42\x44\x45\x46\x47'
+    b'\x48\x4a\x4b\x4c\x4d\x4f\x50\x51\x53\x54\x55\x57\x58\x59\x5b\x5c'
+    b'\x5e\x5f\x61\x62\x64\x65\x67\x68\x6a\x6b\x6d\x6e\x70\x72\x73\x75'
+    b'\x77\x78\x7a\x7c\x7d\x7f\x81\x83\x84\x86\x88\x8a\x8c\x8d\x8f\x91'
+    b'\x93\x95\x97\x99\x9b\x9d\x9f\xa1\xa3\xa5\xa7\xa9\xab\xad\xaf\xb2'
+    b'\xb4\xb6\xb8\xba\xbc\xbf\xc1\xc3\xc6\xc8\xca\xcd\xcf\xd1\xd4\xd6'
+    b'\xd8\xdb\xdd\xe0\xe2\xe5\xe7\xea\xed\xef\xf2\xf4\xf7\xfa\xfc\xff'
+)
+
+# Maps an 8-bit intensity (0..255) to a level of the grayscale mode of the LED Matrix (0..15).
+GAMMA_4BIT = (
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x01\x01\x01\x01\x01\x01'
+    b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+    b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x02\x02\x02'
+    b'\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02\x02'
+    b'\x02\x02\x02\x02\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03\x03'
+    b'\x03\x03\x03\x03\x03\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04'
+    b'\x04\x04\x04\x04\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+    b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x07\x07\x07\x07'
+    b'\x07\x07\x07\x07\x07\x07\x08\x08\x08\x08\x08\x08\x08\x08\x08\x09'
+    b'\x09\x09\x09\x09\x09\x09\x09\x09\x0a\x0a\x0a\x0a\x0a\x0a\x0a\x0a'
+    b'\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0d'
+    b'\x0d\x0d\x0d\x0d\x0d\x0d\x0e\x0e\x0e\x0e\x0e\x0e\x0f\x0f\x0f\x0f'
+)
+
+# Maps a brightness in percent (0..100) to the 5-bit brightness of the Pixels (0..31).
+# Every brightness above 0 keeps the LED on.
+PERCEPTUAL_BRIGHTNESS = (
+    b'\x00\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+    b'\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01'
+    b'\x01\x02\x02\x02\x02\x02\x02\x02\x03\x03\x03\x03\x03\x04\x04\x04'
+    b'\x04\x05\x05\x05\x05\x06\x06\x06\x06\x07\x07\x07\x08\x08\x09\x09'
+    b'\x09\x0a\x0a\x0b\x0b\x0b\x0c\x0c\x0d\x0d\x0e\x0e\x0f\x0f\x10\x10'
+    b'\x11\x12\x12\x13\x13\x14\x15\x15\x16\x17\x17\x18\x19\x19\x1a\x1b'
+    b'\x1c\x1d\x1d\x1e\x1f'
+)
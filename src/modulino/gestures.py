@@ -0,0 +1,262 @@
+from time import ticks_ms, ticks_add, ticks_diff
+
+class GestureRecognizer:
+    """
+    Recognizes gestures on a set of buttons: single and multi clicks (e.g. double or triple click),
+    holding a button, auto-repeat while a button is held (getting faster the longer it's held)
+    and chords of several buttons that are pressed together (e.g. A+C).
+
+    The recognizer is fed with the packed state of the buttons (bit 0 = first button) and a timestamp
+    by the update() method of a Modulino, see ModulinoButtons.gestures, ModulinoKnob.gestures
+    and ModulinoJoystick.gestures. Each sample costs the same, no matter how many gestures are registered,
+    and no memory is allocated while feeding it.
+
+    A click is a press that is released before click_max_ms. Clicks that follow each other within
+    multi_click_ms are counted. The click callback for the counted clicks is called as soon as no further
+    click can follow, or immediately if it's the highest count that is registered for the button.
+    A button that was held (see add_hold() and add_repeat()) or that is part of a chord doesn't produce clicks.
+
+    Example:
+
+        gestures = buttons.gestures
+        gestures.add_click(0, lambda: print("A clicked"))
+        gestures.add_click(0, lambda: print("A double clicked"), count=2)
+        gestures.add_repeat(1, lambda count: print("B repeat", count))
+        gestures.add_chord((0, 2), lambda: print("A+C"))
+
+        while True:
+            buttons.update()
+            sleep_ms(10)
+    """
+
+    def __init__(self, buttons: int = 1, multi_click_ms: int = 300, click_max_ms: int = 400, chord_window_ms: int = 100):
+        """
+        Initializes the recognizer.
+
+        Parameters:
+            buttons (int): The amount of buttons in the state (up to 8).
+            multi_click_ms (int): The maximum time between the release of a click and the press of the next one.
+            click_max_ms (int): Presses that are longer than this aren't clicks.
+            chord_window_ms (int): The maximum time between the first and the last press of a chord.
+        """
+        if buttons < 1 or buttons > 8:
+            raise ValueError("The amount of buttons must be between 1 and 8")
+        self.multi_click_ms = multi_click_ms
+        self.click_max_ms = click_max_ms
+        self.chord_window_ms = chord_window_ms
+        self._buttons = buttons
+        self._state = -1 # Unknown until the first sample
+
+        # Gesture tables, indexed by button
+        self._click_callbacks = [None] * buttons # {count: callback}
+        self._max_clicks = [0] * buttons
+        self._holds = [None] * buttons # [duration_ms, callback]
+        self._repeats = [None] * buttons # [delay_ms, interval_ms, min_interval_ms, acceleration, callback]
+        self._chords = [] # [mask, callback]
+        self._timed_mask = 0 # Buttons with a hold or repeat gesture
+
+        # Recognition state, indexed by button
+        self._press_times = [0] * buttons
+        self._release_times = [0] * buttons
+        self._clicks = [0] * buttons
+        self._repeat_deadlines = [0] * buttons
+        self._repeat_intervals = [0] * buttons
+        self._repeat_counts = [0] * buttons
+        self._clicks_pending = 0 # Buttons with counted clicks that haven't been reported yet
+        self._held = 0 # Buttons whose hold or repeat gesture fired during the current press
+        self._suppressed = 0 # Buttons that are part of a chord that fired, until they are released
+
+    def _check_button(self, button: int) -> None:
+        if button < 0 or button >= self._buttons:
+            raise ValueError(f"Invalid button index {button}")
+
+    def add_click(self, button: int, callback, count: int = 1) -> None:
+        """
+        Registers a callback for a single or multi click.
+
+        Parameters:
+            button (int): The index of the button.
+            callback (function): The function that is called without arguments.
+            count (int): The amount of clicks, e.g. 2 for a double click.
+        """
+        self._check_button(button)
+        if count < 1:
+            raise ValueError("The click count must be positive")
+        if self._click_callbacks[button] is None:
+            self._click_callbacks[button] = {}
+        self._click_callbacks[button][count] = callback
+        self._max_clicks[button] = max(self._click_callbacks[button])
+
+    def add_hold(self, button: int, callback, duration_ms: int = 800) -> None:
+        """
+        Registers a callback that is called once when the button has been held for the given duration.
+
+        Parameters:
+            button (int): The index of the button.
+            callback (function): The function that is called without arguments.
+            duration_ms (int): How long the button needs to be held.
+        """
+        self._check_button(button)
+        self._holds[button] = [duration_ms, callback]
+        self._timed_mask |= 1 << button
+
+    def add_repeat(self, button: int, callback, delay_ms: int = 500, interval_ms: int = 200, min_interval_ms: int = 50, acceleration: int = 20) -> None:
+        """
+        Registers a callback that is called repeatedly while the button is held, e.g. to step through a value.
+        The interval shrinks with every repetition until it reaches min_interval_ms.
+
+        Parameters:
+            button (int): The index of the button.
+            callback (function): The function that is called with the number of the repetition (starting at 1).
+            delay_ms (int): The time the button needs to be held before the first repetition.
+            interval_ms (int): The initial time between two repetitions.
+            min_interval_ms (int): The shortest time between two repetitions.
+            acceleration (int): The percentage by which the interval shrinks with every repetition. 0 keeps it constant.
+        """
+        self._check_button(button)
+        if not 0 <= acceleration < 100:
+            raise ValueError("The acceleration must be between 0 and 99")
+        self._repeats[button] = [delay_ms, interval_ms, min(min_interval_ms, interval_ms), acceleration, callback]
+        self._timed_mask |= 1 << button
+
+    def add_chord(self, buttons: tuple, callback) -> None:
+        """
+        Registers a callback for buttons that are pressed together.
+
+        Parameters:
+            buttons (tuple): The indices of the buttons, e.g. (0, 2) for A+C.
+            callback (function): The function that is called without arguments.
+        """
+        mask = 0
+        for button in buttons:
+            self._check_button(button)
+            mask |= 1 << button
+        if mask & (mask - 1) == 0:
+            raise ValueError("A chord needs at least two buttons")
+        self._chords.append([mask, callback])
+
+    def clear(self) -> None:
+        """
+        Removes all gestures.
+        """
+        for button in range(self._buttons):
+            self._click_callbacks[button] = None
+            self._max_clicks[button] = 0
+            self._holds[button] = None
+            self._repeats[button] = None
+        self._chords.clear()
+        self._timed_mask = 0
+        self._clicks_pending = 0
+
+    def _report_clicks(self, button: int) -> None:
+        count = self._clicks[button]
+        self._clicks[button] = 0
+        self._clicks_pending &= ~(1 << button)
+        callbacks = self._click_callbacks[button]
+        callback = callbacks.get(count) if callbacks else None
+        if callback:
+            callback()
+
+    def feed(self, state: int, now: int = None) -> None:
+        """
+        Processes a sample of the button states. Called by the update() method of the Modulino.
+
+        Parameters:
+            state (int): The pressed buttons as a bitmask (bit 0 = first button).
+            now (int): The timestamp of the sample from time.ticks_ms(). If omitted, the current time is used.
+        """
+        if now is None:
+            now = ticks_ms()
+        previous = self._state
+        self._state = state
+        if previous < 0:
+            # Buttons that are already pressed on the first sample don't produce gestures until they are released
+            self._suppressed = state
+            return
+
+        changed = state ^ previous
+        if not changed and not (state & self._timed_mask) and not self._clicks_pending:
+            return
+
+        for button in range(self._buttons):
+            bit = 1 << button
+            if changed & bit:
+                if state & bit:
+                    self._on_press(button, bit, now)
+                else:
+                    self._on_release(button, bit, now)
+            elif state & bit & self._timed_mask and not self._suppressed & bit:
+                self._check_timers(button, bit, now)
+            elif self._clicks_pending & bit and not state & bit:
+                if ticks_diff(now, self._release_times[button]) > self.multi_click_ms:
+                    self._report_clicks(button)
+
+        if changed & state and self._chords:
+            self._check_chords(state, now)
+
+    def _on_press(self, button: int, bit: int, now: int) -> None:
+        if self._clicks_pending & bit and ticks_diff(now, self._release_times[button]) > self.multi_click_ms:
+            # The previous clicks have timed out before they could be reported
+            self._report_clicks(button)
+        self._press_times[button] = now
+        self._held &= ~bit
+        repeat = self._repeats[button]
+        if repeat is not None:
+            self._repeat_deadlines[button] = ticks_add(now, repeat[0])
+            self._repeat_intervals[button] = repeat[1]
+            self._repeat_counts[button] = 0
+
+    def _on_release(self, button: int, bit: int, now: int) -> None:
+        if self._suppressed & bit:
+            self._suppressed &= ~bit
+            return
+        if self._held & bit:
+            self._held &= ~bit
+            return
+        if self._click_callbacks[button] is None or ticks_diff(now, self._press_times[button]) > self.click_max_ms:
+            return
+        self._clicks[button] += 1
+        self._release_times[button] = now
+        self._clicks_pending |= bit
+        if self._clicks[button] >= self._max_clicks[button]:
+            # No further click can be recognized, report right away
+            self._report_clicks(button)
+
+    def _check_timers(self, button: int, bit: int, now: int) -> None:
+        hold = self._holds[button]
+        if hold is not None and not self._held & bit and ticks_diff(now, self._press_times[button]) >= hold[0]:
+            self._held |= bit
+            self._cancel_clicks(button, bit)
+            hold[1]()
+
+        repeat = self._repeats[button]
+        if repeat is not None and ticks_diff(now, self._repeat_deadlines[button]) >= 0:
+            self._held |= bit
+            self._cancel_clicks(button, bit)
+            interval = self._repeat_intervals[button]
+            self._repeat_deadlines[button] = ticks_add(now, interval)
+            self._repeat_intervals[button] = max(repeat[2], interval * (100 - repeat[3]) // 100)
+            self._repeat_counts[button] += 1
+            repeat[4](self._repeat_counts[button])
+
+    def _cancel_clicks(self, button: int, bit: int) -> None:
+        self._clicks[button] = 0
+        self._clicks_pending &= ~bit
+
+    def _check_chords(self, state: int, now: int) -> None:
+        for chord in self._chords:
+            mask = chord[0]
+            if state & mask != mask or self._suppressed & mask:
+                continue
+            # All buttons of the chord need to be pressed within the chord window
+            first = now
+            for button in range(self._buttons):
+                if mask & (1 << button) and ticks_diff(self._press_times[button], first) < 0:
+                    first = self._press_times[button]
+            if ticks_diff(now, first) > self.chord_window_ms:
+                continue
+            self._suppressed |= mask
+            for button in range(self._buttons):
+                if mask & (1 << button):
+                    self._cancel_clicks(button, 1 << button)
+            chord[1]()
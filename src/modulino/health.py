@@ -0,0 +1,175 @@
+from time import ticks_ms, ticks_diff
+from .bus_arbiter import BusArbiter
+
+class _DeviceHealth:
+    """
+    Transaction statistics of one address.
+    """
+
+    def __init__(self):
+        self.transactions = 0
+        self.bytes = 0
+        self.errors = 0
+        self.last_error = None # errno of the last failed transaction
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+        self.last_seen = None # ticks_ms() of the last successful transaction
+
+    def as_dict(self, now: int) -> dict:
+        transactions = self.transactions
+        return {
+            "transactions": transactions,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "error_rate": self.errors / (transactions + self.errors) if transactions + self.errors else 0,
+            "last_error": self.last_error,
+            "min_us": self.min_us,
+            "avg_us": self.total_us // transactions if transactions else 0,
+            "max_us": self.max_us,
+            "last_seen_ms": ticks_diff(now, self.last_seen) if self.last_seen is not None else None,
+        }
+
+class HealthMonitor:
+    """
+    Records the transactions of the Modulinos on a bus per address: the amount of transactions and bytes,
+    the failed transactions and the min/avg/max latency, as well as when a device answered for the last time.
+    It helps to find a flaky device (e.g. a loose cable) in a chain that runs for a long time.
+    There is one monitor per bus, see HealthMonitor.for_bus() or Modulino.health_monitor.
+
+    The monitor is disabled until start() is called. While it's disabled (or has never been created)
+    the transfers only pay for checking whether a monitor is active.
+    The transfers of Modulino.read() and Modulino.write() as well as the batches of the command queue are recorded.
+    The sensor Modulinos (Movement, Light, Thermo, Distance) talk to the bus through their sensor drivers,
+    their presence shows up in DeviceManager.health_snapshot().
+
+    Example:
+
+        monitor = HealthMonitor.for_bus(bus)
+        monitor.start()
+        ...
+        for address, health in monitor.snapshot().items():
+            print(hex(address), health["errors"], health["avg_us"])
+    """
+
+    def __init__(self, bus):
+        """
+        Initializes the monitor. Use HealthMonitor.for_bus() to get the shared monitor of a bus.
+
+        Parameters:
+            bus (I2C): The bus to monitor.
+        """
+        self.bus = bus
+        self._devices = {} # address -> _DeviceHealth
+        self._active = False
+
+    @staticmethod
+    def for_bus(bus) -> "HealthMonitor":
+        """
+        Returns the monitor of the given bus. It's created on first use.
+
+        Parameters:
+            bus (I2C): The bus to monitor.
+        """
+        arbiter = BusArbiter.for_bus(bus)
+        monitor = arbiter.health_monitor
+        if monitor is None:
+            monitor = HealthMonitor(bus)
+            arbiter.health_monitor = monitor
+        return monitor
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns True if the transactions are recorded.
+        """
+        return self._active
+
+    def start(self) -> None:
+        """
+        Starts recording the transactions on the bus.
+        """
+        self._active = True
+
+    def stop(self) -> None:
+        """
+        Stops recording the transactions. The recorded statistics are kept.
+        """
+        self._active = False
+
+    def _move_to(self, bus) -> None:
+        """
+        Records the transactions of a new bus object from now on, e.g. after the bus has been recovered.
+
+        Parameters:
+            bus (I2C): The new bus object.
+        """
+        self.bus = bus
+        BusArbiter.for_bus(bus).health_monitor = self
+
+    def _device(self, address: int) -> _DeviceHealth:
+        device = self._devices.get(address)
+        if device is None:
+            device = _DeviceHealth()
+            self._devices[address] = device
+        return device
+
+    def record(self, address: int, length: int, duration_us: int) -> None:
+        """
+        Records a successful transaction.
+
+        Parameters:
+            address (int): The 7-bit address of the device.
+            length (int): The amount of bytes that have been transferred.
+            duration_us (int): The time the transaction took in microseconds.
+        """
+        device = self._device(address)
+        if device.transactions == 0 or duration_us < device.min_us:
+            device.min_us = duration_us
+        if duration_us > device.max_us:
+            device.max_us = duration_us
+        device.transactions += 1
+        device.bytes += length
+        device.total_us += duration_us
+        device.last_seen = ticks_ms()
+
+    def record_error(self, address: int, error: OSError) -> None:
+        """
+        Records a failed transaction.
+
+        Parameters:
+            address (int): The 7-bit address of the device.
+            error (OSError): The error raised by the transaction.
+        """
+        device = self._device(address)
+        device.errors += 1
+        device.last_error = error.args[0] if error.args else None
+
+    def device(self, address: int) -> dict | None:
+        """
+        Returns the statistics of one address or None if no transaction has been recorded for it.
+        The latencies are in microseconds, last_seen_ms is the time since the last successful transaction.
+
+        Parameters:
+            address (int): The 7-bit address of the device.
+        """
+        device = self._devices.get(address)
+        if device is None:
+            return None
+        return device.as_dict(ticks_ms())
+
+    def snapshot(self) -> dict:
+        """
+        Returns the statistics of all addresses that have been recorded, see device().
+
+        Returns:
+            dict: Maps the 7-bit address to the statistics of the device.
+        """
+        now = ticks_ms()
+        return {address: device.as_dict(now) for address, device in self._devices.items()}
+
+    def reset_stats(self) -> None:
+        """
+        Discards the recorded statistics.
+        """
+        self._devices = {}
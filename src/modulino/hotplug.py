@@ -0,0 +1,195 @@
+import asyncio
+from machine import I2C
+from .modulino import Modulino, _ScanCache
+from .bus_arbiter import BusArbiter
+from .device_manager import DeviceManager
+
+class HotplugWatcher:
+    """
+    Detects Modulinos that are connected or disconnected at runtime without scanning the whole bus every time.
+
+    Every poll probes the addresses of the known devices (including detached ones) plus a small slice of the remaining
+    address space. The slice rotates with every poll, so a new device is found within
+    127 / slice_size polls while a poll costs only a few short transactions.
+    A device is only reported as detached after it missed several probes in a row,
+    so a glitch on the bus doesn't cause detach/attach events.
+
+    The Modulino objects are kept while their device is detached. When the device comes back
+    at the same address, the same object (including its callbacks and settings) is reported again
+    and reconfigured on next use. If a different kind of Modulino shows up at the address, a new object is created.
+
+    Example:
+
+        watcher = HotplugWatcher()
+        watcher.on_attach = lambda device: print(device.name, "connected")
+        watcher.on_detach = lambda device: print(device.name, "disconnected")
+        asyncio.create_task(watcher.run(interval_ms=500))
+    """
+
+    def __init__(self, i2c_bus: I2C = None, slice_size: int = 8, miss_limit: int = 2, defer_init: bool = True) -> None:
+        """
+        Initializes the watcher.
+
+        Parameters:
+            i2c_bus (I2C): The I2C bus to watch. If not provided, the default I2C bus will be used.
+            slice_size (int): The amount of unknown addresses that are probed per poll.
+            miss_limit (int): The amount of failed probes in a row after which a device is reported as detached.
+            defer_init (bool): Whether to create the objects of new devices without communicating with them,
+                               see DeviceManager.available_devices().
+        """
+        if slice_size <= 0 or miss_limit <= 0:
+            raise ValueError("The slice size and the miss limit must be positive")
+        self._manager = DeviceManager(i2c_bus)
+        self._slice_size = slice_size
+        self._miss_limit = miss_limit
+        self._defer_init = defer_init
+        self._devices = {} # address -> Modulino, attached and detached ones
+        self._misses = {} # address -> failed probes in a row, only contains attached devices
+        self._unresolved = set() # Addresses of responding devices that aren't Modulinos
+        self._cursor = 1
+        self._initialized = False
+        self._running = False
+        self.attached = [] # Devices that have been attached during the last poll
+        self.detached = [] # Devices that have been detached during the last poll
+        self.on_attach = None
+        self.on_detach = None
+
+    @property
+    def devices(self) -> list[Modulino]:
+        """
+        Returns the devices that are currently connected.
+        """
+        return [self._devices[address] for address in self._misses]
+
+    def _current_bus(self) -> BusArbiter:
+        """
+        Returns the arbiter of the bus, following a bus that has been recovered in the meantime.
+        """
+        arbiter = BusArbiter.for_bus(self._manager.i2c_bus)
+        while arbiter.replacement is not None:
+            arbiter = BusArbiter.for_bus(arbiter.replacement)
+        self._manager.i2c_bus = arbiter.bus
+        return arbiter
+
+    def _next_slice(self) -> list[int]:
+        """
+        Returns the next unknown addresses to probe.
+        """
+        addresses = []
+        devices = self._devices
+        cursor = self._cursor
+        # Known addresses are probed anyway, so at most one round over the address space is needed
+        for _ in range(127):
+            if cursor not in devices:
+                addresses.append(cursor)
+                if len(addresses) == self._slice_size:
+                    cursor = cursor % 127 + 1
+                    break
+            cursor = cursor % 127 + 1
+        self._cursor = cursor
+        return addresses
+
+    def poll(self) -> bool:
+        """
+        Probes the known devices and the next slice of the address space and reports the changes.
+        The first poll enumerates the bus (reusing earlier scan results) and reports all devices as attached.
+
+        Returns:
+            bool: True if a device has been attached or detached.
+        """
+        attached = self.attached
+        detached = self.detached
+        attached.clear()
+        detached.clear()
+        arbiter = self._current_bus()
+        bus = arbiter.bus
+        cache = _ScanCache.get(bus)
+
+        if not self._initialized:
+            self._initialized = True
+            for device in self._manager.available_devices(rescan=False, defer_init=self._defer_init):
+                self._devices[device.address] = device
+                self._misses[device.address] = 0
+                attached.append(device)
+        else:
+            known = list(self._misses)
+            # Detached devices are probed on every poll, so they are reattached quickly
+            candidates = known + [address for address in self._devices if address not in self._misses] + self._next_slice()
+            with arbiter:
+                present = Modulino.scan(bus, candidates)
+
+            unresolved = self._unresolved
+            if unresolved:
+                # A device that couldn't be identified is only identified again after it disappeared
+                for address in candidates:
+                    if address in unresolved and address not in present:
+                        unresolved.discard(address)
+
+            for address in known:
+                if address in present:
+                    self._misses[address] = 0
+                    continue
+                self._misses[address] += 1
+                if self._misses[address] >= self._miss_limit:
+                    del self._misses[address]
+                    cache[address] = False
+                    detached.append(self._devices[address])
+
+            for address in present:
+                if address in self._misses or address in self._unresolved:
+                    continue
+                cache[address] = True
+                device = self._attach(address)
+                if device is not None:
+                    attached.append(device)
+
+        if self.on_detach:
+            for device in detached:
+                self.on_detach(device)
+        if self.on_attach:
+            for device in attached:
+                self.on_attach(device)
+        return len(attached) > 0 or len(detached) > 0
+
+    def _attach(self, address: int) -> Modulino | None:
+        """
+        Returns the object of a device that showed up at the given address.
+        The object of a device that was connected before is reused if it's still the same kind of Modulino.
+        """
+        try:
+            resolved = self._manager._resolve_class(address)
+        except OSError:
+            # The device is still starting up, try again on the next round
+            return None
+        if resolved[0] is None:
+            # Not a Modulino, don't read its pinstrap address again on every round
+            self._unresolved.add(address)
+            return None
+
+        device = self._devices.get(address)
+        if device is not None and type(device) is resolved[0] and device.address == address:
+            device._rebind_bus()
+            device._on_reconnected()
+        else:
+            device = self._manager._create_device(address, self._defer_init, resolved)
+            self._devices[address] = device
+        self._misses[address] = 0
+        return device
+
+    async def run(self, interval_ms: int = 1000) -> None:
+        """
+        Polls the bus until stop() is called.
+
+        Parameters:
+            interval_ms (int): The time between two polls in milliseconds.
+        """
+        self._running = True
+        while self._running:
+            self.poll()
+            await asyncio.sleep_ms(interval_ms)
+
+    def stop(self) -> None:
+        """
+        Stops run() after the current iteration.
+        """
+        self._running = False
@@ -0,0 +1,250 @@
+import asyncio
+from time import ticks_ms, ticks_add, ticks_diff
+
+class _InputEntry:
+    """
+    Polling state of a device registered with the InputHub.
+    """
+
+    def __init__(self, device, interval_ms: int, idle_interval_ms: int):
+        self.device = device
+        self.interval_ms = interval_ms
+        self.idle_interval_ms = idle_interval_ms
+        self.current_interval_ms = interval_ms
+        self.deadline = ticks_ms()
+        self.primed = False # The first poll only reads the initial state
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+
+class InputHub:
+    """
+    Polls input Modulinos (Buttons, Knob, Joystick or anything with an update() method
+    that returns True on changes) from a single asyncio task.
+
+    Every device is polled at its own interval. Devices that are due within the same
+    window are polled together so that the task wakes up as rarely as possible.
+    If a device doesn't change, its interval is doubled step by step up to its idle interval.
+    The first change brings it back to the fast interval, so idle UIs cost little CPU and bus time
+    while active inputs stay responsive.
+
+    The callbacks of the devices (e.g. on_press) are executed by update() as usual.
+    Additionally, changes can be awaited with wait().
+
+    Example:
+
+        hub = InputHub()
+        hub.add(buttons)
+        hub.add(knob, interval_ms=10)
+        asyncio.create_task(hub.run())
+
+        while True:
+            device = await hub.wait()
+            print(device, "changed")
+    """
+
+    def __init__(self, interval_ms: int = 20, idle_interval_ms: int = 80, coalesce_ms: int = 5):
+        """
+        Initializes the InputHub.
+
+        Parameters:
+            interval_ms (int): The default poll interval in milliseconds while a device is active.
+            idle_interval_ms (int): The default maximum poll interval in milliseconds while a device doesn't change.
+                                    The modules report their current state, so button presses that are
+                                    shorter than this interval may be missed.
+            coalesce_ms (int): Devices that are due within this many milliseconds are polled together.
+        """
+        if interval_ms <= 0 or idle_interval_ms < interval_ms:
+            raise ValueError("The intervals must be positive and the idle interval can't be shorter than the interval")
+        self._interval_ms = interval_ms
+        self._idle_interval_ms = idle_interval_ms
+        self._coalesce_ms = max(0, coalesce_ms)
+        self._entries = []
+        self._pending = [] # Devices that changed and haven't been returned by wait() yet
+        self._changed_event = None
+        self._running = False
+        self._wakeups = 0
+
+    def add(self, device, interval_ms: int = None, idle_interval_ms: int = None) -> None:
+        """
+        Registers a device to be polled.
+
+        Parameters:
+            device: The device to poll. It needs an update() method that returns True if something changed.
+            interval_ms (int): The poll interval in milliseconds while the device is active.
+                               Defaults to the interval of the hub.
+            idle_interval_ms (int): The maximum poll interval in milliseconds while the device doesn't change.
+                                    Defaults to the idle interval of the hub.
+        """
+        if interval_ms is None:
+            interval_ms = self._interval_ms
+        if idle_interval_ms is None:
+            idle_interval_ms = max(interval_ms, self._idle_interval_ms)
+        if interval_ms <= 0 or idle_interval_ms < interval_ms:
+            raise ValueError("The intervals must be positive and the idle interval can't be shorter than the interval")
+        if self._find(device) is not None:
+            raise ValueError("The device has already been added")
+        self._entries.append(_InputEntry(device, interval_ms, idle_interval_ms))
+
+    def remove(self, device) -> None:
+        """
+        Stops polling a device.
+
+        Parameters:
+            device: The device that was registered with add().
+        """
+        entry = self._find(device)
+        if entry is None:
+            raise ValueError("The device hasn't been added")
+        self._entries.remove(entry)
+        if device in self._pending:
+            self._pending.remove(device)
+
+    def _find(self, device) -> _InputEntry | None:
+        for entry in self._entries:
+            if entry.device is device:
+                return entry
+        return None
+
+    def wake(self, device=None) -> None:
+        """
+        Resets the poll interval to the fast interval and polls at the next opportunity,
+        e.g. after the application changed the state of a device.
+
+        Parameters:
+            device: The device to wake up. If None, all devices are woken up.
+        """
+        now = ticks_ms()
+        for entry in self._entries:
+            if device is None or entry.device is device:
+                entry.current_interval_ms = entry.interval_ms
+                entry.deadline = now
+
+    def poll(self) -> int:
+        """
+        Polls all devices that are due and adapts their intervals.
+        Can be used instead of run() in a loop without asyncio.
+
+        Returns:
+            int: The time in milliseconds until the next device is due.
+        """
+        if not self._entries:
+            return self._idle_interval_ms
+
+        self._wakeups += 1
+        now = ticks_ms()
+        coalesce_ms = self._coalesce_ms
+        changed = False
+
+        for entry in self._entries:
+            if ticks_diff(entry.deadline, now) > coalesce_ms:
+                continue
+            entry.polls += 1
+            try:
+                has_changed = entry.device.update()
+            except OSError:
+                # The device may have been disconnected, keep the other devices running
+                entry.errors += 1
+                has_changed = False
+                entry.current_interval_ms = entry.idle_interval_ms
+
+            if not entry.primed:
+                # Some devices report their initial state as a change
+                entry.primed = True
+                has_changed = False
+
+            if has_changed:
+                entry.changes += 1
+                entry.current_interval_ms = entry.interval_ms
+                if entry.device not in self._pending:
+                    self._pending.append(entry.device)
+                changed = True
+            elif entry.current_interval_ms < entry.idle_interval_ms:
+                entry.current_interval_ms = min(entry.current_interval_ms * 2, entry.idle_interval_ms)
+
+            # Stay on the grid of the deadlines unless the poll is too late
+            deadline = ticks_add(entry.deadline, entry.current_interval_ms)
+            if ticks_diff(deadline, now) <= 0:
+                deadline = ticks_add(now, entry.current_interval_ms)
+            entry.deadline = deadline
+
+        if changed and self._changed_event is not None:
+            self._changed_event.set()
+
+        now = ticks_ms()
+        wait = self._idle_interval_ms
+        for entry in self._entries:
+            remaining = ticks_diff(entry.deadline, now)
+            if remaining < wait:
+                wait = remaining
+        return max(0, wait)
+
+    async def run(self) -> None:
+        """
+        Polls the devices until stop() is called.
+        """
+        self._running = True
+        while self._running:
+            await asyncio.sleep_ms(self.poll())
+
+    def stop(self) -> None:
+        """
+        Stops run() after the current iteration.
+        """
+        self._running = False
+
+    async def wait(self, device=None):
+        """
+        Waits until a device reports a change.
+        Changes of a device that happen before they are awaited are merged into one.
+
+        Parameters:
+            device: The device to wait for. If None, any registered device.
+
+        Returns:
+            The device that changed.
+        """
+        if self._changed_event is None:
+            self._changed_event = asyncio.Event()
+        while True:
+            for pending in self._pending:
+                if device is None or pending is device:
+                    self._pending.remove(pending)
+                    return pending
+            self._changed_event.clear()
+            await self._changed_event.wait()
+
+    def interval_ms(self, device) -> int:
+        """
+        Returns the current poll interval of a device in milliseconds.
+
+        Parameters:
+            device: The device that was registered with add().
+        """
+        entry = self._find(device)
+        if entry is None:
+            raise ValueError("The device hasn't been added")
+        return entry.current_interval_ms
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the polling statistics, the amount of wakeups of the hub as well as
+        the amount of polls, changes and errors (e.g. disconnected devices) of all devices.
+        """
+        stats = {"wakeups": self._wakeups, "polls": 0, "changes": 0, "errors": 0}
+        for entry in self._entries:
+            stats["polls"] += entry.polls
+            stats["changes"] += entry.changes
+            stats["errors"] += entry.errors
+        return stats
+
+    def reset_stats(self) -> None:
+        """
+        Resets the polling statistics.
+        """
+        self._wakeups = 0
+        for entry in self._entries:
+            entry.polls = 0
+            entry.changes = 0
+            entry.errors = 0
@@ -1,7 +1,12 @@
 from .modulino import Modulino
-from time import ticks_ms
+from time import ticks_ms, sleep_ms
 from micropython import const
 
+# The samples are processed as fixed point numbers with 8 fractional bits
+_FIXED_POINT_SHIFT = const(8)
+_DEFAULT_CENTER = const(128 << 8)
+_DEFAULT_EXTENT = const(128 << 8)
+
 class ModulinoJoystick(Modulino):
     """
     Class to operate the Modulino Joystick module.
@@ -9,8 +14,9 @@ class ModulinoJoystick(Modulino):
 
     default_addresses = [0x58]
     default_long_press_duration = const(1000)  # milliseconds
+    default_calibrated_extent = const(100)  # Assumed deflection after a calibration until a larger one is seen
 
-    def __init__(self, i2c_bus=None, address=None, check_connection: bool = True):
+    def __init__(self, i2c_bus=None, address=None, check_connection: bool = True, defer_init: bool = False):
         """
         Initializes the Modulino Joystick module.
 
@@ -18,18 +24,35 @@ class ModulinoJoystick(Modulino):
             i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
             address (int): The I2C address of the module. If not provided, the default address will be used.
             check_connection (bool): Whether to check the connection to the module.
+            defer_init (bool): Accepted for compatibility with the other Modulinos. The constructor doesn't communicate with the module.
         """
         super().__init__(i2c_bus, address, "Joystick", check_connection=check_connection)
         self._read_buffer = bytearray(4)  # 2 bytes for x,y + 1 byte for button state + 1 byte for pinstrap address
-        self._state = [0, 0, 0]  # x, y, button state
+        self._button_state = 0
         self._x = 0
         self._y = 0
         self._deadzone_threshold = 10
+        self._change_threshold = 2
+        self._oversampling = 1
+        self._smoothing = 0
+
+        # Sampling pipeline state, all in fixed point
+        self._filtered_x = None
+        self._filtered_y = None
+        self._center_x = _DEFAULT_CENTER
+        self._center_y = _DEFAULT_CENTER
+        # Distance from the center to the end of each direction: x+, x-, y+, y-
+        self._extent_x_positive = _DEFAULT_EXTENT
+        self._extent_x_negative = _DEFAULT_EXTENT
+        self._extent_y_positive = _DEFAULT_EXTENT
+        self._extent_y_negative = _DEFAULT_EXTENT
+        self._calibrated = False
         self._last_press_timestamp = 0
         self._button_pressed = False
         self._on_button_press = None
         self._on_button_release = None
         self._on_button_long_press = None
+        self._gestures = None
         self._long_press_duration = self.default_long_press_duration  # milliseconds
 
     @property
@@ -47,64 +70,208 @@ class ModulinoJoystick(Modulino):
             y_new (int): New y-coordinate.
             threshold (int): The minimum change in position to consider it a state change.
         """
+        if x_new == 0 and y_new == 0:
+            # Always report the return to the center, even if it's a small step
+            return x_old != 0 or y_old != 0
         return abs(x_new - x_old) > threshold or abs(y_new - y_old) > threshold
 
+    def _scale(self, value: int, center: int, extent_positive: int, extent_negative: int) -> int:
+        """
+        Maps a fixed point sample to a coordinate centered around 0 in the range -128 to 127.
+        """
+        offset = value - center
+        if offset >= 0:
+            value = (offset << 7) // extent_positive
+        else:
+            value = -((-offset << 7) // extent_negative)
+        if value > 127:
+            return 127
+        if value < -128:
+            return -128
+        return value
+
     def _normalize_coordinates(self, x, y):
         """
-        Applies deadzone logic to joystick coordinates and maps them to a range centered around 0.
+        Filters the fixed point samples, maps them to a range centered around 0
+        and applies the radial deadzone.
 
         Parameters:
-            x (int): The x-coordinate of the joystick.
-            y (int): The y-coordinate of the joystick.
+            x (int): The x-coordinate of the joystick in fixed point.
+            y (int): The y-coordinate of the joystick in fixed point.
 
         Returns:
-            tuple: Adjusted x and y coordinates after applying deadzone.
+            tuple: Adjusted x and y coordinates.
+        """
+        smoothing = self._smoothing
+        if smoothing and self._filtered_x is not None:
+            # Exponential moving average, each sample contributes 1 / 2^smoothing
+            x = self._filtered_x + ((x - self._filtered_x) >> smoothing)
+            y = self._filtered_y + ((y - self._filtered_y) >> smoothing)
+        self._filtered_x = x
+        self._filtered_y = y
+
+        if self._calibrated:
+            # Learn the extents of the stick from the samples
+            offset = x - self._center_x
+            if offset > self._extent_x_positive:
+                self._extent_x_positive = offset
+            elif -offset > self._extent_x_negative:
+                self._extent_x_negative = -offset
+            offset = y - self._center_y
+            if offset > self._extent_y_positive:
+                self._extent_y_positive = offset
+            elif -offset > self._extent_y_negative:
+                self._extent_y_negative = -offset
+
+        x = self._scale(x, self._center_x, self._extent_x_positive, self._extent_x_negative)
+        y = self._scale(y, self._center_y, self._extent_y_positive, self._extent_y_negative)
+
+        threshold = self._deadzone_threshold
+        if x * x + y * y < threshold * threshold:
+            return 0, 0
+        return x, y
+
+    def _read_sample(self):
         """
-        if abs(x - 128) < self._deadzone_threshold:
-            x = 128
-        if abs(y - 128) < self._deadzone_threshold:
-            y = 128
-        return x - 128, y - 128
+        Reads the position and button state. With oversampling the average of several reads is used.
+
+        Returns:
+            tuple: The fixed point x and y coordinates.
+        """
+        data = self._read_buffer
+        count = self._oversampling
+        x = 0
+        y = 0
+        for _ in range(count):
+            self.read(data)
+            x += data[1]
+            y += data[2]
+        return (x << _FIXED_POINT_SHIFT) // count, (y << _FIXED_POINT_SHIFT) // count
 
     def update(self):
         """
         Updates the joystick state by reading the current position and button state.
         """
+        if self._oversampling > 1:
+            x, y = self._read_sample()
+            return self._process_state(x, y)
         self.read(self._read_buffer)
-        new_state = self._read_buffer[1:] # Skip pinstrap address
-        previous_state = self._state
-        self._state = new_state
-        current_timestamp = ticks_ms()        
-        button_state_changed = new_state[2] != previous_state[2]
-
-        x = new_state[0]
-        y = new_state[1]                
+        return self._process_state()
+
+    async def aupdate(self):
+        """
+        Coroutine version of update().
+        """
+        if self._oversampling > 1:
+            data = self._read_buffer
+            x = 0
+            y = 0
+            for _ in range(self._oversampling):
+                await self.aread(data)
+                x += data[1]
+                y += data[2]
+            return self._process_state((x << _FIXED_POINT_SHIFT) // self._oversampling, (y << _FIXED_POINT_SHIFT) // self._oversampling)
+        await self.aread(self._read_buffer)
+        return self._process_state()
+
+    def _process_state(self, x=None, y=None):
+        """
+        Evaluates the joystick state in the read buffer and calls the corresponding callbacks.
+
+        Parameters:
+            x (int): The fixed point x-coordinate if it has been sampled already, e.g. with oversampling.
+            y (int): The fixed point y-coordinate if it has been sampled already.
+        """
+        data = self._read_buffer # The first byte is the pinstrap address
+        if x is None:
+            x = data[1] << _FIXED_POINT_SHIFT
+            y = data[2] << _FIXED_POINT_SHIFT
+        button_state = data[3]
+        previous_button_state = self._button_state
+        self._button_state = button_state
+        current_timestamp = ticks_ms()
+        button_state_changed = button_state != previous_button_state
+
         x, y = self._normalize_coordinates(x, y)
-        x_y_changed = self._values_changed(x, self._x, y, self._y)
+        x_y_changed = self._values_changed(self._x, x, self._y, y, self._change_threshold)
         
         if x_y_changed:
             self._x = x
             self._y = y
         
         # Check for long press
-        if(new_state[2] == 1 and previous_state[2] == 1 and self._last_press_timestamp and current_timestamp - self._last_press_timestamp > self.long_press_duration):
+        if(button_state == 1 and previous_button_state == 1 and self._last_press_timestamp and current_timestamp - self._last_press_timestamp > self.long_press_duration):
             self._last_press_timestamp = None
             if self._on_button_long_press:
                 self._on_button_long_press()
 
         if button_state_changed:
-            self._button_pressed = bool(new_state[2] & 0x01)
+            self._button_pressed = bool(button_state & 0x01)
 
             # Handle button press and release events
-            if new_state[2] == 1 and previous_state[2] == 0:
-                self._last_press_timestamp = ticks_ms()
+            if button_state == 1 and previous_button_state == 0:
+                self._last_press_timestamp = current_timestamp
                 if self._on_button_press:
                     self._on_button_press()
-            elif new_state[2] == 0 and previous_state[2] == 1 and self._on_button_release:
+            elif button_state == 0 and previous_button_state == 1 and self._on_button_release:
                 self._on_button_release()
 
+        if self._gestures is not None:
+            self._gestures.feed(button_state & 0x01, current_timestamp)
+
         return x_y_changed or button_state_changed
 
+    def calibrate(self, samples: int = 16, interval_ms: int = 5) -> None:
+        """
+        Measures the center position of the joystick. The stick must not be touched during the calibration.
+        Afterwards the extents of the stick are learned while it's used: the coordinates are scaled
+        so that the largest deflection seen in each direction maps to the end of the range.
+
+        Parameters:
+            samples (int): The amount of samples to average.
+            interval_ms (int): The time between two samples in milliseconds.
+        """
+        if samples <= 0:
+            raise ValueError("The amount of samples must be positive")
+        data = self._read_buffer
+        x = 0
+        y = 0
+        for i in range(samples):
+            if i > 0:
+                sleep_ms(interval_ms)
+            self.read(data)
+            x += data[1]
+            y += data[2]
+        self._center_x = (x << _FIXED_POINT_SHIFT) // samples
+        self._center_y = (y << _FIXED_POINT_SHIFT) // samples
+        extent = self.default_calibrated_extent << _FIXED_POINT_SHIFT
+        self._extent_x_positive = extent
+        self._extent_x_negative = extent
+        self._extent_y_positive = extent
+        self._extent_y_negative = extent
+        self._filtered_x = None
+        self._filtered_y = None
+        self._calibrated = True
+
+    def reset_calibration(self) -> None:
+        """
+        Discards the calibration and goes back to the nominal center and range.
+        """
+        self._center_x = _DEFAULT_CENTER
+        self._center_y = _DEFAULT_CENTER
+        self._extent_x_positive = _DEFAULT_EXTENT
+        self._extent_x_negative = _DEFAULT_EXTENT
+        self._extent_y_positive = _DEFAULT_EXTENT
+        self._extent_y_negative = _DEFAULT_EXTENT
+        self._calibrated = False
+
+    @property
+    def calibrated(self) -> bool:
+        """
+        Returns True if the joystick has been calibrated with calibrate().
+        """
+        return self._calibrated
+
     @property
     def button_pressed(self):
         """
@@ -130,6 +297,7 @@ class ModulinoJoystick(Modulino):
     def deadzone_threshold(self) -> int:
         """
         Returns the deadzone threshold for joystick movement.
+        It's the radius around the center within which the position is reported as 0, 0.
         """
         return self._deadzone_threshold
 
@@ -145,6 +313,78 @@ class ModulinoJoystick(Modulino):
             raise ValueError("Deadzone threshold must be non-negative.")
         self._deadzone_threshold = value
 
+    @property
+    def change_threshold(self) -> int:
+        """
+        Returns the minimum change of a coordinate that is reported as a change by update().
+        """
+        return self._change_threshold
+
+    @change_threshold.setter
+    def change_threshold(self, value: int):
+        """
+        Sets the minimum change of a coordinate that is reported as a change by update().
+        Smaller changes (e.g. noise) don't update x and y.
+
+        Parameters:
+            value (int): The threshold in coordinate units.
+        """
+        if value < 0:
+            raise ValueError("Change threshold must be non-negative.")
+        self._change_threshold = value
+
+    @property
+    def smoothing(self) -> int:
+        """
+        Returns the strength of the low-pass filter. 0 means that the filter is disabled.
+        """
+        return self._smoothing
+
+    @smoothing.setter
+    def smoothing(self, value: int):
+        """
+        Sets the strength of the low-pass filter that smooths the position.
+        Every sample contributes 1 / 2^value to the filtered position, so higher values
+        suppress more noise but make the position follow the stick more slowly.
+
+        Parameters:
+            value (int): The strength between 0 (disabled) and 7.
+        """
+        if value < 0 or value > 7:
+            raise ValueError("Smoothing must be between 0 and 7.")
+        self._smoothing = value
+
+    @property
+    def oversampling(self) -> int:
+        """
+        Returns the amount of reads that are averaged per update.
+        """
+        return self._oversampling
+
+    @oversampling.setter
+    def oversampling(self, value: int):
+        """
+        Sets the amount of reads that are averaged per update to reduce the noise.
+        Each read is a separate transaction on the bus.
+
+        Parameters:
+            value (int): The amount of reads, 1 disables the oversampling.
+        """
+        if value < 1:
+            raise ValueError("Oversampling must be at least 1.")
+        self._oversampling = value
+
+    @property
+    def gestures(self):
+        """
+        The GestureRecognizer of the joystick button (index 0), e.g. to detect double clicks or auto-repeat.
+        It's created on first access and fed by update().
+        """
+        if self._gestures is None:
+            from .gestures import GestureRecognizer
+            self._gestures = GestureRecognizer(1)
+        return self._gestures
+
     @property
     def on_button_press(self):
         """
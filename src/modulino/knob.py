@@ -1,4 +1,5 @@
 from .modulino import Modulino
+from time import ticks_ms, ticks_diff
 
 class ModulinoKnob(Modulino):
   """
@@ -8,8 +9,11 @@ class ModulinoKnob(Modulino):
   # This module can have one of two default addresses
   # This is for a use case where two encoders are bundled together in a package
   default_addresses = [0x74, 0x76]
+
+  # (maximum milliseconds per detent, multiplier) pairs from slow to fast, see the acceleration property
+  default_acceleration = ((40, 2), (20, 4), (10, 8))
   
-  def __init__(self, i2c_bus = None, address = None, check_connection: bool = True):
+  def __init__(self, i2c_bus = None, address = None, check_connection: bool = True, defer_init: bool = False):
     """
     Initializes the Modulino Knob.
 
@@ -17,6 +21,8 @@ class ModulinoKnob(Modulino):
         i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
         address (int): The I2C address of the module. If not provided, the default address will be used.
         check_connection (bool): Whether to check the connection to the module.
+        defer_init (bool): Whether to postpone the detection of the firmware's set command bug
+                           until the value is set for the first time.
     """
 
     super().__init__(i2c_bus, address, "Knob", check_connection=check_connection)
@@ -25,80 +31,117 @@ class ModulinoKnob(Modulino):
     self._encoder_value: int = None
     self._value_range: tuple[int, int] = None
 
+    # The value reported by the module and the difference to the value of this object
+    # that is caused by the acceleration
+    self._raw_value: int = None
+    self._offset: int = 0
+    self._steps: int = 0 # Steps of the last read, including the acceleration
+    self._acceleration: tuple = None
+    self._last_rotation_timestamp: int = 0
+
+    # Rotation events can be coalesced, see the coalesce_ms property
+    self._coalesce_ms: int = 0
+    self._pending_steps: int = 0
+    self._last_event_timestamp: int = 0
+    self._last_callback_duration: int = 0
+
     # Encoder callbacks
     self._on_rotate_clockwise = None
     self._on_rotate_counter_clockwise = None
     self._on_press = None
     self._on_release = None
-
-    # Detect bug in the set command that would make
-    # the encoder value become negative after setting it to x with x != 0 
-    self._set_bug_detected: bool = False
-    self._read_data()
-    original_value: int = self._encoder_value
-    self.value = 100
-    self._read_data()    
-    
-    # If the value is not 100, then the set command has a bug
-    if (self._encoder_value != 100):
-      self._set_bug_detected = True
-    
-    self.value = original_value
-
-    # Reset state to make sure the first update doesn't trigger the callbacks
+    self._gestures = None
+
+    # None until the set command bug detection has run
+    self._set_bug_detected: bool = None
+    if not defer_init:
+      self._detect_set_bug()
+      # Reset state to make sure the first update doesn't trigger the callbacks
+      self._encoder_value = None
+      self._raw_value = None
+      self._pressed = None
+
+  def _detect_set_bug(self) -> None:
+    """
+    Detects the bug in the set command that would make
+    the encoder value become negative after setting it to x with x != 0.
+    The encoder value is restored afterwards.
+    """
+    # The range may already be set if the detection was deferred.
+    # It's disabled so that reading the test value doesn't get constrained.
+    value_range = self._value_range
+    self._value_range = None
+    self._set_bug_detected = False
+    try:
+      self._read_data()
+      original_value: int = self._encoder_value
+      self._write_value(100)
+      self._read_data()
+
+      # If the value is not 100, then the set command has a bug
+      if (self._encoder_value != 100):
+        self._set_bug_detected = True
+
+      self._write_value(-original_value if self._set_bug_detected else original_value)
+      self._encoder_value = original_value
+      self._raw_value = original_value
+      self._offset = 0
+    finally:
+      self._value_range = value_range
+
+  def _on_reconnected(self) -> None:
+    # The module restarted with the counter at 0 and possibly a different firmware.
+    # The next update reads the new baseline without calling the callbacks.
+    self._set_bug_detected = None
+    self._raw_value = None
     self._encoder_value = None
-    self._pressed_status: bool = None
+    self._pressed = None
+    self._offset = 0
+    self._pending_steps = 0
 
-  @property
-  def send_buffer_size(self) -> int:
-    return 4
-
-  def _has_rotated_clockwise(self, previous_value: int, current_value: int) -> bool:
+  def _write_value(self, target_value: int) -> bool:
     """
-    Determines if the encoder has rotated clockwise.
+    Writes the raw encoder value to the module without any range check or bug compensation.
 
     Parameters:
-        previous_value (int): The previous value of the encoder.
-        current_value (int): The current value of the encoder.
+        target_value (int): The value to send.
 
     Returns:
-        bool: True if the encoder has rotated clockwise.
+        bool: True if the value was written successfully.
     """
-    # Calculate difference considering wraparound
-    diff: int = (current_value - previous_value + 65536) % 65536
-    # Clockwise rotation is indicated by a positive difference less than half the range
-    return 0 < diff < 32768
-
-  def _has_rotated_counter_clockwise(self, previous_value: int, current_value: int) -> bool:
-      """
-      Determines if the encoder has rotated counter clockwise.
-
-      Parameters:
-          previous_value (int): The previous value of the encoder.
-          current_value (int): The current value of the encoder.
+    buf: bytearray = bytearray(4)
+    buf[0:2] = target_value.to_bytes(2, 'little')
+    return self.write(buf)
 
-      Returns:
-          bool: True if the encoder has rotated counter clockwise.
-      """
-      # Calculate difference considering wraparound
-      diff: int = (previous_value - current_value + 65536) % 65536
-      # Counter-clockwise rotation is indicated by a positive difference less than half the range
-      return 0 < diff < 32768
+  @property
+  def send_buffer_size(self) -> int:
+    return 4
 
   def _get_steps(self, previous_value: int, current_value: int) -> int:
     """
     Calculates the number of steps the encoder has moved since the last update.
+    Positive steps are clockwise, negative steps counter clockwise.
     """
-    # Calculate difference considering wraparound
-    diff: int = (current_value - previous_value + 65536) % 65536
-    # Clockwise rotation is indicated by a positive difference less than half the range
-    if 0 < diff < 32768:
+    # Calculate difference considering the wraparound of the 16 bit counter
+    diff: int = (current_value - previous_value) & 0xFFFF
+    if diff < 32768:
       return diff
-    # Counter-clockwise rotation is indicated by a negative difference less than half the range
-    elif 32768 < diff < 65536:
-      return diff - 65536
-    else:
-      return 0
+    # A difference of exactly half the range has no direction
+    return diff - 65536 if diff > 32768 else 0
+
+  def _accelerate(self, steps: int) -> int:
+    """
+    Scales the steps according to the rotation velocity, see the acceleration property.
+    """
+    now = ticks_ms()
+    elapsed = ticks_diff(now, self._last_rotation_timestamp)
+    self._last_rotation_timestamp = now
+    ms_per_step = elapsed // (steps if steps > 0 else -steps)
+    multiplier = 1
+    for max_ms, factor in self._acceleration:
+      if ms_per_step <= max_ms:
+        multiplier = factor
+    return steps * multiplier
 
   def _read_data(self) -> None:
     """
@@ -107,13 +150,33 @@ class ModulinoKnob(Modulino):
     Converts the encoder value to a signed 16-bit integer.
     """
     self.read(self._read_buffer)
-    data: bytes = self._read_buffer[1:] # Skip pinstrap address
-    self._pressed = data[2] != 0
-    self._encoder_value = int.from_bytes(data[0:2], 'little', True)
+    self._parse_data()
+
+  def _parse_data(self) -> None:
+    """
+    Extracts the encoder value and pressed status from the read buffer.
+    """
+    data: bytearray = self._read_buffer # The first byte is the pinstrap address
+    previous_value: int = self._encoder_value
+    self._pressed = data[3] != 0
+    raw_value: int = data[1] | (data[2] << 8)
 
     # Convert to signed int (16 bits), range -32768 to 32767
-    if self._encoder_value >= 32768:
-      self._encoder_value = self._encoder_value - 65536
+    if raw_value >= 32768:
+      raw_value -= 65536
+
+    # The difference to the previous read is computed once and used for all events
+    previous_raw_value: int = self._raw_value
+    self._raw_value = raw_value
+    steps: int = 0
+    if previous_raw_value is not None:
+      steps = self._get_steps(previous_raw_value, raw_value)
+      if steps != 0 and self._acceleration is not None:
+        accelerated_steps: int = self._accelerate(steps)
+        self._offset += accelerated_steps - steps
+        steps = accelerated_steps
+    self._steps = steps
+    self._encoder_value = raw_value + self._offset
 
     if self._value_range is not None:
       # Constrain the value to the range self._value_range[0] to self._value_range[1]
@@ -121,6 +184,8 @@ class ModulinoKnob(Modulino):
       
       if constrained_value != self._encoder_value:
         self.value = constrained_value
+        if previous_value is not None:
+          self._steps = constrained_value - previous_value
 
   def reset(self) -> None:
     """
@@ -138,24 +203,49 @@ class ModulinoKnob(Modulino):
     """
     previous_value: int = self._encoder_value
     previous_pressed_status: bool = self._pressed
-
     self._read_data()
+    return self._process_changes(previous_value, previous_pressed_status)
+
+  async def aupdate(self) -> bool:
+    """
+    Coroutine version of update().
+
+    Returns:
+        bool: True if the encoder value or pressed status has changed.
+    """
+    previous_value: int = self._encoder_value
+    previous_pressed_status: bool = self._pressed
+    await self.aread(self._read_buffer)
+    self._parse_data()
+    return self._process_changes(previous_value, previous_pressed_status)
+
+  def _process_changes(self, previous_value: int, previous_pressed_status: bool) -> bool:
+    """
+    Calls the corresponding callbacks if the encoder value or pressed status has changed.
+
+    Parameters:
+        previous_value (int): The encoder value before the last read.
+        previous_pressed_status (bool): The pressed status before the last read.
+
+    Returns:
+        bool: True if the encoder value or pressed status has changed.
+    """
+    gestures = self._gestures
+    if gestures is not None:
+      gestures.feed(1 if self._pressed else 0)
 
     # No need to execut the callbacks after the first update
     if previous_value is None or previous_pressed_status is None:
       return False
 
-    has_rotated_clockwise: bool = self._has_rotated_clockwise(previous_value, self._encoder_value)
-    has_rotated_counter_clockwise: bool = self._has_rotated_counter_clockwise(previous_value, self._encoder_value)
-
-    # Figure out how many steps the encoder has moved since the last update
-    steps: int = self._get_steps(previous_value, self._encoder_value)
-
-    if self._on_rotate_clockwise and has_rotated_clockwise:
-      self._on_rotate_clockwise(steps, self._encoder_value)
+    steps: int = self._steps
+    if self._coalesce_ms > 0:
+      steps = self._coalesce(steps)
 
-    if self._on_rotate_counter_clockwise and has_rotated_counter_clockwise:
-      self._on_rotate_counter_clockwise(steps, self._encoder_value)
+    if steps > 0 and self._on_rotate_clockwise:
+      self._call_rotation_callback(self._on_rotate_clockwise, steps)
+    elif steps < 0 and self._on_rotate_counter_clockwise:
+      self._call_rotation_callback(self._on_rotate_counter_clockwise, steps)
 
     if self._on_press and self._pressed and not previous_pressed_status:
       self._on_press()
@@ -165,6 +255,80 @@ class ModulinoKnob(Modulino):
 
     return (self._encoder_value != previous_value) or (self._pressed != previous_pressed_status)
 
+  def _coalesce(self, steps: int) -> int:
+    """
+    Accumulates the steps until the coalescing window has passed since the last rotation event.
+
+    Returns:
+        int: The steps to report now or 0 if the event is postponed.
+    """
+    steps += self._pending_steps
+    if steps == 0:
+      self._pending_steps = 0
+      return 0
+    window: int = max(self._coalesce_ms, self._last_callback_duration)
+    if ticks_diff(ticks_ms(), self._last_event_timestamp) < window:
+      self._pending_steps = steps
+      return 0
+    self._pending_steps = 0
+    return steps
+
+  def _call_rotation_callback(self, callback, steps: int) -> None:
+    if self._coalesce_ms > 0:
+      start: int = ticks_ms()
+      callback(steps, self._encoder_value)
+      self._last_event_timestamp = ticks_ms()
+      self._last_callback_duration = ticks_diff(self._last_event_timestamp, start)
+    else:
+      callback(steps, self._encoder_value)
+
+  @property
+  def acceleration(self) -> tuple | None:
+    """
+    Returns the acceleration table or None if the acceleration is disabled.
+    """
+    return self._acceleration
+
+  @acceleration.setter
+  def acceleration(self, value: tuple | None) -> None:
+    """
+    Enables the acceleration of the encoder value when the knob is turned quickly,
+    e.g. to scroll through a long list. The steps of a read are multiplied
+    according to the time per detent since the previous rotation.
+
+    Parameters:
+        value (tuple): Pairs of (maximum milliseconds per detent, multiplier), from slow to fast,
+                       e.g. ModulinoKnob.default_acceleration. None disables the acceleration.
+    """
+    if value is not None:
+      for max_ms, factor in value:
+        if max_ms <= 0 or factor < 1:
+          raise ValueError("The acceleration needs positive durations and multipliers of at least 1")
+    self._acceleration = value
+
+  @property
+  def coalesce_ms(self) -> int:
+    """
+    Returns the minimum time in milliseconds between two rotation events. 0 means that every update reports its steps.
+    """
+    return self._coalesce_ms
+
+  @coalesce_ms.setter
+  def coalesce_ms(self, value: int) -> None:
+    """
+    Sets the minimum time in milliseconds between two rotation events.
+    The steps of the updates in between are added up and reported in one event, so slow callbacks
+    (e.g. redrawing a display) don't fall behind. If a callback takes longer than this time,
+    the events are coalesced for the duration of the callback instead.
+
+    Parameters:
+        value (int): The time in milliseconds. 0 disables the coalescing.
+    """
+    if value < 0:
+      raise ValueError("The coalescing time must not be negative")
+    self._coalesce_ms = value
+    self._pending_steps = 0
+
   @property
   def range(self) -> tuple[int, int]:
     """
@@ -194,6 +358,17 @@ class ModulinoKnob(Modulino):
     elif self.value > self._value_range[1]:
       self.value = self._value_range[1]
 
+  @property
+  def gestures(self):
+    """
+    The GestureRecognizer of the knob's push button (index 0), e.g. to detect double clicks or auto-repeat.
+    It's created on first access and fed by update().
+    """
+    if self._gestures is None:
+      from .gestures import GestureRecognizer
+      self._gestures = GestureRecognizer(1)
+    return self._gestures
+
   @property
   def on_rotate_clockwise(self):
     """
@@ -281,16 +456,18 @@ class ModulinoKnob(Modulino):
       if new_value < self._value_range[0] or new_value > self._value_range[1]:
         raise ValueError(f"Value {new_value} is out of range ({self._value_range[0]} to {self._value_range[1]})")
 
+    if self._set_bug_detected is None:
+      self._detect_set_bug()
+
     if self._set_bug_detected:
       target_value: int = -new_value
     else:
       target_value: int = new_value
 
-    buf: bytearray = bytearray(4)
-    buf[0:2] = target_value.to_bytes(2, 'little')
-
-    if self.write(buf):
+    if self._write_value(target_value):
       self._encoder_value = new_value
+      self._raw_value = new_value
+      self._offset = 0
 
   @property
   def pressed(self) -> bool:
@@ -3,7 +3,8 @@ import asyncio
 from micropython import const
 from modulino import Modulino
 from framebuf import FrameBuffer, GS4_HMSB, MONO_VLSB
-from time import sleep_ms
+from .gamma import GAMMA_4BIT
+from time import sleep_ms, ticks_ms, ticks_add, ticks_diff
 
 _MONOCHROME = const(b'MON')
 _GRAYSCALE = const(b'GS4')
@@ -12,6 +13,54 @@ _FRAME_LOAD_DELAY_MS = const(5)  # Time to load each frame onto the LED matrix
 _MATRIX_WIDTH = const(12)
 _MATRIX_HEIGHT = const(8)
 
+_MLA_MAGIC = const(b'MLA\x01') # Format identifier and version of MLA files
+_MLA_HEADER_SIZE = const(8)
+
+# Operations of the delta encoding, see DeltaAnimation
+_DELTA_LITERAL = const(0x80) # Opcodes below this value skip unchanged bytes
+_DELTA_RUN = const(0xC0) # Opcodes below this value copy literal bytes, from here on they repeat a byte
+
+def _decode_delta_frame(data, offset: int, buffer: bytearray) -> int:
+    """
+    Decodes one delta encoded frame on top of the previous frame.
+    The buffer is modified in place, no memory is allocated.
+
+    Parameters:
+        data (bytes | bytearray): The encoded frames.
+        offset (int): The position of the frame in data.
+        buffer (bytearray): The buffer that contains the previous frame.
+
+    Returns:
+        int: The position of the next frame in data.
+    """
+    position = 0
+    size = len(buffer)
+    while position < size:
+        op = data[offset]
+        offset += 1
+        if op < _DELTA_LITERAL:
+            # Skip op + 1 unchanged bytes
+            position += op + 1
+        elif op < _DELTA_RUN:
+            # Copy op - 0x7F literal bytes
+            end = position + op - (_DELTA_LITERAL - 1)
+            while position < end:
+                buffer[position] = data[offset]
+                position += 1
+                offset += 1
+        else:
+            # Repeat the next byte op - 0xBF times
+            value = data[offset]
+            offset += 1
+            end = position + op - (_DELTA_RUN - 1)
+            while position < end:
+                buffer[position] = value
+                position += 1
+
+    if position != size:
+        raise ValueError("Delta encoded frame doesn't match the frame size")
+    return offset
+
 class ModulinoLEDMatrix(Modulino):
     """
     Class to control the LED Matrix module of the Modulino.
@@ -19,7 +68,7 @@ class ModulinoLEDMatrix(Modulino):
 
     default_addresses = [0x72]
 
-    def __init__(self, i2c_bus=None, address=None, use_grayscale: bool = False, check_connection: bool = True):
+    def __init__(self, i2c_bus=None, address=None, use_grayscale: bool = False, check_connection: bool = True, defer_init: bool = False):
         """
         Initializes the Modulino LED Matrix.
 
@@ -28,6 +77,7 @@ class ModulinoLEDMatrix(Modulino):
             address (int): The I2C address of the module. If not provided, the default address will be used.
             use_grayscale (bool): Whether to use grayscale mode.
             check_connection (bool): Whether to check the connection to the module.
+            defer_init (bool): Whether to postpone switching the display mode until the first frame is shown.
         """
         super().__init__(i2c_bus, address, "LED Matrix", check_connection=check_connection)
         self._width = 12
@@ -39,7 +89,23 @@ class ModulinoLEDMatrix(Modulino):
         self._framebuf = None
         self._prev_data_buffer = None
         self._default_color = 1
-        self.use_grayscale = use_grayscale
+        self._mode_pending = False # Whether the display mode still needs to be sent to the module
+
+        # Region that has been drawn to since the last show(), x0 >= x1 means nothing was drawn.
+        self._dirty_x0 = 0
+        self._dirty_y0 = 0
+        self._dirty_x1 = 0
+        self._dirty_y1 = 0
+
+        # Statistics of show()
+        self._frames_shown = 0
+        self._bytes_saved = 0
+
+        if defer_init:
+            self._set_display_mode(_GRAYSCALE if use_grayscale else _MONOCHROME)
+            self._mode_pending = True
+        else:
+            self.use_grayscale = use_grayscale
 
     def _read_mode(self) -> bytes:
         """
@@ -73,25 +139,154 @@ class ModulinoLEDMatrix(Modulino):
             return
      
         new_mode = _GRAYSCALE if value else _MONOCHROME
+        if self._write_mode(new_mode):
+            self._mode_pending = False
+            self._set_display_mode(new_mode)
+
+    def _write_mode(self, new_mode: bytes, skip_if_current: bool = False) -> bool:
+        """
+        Sends the command to switch the display mode to the LED matrix.
+
+        Parameters:
+            new_mode (bytes): The display mode to switch to.
+            skip_if_current (bool): Whether to skip the command if the module is already in the given mode.
+
+        Returns:
+            bool: True if the module is in the given mode afterwards.
+        """
         current_mode = self._read_mode()
+        if skip_if_current and current_mode == new_mode:
+            return True
         expected_bytes = 48 if current_mode == _GRAYSCALE else 12
         buffer = new_mode
         buffer += b'\x00' * (expected_bytes - len(buffer)) # Pad to expected size
-        
-        if self.write(buffer):
-            self._display_mode = new_mode
-            if new_mode == _MONOCHROME:
-                buffer_size = self._width * self._height // 8  # 12 bytes
-                framebuf_format = MONO_VLSB
-                self._default_color = 1
-            else:
-                buffer_size = self._width * self._height // 2  # 48 bytes
-                framebuf_format = GS4_HMSB
-                self._default_color = 15
-
-            self._framebuf_buffer = bytearray(buffer_size)
-            self._prev_data_buffer = bytearray(buffer_size)
-            self._framebuf = FrameBuffer(self._framebuf_buffer, self._width, self._height, framebuf_format)
+        return self.write(buffer)
+
+    def _set_display_mode(self, new_mode: bytes) -> None:
+        """
+        Allocates the frame buffer for the given display mode.
+
+        Parameters:
+            new_mode (bytes): The display mode to allocate the frame buffer for.
+        """
+        self._display_mode = new_mode
+        if new_mode == _MONOCHROME:
+            buffer_size = self._width * self._height // 8  # 12 bytes
+            framebuf_format = MONO_VLSB
+            self._default_color = 1
+        else:
+            buffer_size = self._width * self._height // 2  # 48 bytes
+            framebuf_format = GS4_HMSB
+            self._default_color = 15
+
+        self._framebuf_buffer = bytearray(buffer_size)
+        self._prev_data_buffer = bytearray(buffer_size)
+        self._framebuf = FrameBuffer(self._framebuf_buffer, self._width, self._height, framebuf_format)
+        self._mark_all_dirty()
+
+    def _on_reconnected(self) -> None:
+        # The module restarted in monochrome mode with a blank display.
+        # Send the mode on the next show() followed by the whole frame.
+        self._mode_pending = True
+        self._prev_data_buffer[:] = bytes(len(self._prev_data_buffer))
+        self._mark_all_dirty()
+
+    def _mark_dirty(self, x: int, y: int, width: int, height: int) -> None:
+        """
+        Extends the dirty region by the given rectangle.
+        The rectangle is clipped to the size of the matrix.
+
+        Parameters:
+            x (int): The x-coordinate of the top-left corner of the rectangle.
+            y (int): The y-coordinate of the top-left corner of the rectangle.
+            width (int): The width of the rectangle.
+            height (int): The height of the rectangle.
+        """
+        x1 = min(x + width, _MATRIX_WIDTH)
+        y1 = min(y + height, _MATRIX_HEIGHT)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x >= x1 or y >= y1:
+            return
+
+        if self._dirty_x0 >= self._dirty_x1:
+            self._dirty_x0 = x
+            self._dirty_y0 = y
+            self._dirty_x1 = x1
+            self._dirty_y1 = y1
+            return
+
+        if x < self._dirty_x0:
+            self._dirty_x0 = x
+        if y < self._dirty_y0:
+            self._dirty_y0 = y
+        if x1 > self._dirty_x1:
+            self._dirty_x1 = x1
+        if y1 > self._dirty_y1:
+            self._dirty_y1 = y1
+
+    def _mark_all_dirty(self) -> None:
+        """
+        Marks the whole matrix as dirty.
+        """
+        self._dirty_x0 = 0
+        self._dirty_y0 = 0
+        self._dirty_x1 = _MATRIX_WIDTH
+        self._dirty_y1 = _MATRIX_HEIGHT
+
+    def mark_dirty(self, x: int = 0, y: int = 0, width: int = _MATRIX_WIDTH, height: int = _MATRIX_HEIGHT):
+        """
+        Marks a region as changed so that the next show() sends the frame.
+        The drawing methods do this automatically. Call it after writing into the frame buffer directly
+        (e.g. through a FrameBuffer of your own that shares the buffer), otherwise show() doesn't notice the change.
+
+        Parameters:
+            x (int): The x-coordinate of the top-left corner of the region (0-11).
+            y (int): The y-coordinate of the top-left corner of the region (0-7).
+            width (int): The width of the region. Defaults to the whole matrix.
+            height (int): The height of the region. Defaults to the whole matrix.
+        """
+        self._mark_dirty(x, y, width, height)
+        return self
+
+    @property
+    def dirty_region(self) -> tuple[int, int, int, int] | None:
+        """
+        The region that has been drawn to since the last call of show().
+        The firmware only accepts complete frames, so the region doesn't make a transfer smaller.
+        show() only uses it to skip frames that nothing has been drawn to.
+
+        Returns:
+            tuple | None: The region as (x, y, width, height) or None if nothing has been drawn.
+        """
+        if self._dirty_x0 >= self._dirty_x1:
+            return None
+        return (self._dirty_x0, self._dirty_y0, self._dirty_x1 - self._dirty_x0, self._dirty_y1 - self._dirty_y0)
+
+    @property
+    def bytes_saved(self) -> int:
+        """
+        The amount of bytes that show() didn't need to send since the last reset
+        of the statistics, because the content of the frame hadn't changed.
+        Only frames that have been skipped entirely count, a changed frame is always sent as a whole.
+        """
+        return self._bytes_saved
+
+    @property
+    def bytes_saved_per_frame(self) -> float:
+        """
+        The average amount of bytes saved per call of show() since the last reset of the statistics.
+        """
+        if self._frames_shown == 0:
+            return 0
+        return self._bytes_saved / self._frames_shown
+
+    def reset_stats(self) -> None:
+        """
+        Resets the statistics of show().
+        """
+        self._frames_shown = 0
+        self._bytes_saved = 0
 
     def _normalize_color(self, color: int | None) -> int:
         """
@@ -117,6 +312,49 @@ class ModulinoLEDMatrix(Modulino):
             raise ValueError(f"Data length must be {self.send_buffer_size} bytes")
         
         self._framebuf_buffer[:] = data
+        self._mark_all_dirty()
+        return self
+
+    @staticmethod
+    def gray_level(intensity: int) -> int:
+        """
+        Returns the grayscale color (0-15) that is perceived as the given intensity.
+        The levels of the LEDs are linear, so e.g. an intensity of 128 maps to the color 2, not 8.
+        Use it to get even fades.
+
+        Parameters:
+            intensity (int): The perceived intensity (0-255).
+        Returns:
+            int: The grayscale color (0-15).
+        """
+        if intensity < 0 or intensity > 255:
+            raise ValueError(f"Intensity {intensity} should be between 0 and 255")
+        return GAMMA_4BIT[intensity]
+
+    def set_frame_from_intensities(self, data: bytes | bytearray):
+        """
+        Sets the LED matrix frame from 8-bit intensities, e.g. a grayscale image.
+        In grayscale mode the intensities are gamma corrected (see gray_level()),
+        in monochrome mode the pixels with an intensity of 128 or more are turned on.
+
+        Parameters:
+            data (bytes | bytearray): 96 intensities (0-255), row by row starting at the top left.
+        """
+        if len(data) != _MATRIX_WIDTH * _MATRIX_HEIGHT:
+            raise ValueError(f"Data length must be {_MATRIX_WIDTH * _MATRIX_HEIGHT} bytes")
+
+        if self.use_grayscale:
+            buffer = self._framebuf_buffer
+            # Two pixels per byte, the left one in the high nibble
+            for i in range(len(buffer)):
+                buffer[i] = GAMMA_4BIT[data[2 * i]] << 4 | GAMMA_4BIT[data[2 * i + 1]]
+        else:
+            framebuf = self._framebuf
+            for y in range(_MATRIX_HEIGHT):
+                row = y * _MATRIX_WIDTH
+                for x in range(_MATRIX_WIDTH):
+                    framebuf.pixel(x, y, 1 if data[row + x] >= 128 else 0)
+        self._mark_all_dirty()
         return self
 
     def set_frame_from_ascii(self, ascii_art: str, fill_char: str = '#', color: int = None):
@@ -136,6 +374,7 @@ class ModulinoLEDMatrix(Modulino):
             for x, char in enumerate(line):
                 if x < self._width and y < self._height:
                     self._framebuf.pixel(x, y, color if char == fill_char else 0)
+        self._mark_all_dirty()
         return self
 
     def fill(self, color: int = None):
@@ -147,6 +386,7 @@ class ModulinoLEDMatrix(Modulino):
         """
         color = self._normalize_color(color)
         self._framebuf.fill(color)
+        self._mark_all_dirty()
         return self
 
     def get_pixel(self, x, y) -> bool:
@@ -178,6 +418,7 @@ class ModulinoLEDMatrix(Modulino):
 
         color = self._normalize_color(color)
         self._framebuf.pixel(x, y, color)
+        self._mark_dirty(x, y, 1, 1)
         return self
 
     def clear_pixel(self, x, y):
@@ -202,6 +443,7 @@ class ModulinoLEDMatrix(Modulino):
         """
         color = self._normalize_color(color)
         self._framebuf.hline(x, y, length, color)
+        self._mark_dirty(x, y, length, 1)
         return self
     
     def vline(self, x, y, length, color = None):
@@ -216,6 +458,7 @@ class ModulinoLEDMatrix(Modulino):
         """
         color = self._normalize_color(color)
         self._framebuf.vline(x, y, length, color)
+        self._mark_dirty(x, y, 1, length)
         return self
 
     def line(self, x1, y1, x2, y2, color = None):
@@ -231,6 +474,7 @@ class ModulinoLEDMatrix(Modulino):
         """
         color = self._normalize_color(color)
         self._framebuf.line(x1, y1, x2, y2, color)
+        self._mark_dirty(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
         return self
 
     def rect(self, x, y, width, height, color = None):
@@ -246,6 +490,11 @@ class ModulinoLEDMatrix(Modulino):
         """
         color = self._normalize_color(color)
         self._framebuf.rect(x, y, width, height, color)
+        if width < 1 or height < 1:
+            # The frame buffer still draws the sides of degenerate rectangles
+            self._mark_all_dirty()
+        else:
+            self._mark_dirty(x, y, width, height)
         return self
     
     def ellipse(self, x, y, width, height, color = None):
@@ -261,6 +510,8 @@ class ModulinoLEDMatrix(Modulino):
         """
         color = self._normalize_color(color)
         self._framebuf.ellipse(x, y, width, height, color)
+        # The frame buffer interprets width and height as radii around (x, y)
+        self._mark_dirty(x - width, y - height, 2 * width + 1, 2 * height + 1)
         return self
     
     def poly(self, x, y, points, color = None, fill = False):
@@ -278,6 +529,7 @@ class ModulinoLEDMatrix(Modulino):
         from array import array
         flat_points = array('h', (coord for point in points for coord in point))
         self._framebuf.poly(x, y, flat_points, color, fill)
+        self._mark_all_dirty()
         return self
 
     def text(self, x, y, string, color = None):
@@ -292,6 +544,7 @@ class ModulinoLEDMatrix(Modulino):
         """
         color = self._normalize_color(color)
         self._framebuf.text(string, x, y, color)
+        self._mark_dirty(x, y, 8 * len(string), 8) # The built-in font is 8x8 pixels
         return self
     
     def scroll(self, dx, dy):
@@ -303,6 +556,7 @@ class ModulinoLEDMatrix(Modulino):
             dy (int): The amount to scroll in the y-direction.
         """
         self._framebuf.scroll(dx, dy)
+        self._mark_all_dirty()
         return self
     
     def blit(self, buffer, x, y):
@@ -315,6 +569,8 @@ class ModulinoLEDMatrix(Modulino):
             y (int): The y-coordinate on the LED matrix to blit to (0-7).
         """
         self._framebuf.blit(buffer, x, y)
+        # The size of the source buffer is unknown, so everything from (x, y) on may have changed
+        self._mark_dirty(x, y, _MATRIX_WIDTH - x, _MATRIX_HEIGHT - y)
         return self
 
     def clear(self):
@@ -327,8 +583,31 @@ class ModulinoLEDMatrix(Modulino):
     def show(self):
         """
         Sends the current buffer to the LED matrix to update the display.
+        The frame is only sent if it has been drawn to and its content differs
+        from the last frame that was sent.
+        The firmware only accepts complete frames, so a changed frame
+        is always sent as a whole, regardless of the size of the dirty region.
+        Changes that bypass the drawing methods need to be announced with mark_dirty().
         """
+        self._frames_shown += 1
+        if self._mode_pending:
+            if not self._write_mode(self._display_mode, skip_if_current=True):
+                return self
+            self._mode_pending = False
+            self.write(self._framebuf_buffer)
+            self._prev_data_buffer[:] = self._framebuf_buffer
+            self._dirty_x1 = self._dirty_x0
+            return self
+
+        if self._dirty_x0 >= self._dirty_x1:
+            # Nothing has been drawn since the last frame
+            self._bytes_saved += len(self._framebuf_buffer)
+            return self
+        self._dirty_x1 = self._dirty_x0
+
         if self._prev_data_buffer is not None and self._framebuf_buffer == self._prev_data_buffer:
+            # Drawing didn't change the content
+            self._bytes_saved += len(self._framebuf_buffer)
             return self
 
         self.write(self._framebuf_buffer)
@@ -340,9 +619,15 @@ class Animation:
     """
     Class to represent a timed animation for the LED Matrix.
     Each frame can have its own display duration.
+
+    The frames are scheduled against absolute deadlines, so the time it takes
+    to send a frame doesn't accumulate as drift. The transfer time is measured
+    for every frame and the next frame is sent early enough to appear on time.
+    Statistics about the last playback are available through
+    frames_shown, frames_dropped, achieved_fps, jitter_ms and max_jitter_ms.
     """
 
-    def __init__(self, led_matrix : ModulinoLEDMatrix, frames: list[tuple[bytes | bytearray, int]], async_mode: bool = False):
+    def __init__(self, led_matrix : ModulinoLEDMatrix, frames: list[tuple[bytes | bytearray, int]], async_mode: bool = False, drop_frames: bool = False):
         """
         Initializes the Animation.
 
@@ -351,14 +636,21 @@ class Animation:
             frames (list[tuple[bytes | bytearray, int]]): A list of tuples, each containing a frame (bytes or bytearray)
                                                           and its display duration in milliseconds.
             async_mode (bool): If True, play() returns a coroutine that can be awaited.
+            drop_frames (bool): What to do when the playback falls behind, e.g. because the bus is busy.
+                                If True, frames whose display time has already passed are skipped.
+                                If False, all frames are shown and the playback catches up by shortening the waits.
         """
         self._led_matrix = led_matrix
         self._frames = frames
         self._async_mode = async_mode
+        self._drop_frames = drop_frames
+        self._transfer_ms = _FRAME_LOAD_DELAY_MS # Estimated time it takes to send a frame
+        self.reset_stats()
 
     def _generate_frames(self, loop: bool):
         """
         Generator that yields frames and their display durations for the animation.
+        Subclasses that write the frame into the LED matrix buffer themselves yield None as frame.
 
         Parameters:
             loop (bool): If True, the generator will yield frames indefinitely.
@@ -369,6 +661,52 @@ class Animation:
             if not loop:
                 break
 
+    def _schedule(self, loop: bool):
+        """
+        Generator that shows the frames at their deadlines.
+        It yields the time in milliseconds the caller needs to wait before it resumes the generator.
+        It yields before every frame, 0 if the frame is already late, so that async playback
+        always gives the other tasks a chance to run.
+
+        Parameters:
+            loop (bool): If True, the animation will loop indefinitely.
+        """
+        matrix = self._led_matrix
+        self.reset_stats()
+        deadline = ticks_ms() # The time at which the next frame should become visible
+
+        for frame, duration in self._generate_frames(loop):
+            # Start sending the frame early enough so that it's visible at its deadline
+            yield max(0, ticks_diff(deadline, ticks_ms()) - self._transfer_ms)
+
+            if self._drop_frames and ticks_diff(ticks_ms(), deadline) >= duration:
+                # The display time of this frame is already over
+                self._frames_dropped += 1
+                deadline = ticks_add(deadline, duration)
+                continue
+
+            start = ticks_ms()
+            if frame is not None:
+                matrix.set_frame(frame)
+            matrix.show()
+            end = ticks_ms()
+
+            # Moving average of the transfer time
+            self._transfer_ms = (3 * self._transfer_ms + ticks_diff(end, start) + 2) // 4
+
+            jitter = abs(ticks_diff(end, deadline))
+            self._jitter_sum += jitter
+            if jitter > self._max_jitter:
+                self._max_jitter = jitter
+            if self._frames_shown == 0:
+                self._first_frame_ms = end
+            self._last_frame_ms = end
+            self._frames_shown += 1
+            deadline = ticks_add(deadline, duration)
+
+        # Keep the last frame visible for its whole duration
+        yield max(0, ticks_diff(deadline, ticks_ms()))
+
     def play(self, loop: bool = False):
         """
         Plays the timed animation on the LED matrix.
@@ -379,21 +717,68 @@ class Animation:
         if self._async_mode:
             return self._play_async(loop)
 
-        matrix = self._led_matrix
-        for frame, duration in self._generate_frames(loop):
-            matrix.set_frame(frame).show()
-            # Subtract frame load delay as the current frame
-            # will keep displaying while the next frame is being loaded
-            sleep_ms(max(0, duration - _FRAME_LOAD_DELAY_MS))
+        for wait in self._schedule(loop):
+            if wait > 0:
+                sleep_ms(wait)
 
     async def _play_async(self, loop: bool = False):
         import asyncio
-        matrix = self._led_matrix
-        for frame, duration in self._generate_frames(loop):
-            matrix.set_frame(frame).show()
-            # Subtract frame load delay as the current frame
-            # will keep displaying while the next frame is being loaded
-            await asyncio.sleep_ms(max(0, duration - _FRAME_LOAD_DELAY_MS))
+        for wait in self._schedule(loop):
+            await asyncio.sleep_ms(wait)
+
+    def reset_stats(self) -> None:
+        """
+        Resets the playback statistics. This happens automatically when the playback starts.
+        """
+        self._frames_shown = 0
+        self._frames_dropped = 0
+        self._jitter_sum = 0
+        self._max_jitter = 0
+        self._first_frame_ms = 0
+        self._last_frame_ms = 0
+
+    @property
+    def frames_shown(self) -> int:
+        """
+        Returns the number of frames that have been shown during the last playback.
+        """
+        return self._frames_shown
+
+    @property
+    def frames_dropped(self) -> int:
+        """
+        Returns the number of frames that have been skipped during the last playback
+        because they were late. Frames are only dropped if drop_frames is enabled.
+        """
+        return self._frames_dropped
+
+    @property
+    def achieved_fps(self) -> float:
+        """
+        Returns the frame rate that has been achieved during the last playback.
+        """
+        elapsed = ticks_diff(self._last_frame_ms, self._first_frame_ms)
+        if self._frames_shown < 2 or elapsed <= 0:
+            return 0
+        return (self._frames_shown - 1) * 1000 / elapsed
+
+    @property
+    def jitter_ms(self) -> float:
+        """
+        Returns the average deviation in milliseconds between the time a frame became visible
+        and the time it was scheduled for during the last playback.
+        """
+        if self._frames_shown == 0:
+            return 0
+        return self._jitter_sum / self._frames_shown
+
+    @property
+    def max_jitter_ms(self) -> int:
+        """
+        Returns the largest deviation in milliseconds between the time a frame became visible
+        and the time it was scheduled for during the last playback.
+        """
+        return self._max_jitter
 
     @property
     def frame_count(self) -> int:
@@ -408,9 +793,10 @@ class FPSAnimation(Animation):
     Each frame is displayed for a duration based on the specified frames per second (FPS).
     The frame rate is achieved by calculating the delay between frames and accounting for 
     the time it takes to load each frame onto the LED matrix.
+    Use achieved_fps and jitter_ms to check how well the target frame rate was met.
     """
 
-    def __init__(self, led_matrix : ModulinoLEDMatrix, frames: list[bytes | bytearray], fps: int, async_mode: bool = False):
+    def __init__(self, led_matrix : ModulinoLEDMatrix, frames: list[bytes | bytearray], fps: int, async_mode: bool = False, drop_frames: bool = False):
         """
         Initializes the FPSAnimation.
 
@@ -419,23 +805,114 @@ class FPSAnimation(Animation):
             frames (list[bytes | bytearray]): A list of frames, each represented as bytes or bytearray.
             fps (int): The frames per second for the animation.
             async_mode (bool): If True, play() returns a coroutine that can be awaited.
+            drop_frames (bool): If True, late frames are skipped to keep the frame rate.
+                                If False, all frames are shown and the playback catches up.
         """
-        super().__init__(led_matrix, frames, async_mode)
-        self._frame_delay = max(0, int(1000 / fps)) # Delay to achieve target FPS
+        super().__init__(led_matrix, frames, async_mode, drop_frames)
+        self._fps = max(1, fps)
 
     def _generate_frames(self, loop: bool):
         """
         Generator that yields frames and their display durations for the animation.
+        The durations alternate between the neighbouring whole milliseconds
+        so that the frame rate is met exactly, e.g. 33, 33, 34 ms for 30 FPS.
+
+        Parameters:
+            loop (bool): If True, the generator will yield frames indefinitely.
+        """
+        fps = self._fps
+        remainder = 0
+        for frame in self._frame_sequence(loop):
+            remainder += 1000
+            duration = remainder // fps
+            remainder -= duration * fps
+            yield frame, duration
+
+    def _frame_sequence(self, loop: bool):
+        """
+        Generator that yields the frames of the animation.
 
         Parameters:
             loop (bool): If True, the generator will yield frames indefinitely.
         """
         while True:
             for frame in self._frames:
-                yield frame, self._frame_delay
+                yield frame
             if not loop:
                 break
 
+class DeltaAnimation(FPSAnimation):
+    """
+    Class to represent a compressed animation for the LED Matrix with a fixed frame rate.
+    Each frame is stored as the difference to the previous frame, which makes
+    long animations a fraction of the size of a list of frames.
+    The frames are decoded directly into the buffer of the LED matrix without allocating memory.
+    The data can be created with tools/led-matrix/convert_images.py --compress.
+
+    Encoding: Every frame is a sequence of operations that is applied to the previous frame
+    (the first frame is applied to a blank frame) until all bytes of the frame are covered:
+    - 0x00-0x7F: Skip the next op + 1 bytes, they didn't change.
+    - 0x80-0xBF: Copy the following op - 0x7F bytes.
+    - 0xC0-0xFF: Repeat the following byte op - 0xBF times.
+    """
+
+    def __init__(self, led_matrix: ModulinoLEDMatrix, data: bytes | bytearray, fps: int, async_mode: bool = False, drop_frames: bool = False):
+        """
+        Initializes the DeltaAnimation.
+
+        Parameters:
+            led_matrix (ModulinoLEDMatrix): The LED matrix to display the animation on.
+                                            Its display mode needs to match the one of the encoded frames.
+            data (bytes | bytearray): The delta encoded frames.
+            fps (int): The frames per second for the animation.
+            async_mode (bool): If True, play() returns a coroutine that can be awaited.
+            drop_frames (bool): If True, late frames are skipped to keep the frame rate.
+                                If False, all frames are shown and the playback catches up.
+        """
+        if len(data) == 0:
+            raise ValueError("The animation needs at least one frame")
+        super().__init__(led_matrix, None, fps, async_mode, drop_frames)
+        self._data = data
+        self._frame_count = None
+
+    def _frame_sequence(self, loop: bool):
+        """
+        Generator that decodes the frames into the buffer of the LED matrix.
+        It yields None, because the frames are already in place.
+
+        Parameters:
+            loop (bool): If True, the generator will yield frames indefinitely.
+        """
+        matrix = self._led_matrix
+        data = self._data
+        while True:
+            buffer = matrix._framebuf_buffer
+            for i in range(len(buffer)):
+                buffer[i] = 0
+            offset = 0
+            while offset < len(data):
+                offset = _decode_delta_frame(data, offset, buffer)
+                matrix._mark_all_dirty()
+                yield None
+            if not loop:
+                break
+
+    @property
+    def frame_count(self) -> int:
+        """
+        Returns the number of frames in the animation.
+        """
+        if self._frame_count is None:
+            # Decode into a scratch buffer once to find the frame boundaries
+            buffer = bytearray(len(self._led_matrix._framebuf_buffer))
+            count = 0
+            offset = 0
+            while offset < len(self._data):
+                offset = _decode_delta_frame(self._data, offset, buffer)
+                count += 1
+            self._frame_count = count
+        return self._frame_count
+
 class MPJAnimation(Animation):
     """
     Class to represent an animation loaded from an MPJ (JSON) file.
@@ -443,7 +920,7 @@ class MPJAnimation(Animation):
     and a 'duration' in milliseconds.
     """
 
-    def __init__(self, led_matrix: ModulinoLEDMatrix, file_path: str, async_mode: bool = False):
+    def __init__(self, led_matrix: ModulinoLEDMatrix, file_path: str, async_mode: bool = False, drop_frames: bool = False):
         """
         Initializes the MPJAnimation.
 
@@ -451,6 +928,7 @@ class MPJAnimation(Animation):
             led_matrix (ModulinoLEDMatrix): The LED matrix to display the animation on.
             file_path (str): The path to the .mpj JSON file.
             async_mode (bool): If True, play() returns a coroutine that can be awaited.
+            drop_frames (bool): If True, late frames are skipped. If False, all frames are shown and the playback catches up.
         """
         import json
         with open(file_path, 'r') as f:
@@ -469,6 +947,80 @@ class MPJAnimation(Animation):
 
             frames.append((buffer, duration))
 
-        super().__init__(led_matrix, frames, async_mode)
+        super().__init__(led_matrix, frames, async_mode, drop_frames)
+
+
+class MLAAnimation(Animation):
+    """
+    Class to represent an animation that is streamed from an MLA file.
+    MLA is a compact binary format that stores the frames exactly as they are sent to the LED matrix.
+    The frames are read one at a time into a preallocated buffer while the animation plays,
+    so the length of an animation is only limited by the size of the file system.
+    MLA files can be created from MPJ files, images and videos with tools/led-matrix/convert_to_mla.py.
+
+    File layout (all numbers are little-endian):
+    - Header (8 bytes): b'MLA', format version (1), mode (0 = monochrome, 1 = grayscale),
+      flags (0), number of frames (uint16)
+    - One record per frame: display duration in milliseconds (uint16) followed by
+      the frame data (12 bytes for monochrome, 48 bytes for grayscale)
+    """
+
+    def __init__(self, led_matrix: ModulinoLEDMatrix, file_path: str, async_mode: bool = False, drop_frames: bool = False):
+        """
+        Initializes the MLAAnimation. Only the header of the file is read.
+
+        Parameters:
+            led_matrix (ModulinoLEDMatrix): The LED matrix to display the animation on.
+                                            Its display mode needs to match the one of the file.
+            file_path (str): The path to the .mla file.
+            async_mode (bool): If True, play() returns a coroutine that can be awaited.
+            drop_frames (bool): If True, late frames are skipped. If False, all frames are shown and the playback catches up.
+        """
+        with open(file_path, 'rb') as f:
+            header = f.read(_MLA_HEADER_SIZE)
+
+        if len(header) != _MLA_HEADER_SIZE or header[0:4] != _MLA_MAGIC:
+            raise ValueError(f"{file_path} is not a valid MLA file")
+        if header[4] > 1 or header[5] != 0:
+            raise ValueError(f"{file_path} uses an unsupported mode or unsupported flags")
 
-    
\ No newline at end of file
+        grayscale = header[4] == 1
+        if grayscale != led_matrix.use_grayscale:
+            raise ValueError(f"The animation requires the LED matrix to be in {'grayscale' if grayscale else 'monochrome'} mode")
+
+        frame_count = header[6] | (header[7] << 8)
+        if frame_count == 0:
+            raise ValueError(f"{file_path} doesn't contain any frames")
+
+        super().__init__(led_matrix, None, async_mode, drop_frames)
+        self._file_path = file_path
+        self._frame_count = frame_count
+        self._record = bytearray(2 + (48 if grayscale else 12)) # Duration + frame data
+        self._frame = memoryview(self._record)[2:]
+
+    def _generate_frames(self, loop: bool):
+        """
+        Generator that reads the frames and their display durations from the file.
+        The same buffer is reused for every frame.
+
+        Parameters:
+            loop (bool): If True, the generator will yield frames indefinitely.
+        """
+        record = self._record
+        frame = self._frame
+        with open(self._file_path, 'rb') as f:
+            while True:
+                f.seek(_MLA_HEADER_SIZE)
+                for _ in range(self._frame_count):
+                    if f.readinto(record) != len(record):
+                        raise ValueError(f"{self._file_path} is truncated")
+                    yield frame, record[0] | (record[1] << 8)
+                if not loop:
+                    break
+
+    @property
+    def frame_count(self) -> int:
+        """
+        Returns the number of frames in the animation.
+        """
+        return self._frame_count
@@ -0,0 +1,400 @@
+from micropython import const
+from framebuf import FrameBuffer, GS4_HMSB, MONO_VLSB
+from .led_matrix import ModulinoLEDMatrix
+
+_MATRIX_WIDTH = const(12)
+_MATRIX_HEIGHT = const(8)
+
+def _reverse_table(grayscale: bool) -> bytes:
+    """
+    Returns a table that mirrors a byte of a frame horizontally (grayscale, swaps the two pixels)
+    or vertically (monochrome, reverses the bit order of a column).
+    """
+    if grayscale:
+        return bytes([(value << 4 | value >> 4) & 0xFF for value in range(256)])
+    table = bytearray(256)
+    for value in range(256):
+        reversed_value = 0
+        for bit in range(8):
+            if value & (1 << bit):
+                reversed_value |= 0x80 >> bit
+        table[value] = reversed_value
+    return bytes(table)
+
+class LEDMatrixCanvas:
+    """
+    Combines several Modulino LED Matrices into one large display, e.g. four matrices side by side
+    and two rows of them for a 48x16 ticker. Everything is drawn into one FrameBuffer that spans all
+    matrices with the same drawing methods as a single ModulinoLEDMatrix.
+
+    The matrices are arranged in a grid, row by row starting at the top left. Each matrix can be mounted
+    rotated by 0, 90, 180 or 270 degrees clockwise. Rotated by 90 or 270 degrees a matrix is 8 pixels wide
+    and 12 pixels high, so all matrices need to be either in landscape or in portrait orientation.
+
+    Where each matrix takes its pixels from is computed once when the canvas is created.
+    Matrices that aren't rotated copy whole rows (grayscale) or columns (monochrome) of the canvas,
+    so they are the fastest. show() only sends the matrices whose content changed, and nothing at all
+    if the canvas didn't change since the last call.
+    The display mode of the matrices can't be changed while they are part of a canvas.
+
+    The canvas can be played with FPSAnimation and DeltaAnimation, using frames of the size of the canvas.
+
+    Example:
+
+        canvas = LEDMatrixCanvas([ModulinoLEDMatrix(address=address) for address in (0x72, 0x40, 0x41, 0x42)])
+        x = canvas.width
+        while True:
+            canvas.clear().text(x, 0, "Hello Modulino!").show()
+            x = x - 1 if x > -120 else canvas.width
+            sleep_ms(30)
+    """
+
+    def __init__(self, matrices: list[ModulinoLEDMatrix], columns: int = None, rotations: list[int] = None):
+        """
+        Initializes the canvas.
+
+        Parameters:
+            matrices (list[ModulinoLEDMatrix]): The matrices, row by row starting at the top left.
+                                                They need to use the same display mode (grayscale or monochrome).
+            columns (int): The amount of matrices per row. By default all matrices are in one row.
+            rotations (list[int]): The clockwise rotation (0, 90, 180 or 270) of each matrix. By default no matrix is rotated.
+        """
+        if len(matrices) == 0:
+            raise ValueError("The canvas needs at least one LED matrix")
+        if columns is None:
+            columns = len(matrices)
+        if columns <= 0 or len(matrices) % columns != 0:
+            raise ValueError(f"{len(matrices)} LED matrices can't be arranged in rows of {columns}")
+        if rotations is None:
+            rotations = [0] * len(matrices)
+        if len(rotations) != len(matrices):
+            raise ValueError("There needs to be one rotation per LED matrix")
+        for rotation in rotations:
+            if rotation not in (0, 90, 180, 270):
+                raise ValueError(f"Invalid rotation {rotation} (Valid: 0, 90, 180, 270)")
+
+        portrait = rotations[0] in (90, 270)
+        for rotation in rotations:
+            if (rotation in (90, 270)) != portrait:
+                raise ValueError("The LED matrices need to be all in landscape or all in portrait orientation")
+        grayscale = matrices[0].use_grayscale
+        for matrix in matrices:
+            if matrix.use_grayscale != grayscale:
+                raise ValueError("The LED matrices need to use the same display mode")
+
+        self._matrices = matrices
+        self._grayscale = grayscale
+        tile_width = _MATRIX_HEIGHT if portrait else _MATRIX_WIDTH
+        tile_height = _MATRIX_WIDTH if portrait else _MATRIX_HEIGHT
+        self._width = columns * tile_width
+        self._height = len(matrices) // columns * tile_height
+
+        # The canvas uses the pixel format of the matrices, so that their frames are slices of it
+        if grayscale:
+            self._framebuf_buffer = bytearray(self._width * self._height // 2)
+            self._framebuf = FrameBuffer(self._framebuf_buffer, self._width, self._height, GS4_HMSB)
+            self._default_color = 15
+        else:
+            self._framebuf_buffer = bytearray(self._width * ((self._height + 7) // 8))
+            self._framebuf = FrameBuffer(self._framebuf_buffer, self._width, self._height, MONO_VLSB)
+            self._default_color = 1
+        self._prev_data_buffer = bytearray(len(self._framebuf_buffer))
+        self._shown = False
+        self._reverse = _reverse_table(grayscale) if 180 in rotations else None
+
+        self._tiles = [] # [matrix, rotation, slice map]
+        for index, matrix in enumerate(matrices):
+            x = index % columns * tile_width
+            y = index // columns * tile_height
+            self._tiles.append([matrix, rotations[index], self._slice_map(matrix, rotations[index], x, y)])
+
+        self._tiles_sent = 0
+
+    def _slice_map(self, matrix: ModulinoLEDMatrix, rotation: int, x: int, y: int) -> list:
+        """
+        Computes where the frame of a matrix comes from in the canvas.
+
+        Parameters:
+            matrix (ModulinoLEDMatrix): The matrix.
+            rotation (int): The clockwise rotation of the matrix.
+            x (int): The x-coordinate of the top left corner of the matrix in the canvas.
+            y (int): The y-coordinate of the top left corner of the matrix in the canvas.
+
+        Returns:
+            list: Depending on the rotation:
+                  0: (destination, source) memoryview pairs to copy.
+                  180: (destination offset, source offset, length) triples to copy in reverse order.
+                  90, 270: The canvas coordinates (x, y) of every pixel of the matrix, row by row.
+        """
+        canvas = memoryview(self._framebuf_buffer)
+        frame = memoryview(matrix._framebuf_buffer)
+        slices = []
+        if rotation in (0, 180):
+            if self._grayscale:
+                # One slice per row, two pixels per byte
+                row_bytes = _MATRIX_WIDTH // 2
+                for row in range(_MATRIX_HEIGHT):
+                    source_row = row if rotation == 0 else _MATRIX_HEIGHT - 1 - row
+                    source = ((y + source_row) * self._width + x) // 2
+                    slices.append((row * row_bytes, source, row_bytes))
+            else:
+                # The 8 rows of a matrix are one byte per column
+                slices.append((0, y // 8 * self._width + x, _MATRIX_WIDTH))
+            if rotation == 0:
+                return [(frame[destination:destination + length], canvas[source:source + length]) for destination, source, length in slices]
+            return slices
+
+        coordinates = bytearray()
+        for row in range(_MATRIX_HEIGHT):
+            for column in range(_MATRIX_WIDTH):
+                if rotation == 90:
+                    coordinates.append(x + _MATRIX_HEIGHT - 1 - row)
+                    coordinates.append(y + column)
+                else:
+                    coordinates.append(x + row)
+                    coordinates.append(y + _MATRIX_WIDTH - 1 - column)
+        return coordinates
+
+    @property
+    def width(self) -> int:
+        """
+        The width of the canvas in pixels.
+        """
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """
+        The height of the canvas in pixels.
+        """
+        return self._height
+
+    @property
+    def use_grayscale(self) -> bool:
+        """
+        Whether the matrices are in grayscale mode.
+        """
+        return self._grayscale
+
+    @property
+    def matrices(self) -> list[ModulinoLEDMatrix]:
+        """
+        The matrices of the canvas.
+        """
+        return self._matrices
+
+    @property
+    def framebuf(self) -> FrameBuffer:
+        """
+        The FrameBuffer that spans all matrices, e.g. to blit it into another FrameBuffer or to use it with drawing libraries.
+        """
+        return self._framebuf
+
+    @property
+    def tiles_sent(self) -> int:
+        """
+        The amount of matrices the last call of show() sent a frame to.
+        """
+        return self._tiles_sent
+
+    def _mark_all_dirty(self) -> None:
+        """
+        Called by the animations after they wrote a frame into the buffer. The canvas compares
+        the whole buffer in show(), so there is nothing to track.
+        """
+        pass
+
+    def _normalize_color(self, color: int | None) -> int:
+        return self._default_color if color is None else color
+
+    def set_frame(self, data: bytes | bytearray):
+        """
+        Sets the content of the whole canvas.
+
+        Parameters:
+            data (bytes | bytearray): The data in the format of the matrices, i.e. 4 bits per pixel row by row (grayscale)
+                                      or one byte per column of 8 pixels (monochrome).
+        """
+        if len(data) != len(self._framebuf_buffer):
+            raise ValueError(f"Data length must be {len(self._framebuf_buffer)} bytes")
+        self._framebuf_buffer[:] = data
+        return self
+
+    def fill(self, color: int = None):
+        """
+        Fills the canvas with the specified color.
+
+        Parameters:
+            color (int): The color to fill the canvas with. For grayscale, this can be 0-15. For monochrome, use 0 or 1.
+        """
+        self._framebuf.fill(self._normalize_color(color))
+        return self
+
+    def clear(self):
+        """
+        Turns off all pixels of the canvas.
+        """
+        self._framebuf.fill(0)
+        return self
+
+    def get_pixel(self, x, y) -> bool:
+        """
+        Gets the state of a pixel of the canvas.
+
+        Parameters:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+        Returns:
+            bool: True if the pixel is on, False if it is off.
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise ValueError("Pixel coordinates out of bounds")
+        return bool(self._framebuf.pixel(x, y))
+
+    def set_pixel(self, x, y, color = None):
+        """
+        Sets a pixel of the canvas.
+
+        Parameters:
+            x (int): The x-coordinate of the pixel.
+            y (int): The y-coordinate of the pixel.
+            color (int): The color to set the pixel to. For grayscale, this can be 0-15. For monochrome, use 0 or 1.
+        """
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise ValueError("Pixel coordinates out of bounds")
+        self._framebuf.pixel(x, y, self._normalize_color(color))
+        return self
+
+    def hline(self, x, y, length, color = None):
+        """
+        Draws a horizontal line on the canvas.
+
+        Parameters:
+            x (int): The x-coordinate of the start of the line.
+            y (int): The y-coordinate of the line.
+            length (int): The length of the line.
+            color (int): The color of the line. For grayscale, this can be 0-15. For monochrome, use 0 or 1.
+        """
+        self._framebuf.hline(x, y, length, self._normalize_color(color))
+        return self
+
+    def vline(self, x, y, length, color = None):
+        """
+        Draws a vertical line on the canvas.
+
+        Parameters:
+            x (int): The x-coordinate of the line.
+            y (int): The y-coordinate of the start of the line.
+            length (int): The length of the line.
+            color (int): The color of the line. For grayscale, this can be 0-15. For monochrome, use 0 or 1.
+        """
+        self._framebuf.vline(x, y, length, self._normalize_color(color))
+        return self
+
+    def line(self, x1, y1, x2, y2, color = None):
+        """
+        Draws a line on the canvas.
+
+        Parameters:
+            x1 (int): The x-coordinate of the start of the line.
+            y1 (int): The y-coordinate of the start of the line.
+            x2 (int): The x-coordinate of the end of the line.
+            y2 (int): The y-coordinate of the end of the line.
+            color (int): The color of the line. For grayscale, this can be 0-15. For monochrome, use 0 or 1.
+        """
+        self._framebuf.line(x1, y1, x2, y2, self._normalize_color(color))
+        return self
+
+    def rect(self, x, y, width, height, color = None):
+        """
+        Draws a rectangle on the canvas.
+
+        Parameters:
+            x (int): The x-coordinate of the top left corner.
+            y (int): The y-coordinate of the top left corner.
+            width (int): The width of the rectangle.
+            height (int): The height of the rectangle.
+            color (int): The color of the rectangle. For grayscale, this can be 0-15. For monochrome, use 0 or 1.
+        """
+        self._framebuf.rect(x, y, width, height, self._normalize_color(color))
+        return self
+
+    def text(self, x, y, string, color = None):
+        """
+        Draws text on the canvas with the built-in 8x8 font.
+
+        Parameters:
+            x (int): The x-coordinate of the top left corner of the text.
+            y (int): The y-coordinate of the top left corner of the text.
+            string (str): The text.
+            color (int): The color of the text. For grayscale, this can be 0-15. For monochrome, use 0 or 1.
+        """
+        self._framebuf.text(string, x, y, self._normalize_color(color))
+        return self
+
+    def scroll(self, dx, dy):
+        """
+        Shifts the content of the canvas. The pixels that are shifted in keep their previous content.
+
+        Parameters:
+            dx (int): The amount of pixels to shift horizontally.
+            dy (int): The amount of pixels to shift vertically.
+        """
+        self._framebuf.scroll(dx, dy)
+        return self
+
+    def blit(self, buffer, x, y):
+        """
+        Draws another FrameBuffer onto the canvas.
+
+        Parameters:
+            buffer (FrameBuffer): The source buffer.
+            x (int): The x-coordinate on the canvas to draw to.
+            y (int): The y-coordinate on the canvas to draw to.
+        """
+        self._framebuf.blit(buffer, x, y)
+        return self
+
+    def show(self):
+        """
+        Sends the canvas to the matrices. Only the matrices whose content changed are sent a frame.
+        If the canvas didn't change since the last call, nothing is done.
+        Starting the command queue of the bus (see Modulino.command_queue) sends the frames back to back.
+        """
+        if self._shown and self._framebuf_buffer == self._prev_data_buffer:
+            self._tiles_sent = 0
+            return self
+        self._prev_data_buffer[:] = self._framebuf_buffer
+        self._shown = True
+
+        canvas = self._framebuf_buffer
+        sent = 0
+        for tile in self._tiles:
+            matrix = tile[0]
+            rotation = tile[1]
+            slices = tile[2]
+            if rotation == 0:
+                for destination, source in slices:
+                    destination[:] = source
+            elif rotation == 180:
+                frame = matrix._framebuf_buffer
+                reverse = self._reverse
+                for destination, source, length in slices:
+                    end = source + length - 1
+                    for i in range(length):
+                        frame[destination + i] = reverse[canvas[end - i]]
+            else:
+                pixel = self._framebuf.pixel
+                set_pixel = matrix._framebuf.pixel
+                i = 0
+                for y in range(_MATRIX_HEIGHT):
+                    for x in range(_MATRIX_WIDTH):
+                        set_pixel(x, y, pixel(slices[i], slices[i + 1]))
+                        i += 2
+
+            if matrix._framebuf_buffer != matrix._prev_data_buffer or matrix._mode_pending:
+                sent += 1
+            matrix._mark_all_dirty()
+            matrix.show()
+        self._tiles_sent = sent
+        return self
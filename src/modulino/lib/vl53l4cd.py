@@ -84,9 +84,12 @@ RANGE_ERROR_OTHER = const(0xFF)
 class VL53L4CD:
     """Driver for the VL53L4CD distance sensor."""
 
-    def __init__(self, i2c, address=41):
+    def __init__(self, i2c, address=41, arbiter=None):
         self._i2c = i2c
         self._device_address = address
+        # Optional lock (context manager) that keeps other threads or tasks off the bus
+        # between writing the register address and reading the register
+        self._arbiter = arbiter
         model_id, module_type = self.model_info
         # if model_id != 0xEB or module_type != 0xAA:
         #     raise RuntimeError(f"Wrong sensor ID ({model_id}) or type!")
@@ -445,12 +448,26 @@ class VL53L4CD:
     def _write_register(self, address, data, length=None):
         if length is None:
             length = len(data)
-        self._i2c.writeto(self._device_address, struct.pack(">H", address) + data[:length])
+        arbiter = self._arbiter
+        if arbiter:
+            arbiter.acquire()
+        try:
+            self._i2c.writeto(self._device_address, struct.pack(">H", address) + data[:length])
+        finally:
+            if arbiter:
+                arbiter.release()
 
     def _read_register(self, address, length=1):
         data = bytearray(length)
-        self._i2c.writeto(self._device_address, struct.pack(">H", address), False)
-        self._i2c.readfrom_into(self._device_address, data)
+        arbiter = self._arbiter
+        if arbiter:
+            arbiter.acquire()
+        try:
+            self._i2c.writeto(self._device_address, struct.pack(">H", address), False)
+            self._i2c.readfrom_into(self._device_address, data)
+        finally:
+            if arbiter:
+                arbiter.release()
         return data
 
     def set_address(self, new_address):
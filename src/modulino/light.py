@@ -1,4 +1,5 @@
 from .modulino import Modulino
+from machine import I2C
 from ltr381rgb import LTR381RGB
 
 class ModulinoLight(Modulino):
@@ -17,16 +18,45 @@ class ModulinoLight(Modulino):
     default_addresses = [0x53]
     has_mcu = False
 
-    def __init__(self, i2c_bus: I2C = None, address: int = None) -> None:
+    def __init__(self, i2c_bus: I2C = None, address: int = None, check_connection: bool = True, defer_init: bool = False) -> None:
         """
         Initializes the Modulino Light.
 
         Parameters:
             i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
             address (int): The I2C address of the module. If not provided, the default address will be used.
+            check_connection (bool): Whether to check the connection to the module.
+            defer_init (bool): Whether to postpone the configuration of the sensor until the sensor is used for the first time.
         """
-        super().__init__(i2c_bus, address, "Light")
-        self.sensor = LTR381RGB(self.i2c_bus, self.address)
+        super().__init__(i2c_bus, address, "Light", check_connection=check_connection)
+        self._sensor = None
+        if not defer_init:
+            self._init_sensor()
+
+    def _init_sensor(self) -> None:
+        """
+        Creates and configures the sensor driver.
+        """
+        self._sensor = LTR381RGB(self.i2c_bus, self.address)
+
+    @property
+    def sensor(self) -> LTR381RGB:
+        """
+        The underlying LTR381RGB driver.
+        It's created on first access if the initialization was deferred.
+        """
+        self._rebind_bus()
+        if self._sensor is None:
+            self._init_sensor()
+        return self._sensor
+
+    def _on_bus_replaced(self) -> None:
+        # The driver keeps a reference to the old bus object, create it again on next use
+        self._sensor = None
+
+    def _on_reconnected(self) -> None:
+        # The sensor has been power cycled, configure it again on next use
+        self._sensor = None
 
     @property
     def lux(self) -> float:
@@ -39,7 +69,8 @@ class ModulinoLight(Modulino):
         Returns:
             float: The ambient brightness in lux.
         """
-        return self.sensor.lux
+        with self.bus_arbiter:
+            return self.sensor.lux
 
     @property
     def rgb(self) -> tuple:
@@ -50,7 +81,8 @@ class ModulinoLight(Modulino):
         Returns:
             tuple: A (red, green, blue) tuple.
         """
-        return self.sensor.rgb_color
+        with self.bus_arbiter:
+            return self.sensor.rgb_color
 
     @property
     def color_name(self) -> str:
@@ -61,7 +93,8 @@ class ModulinoLight(Modulino):
         Returns:
             str: The name of the closest matching color.
         """
-        return self.sensor.approximate_color
+        with self.bus_arbiter:
+            return self.sensor.approximate_color
 
     @property
     def color_temperature(self) -> int:
@@ -75,7 +108,8 @@ class ModulinoLight(Modulino):
             int: The color temperature in kelvin, or None if it can't be measured.
         """
         try:
-            return round(self.sensor.color_temperature)
+            with self.bus_arbiter:
+                return round(self.sensor.color_temperature)
         except Exception:
             # Not enough light to estimate a color temperature.
             return None
@@ -90,4 +124,5 @@ class ModulinoLight(Modulino):
         Returns:
             int: The infrared light level.
         """
-        return self.sensor.ir_light
+        with self.bus_arbiter:
+            return self.sensor.ir_light
@@ -1,9 +1,12 @@
 from machine import Pin, I2C, SoftI2C
-from time import sleep
+from time import sleep, sleep_ms, ticks_us, ticks_diff
 from micropython import const
+from errno import EIO, ETIMEDOUT
 import re
 import os
 from collections import namedtuple
+from ._registry import KNOWN_ADDRESSES
+from .bus_arbiter import BusArbiter
 
 I2CInterface = namedtuple('I2CInterface', ['type', 'bus_number', "scl", "sda"])
 
@@ -21,6 +24,7 @@ class _I2CHelper:
   """
   i2c_bus: I2C = None
   frequency: int = const(100000)  # Modulinos operate at 100kHz
+  _bus_parameters: dict = {} # id(bus) -> (bus, (interface, scl, sda, frequency))
 
   @staticmethod
   def extract_i2c_info(i2c_bus: I2C) -> tuple[int, int, int]:
@@ -37,6 +41,22 @@ class _I2CHelper:
 
     return interface, scl, sda
 
+  @staticmethod
+  def bus_parameters(i2c_bus: I2C) -> tuple[int, int, int, int]:
+    """
+    Returns the interface number, SCL pin, SDA pin and frequency of the given bus.
+    They are extracted from the string representation of the bus once and then cached.
+    """
+    entry = _I2CHelper._bus_parameters.get(id(i2c_bus))
+    if entry is not None and entry[0] is i2c_bus:
+      return entry[1]
+    interface, scl, sda = _I2CHelper.extract_i2c_info(i2c_bus)
+    frequency_match = re.search(r'freq=(\d+)', str(i2c_bus))
+    frequency = int(frequency_match.group(1)) if frequency_match else _I2CHelper.frequency
+    parameters = (interface, scl, sda, frequency)
+    _I2CHelper._bus_parameters[id(i2c_bus)] = (i2c_bus, parameters)
+    return parameters
+
   @staticmethod
   def reset_bus(i2c_bus: I2C) -> I2C:
     """
@@ -46,7 +66,7 @@ class _I2CHelper:
 
     # This is a workaround to get the SCL and SDA pins from a given bus object.
     # Unfortunately the I2C class does not expose those attributes directly.
-    interface, scl_pin_number, sda_pin_number = _I2CHelper.extract_i2c_info(i2c_bus)
+    interface, scl_pin_number, sda_pin_number, frequency = _I2CHelper.bus_parameters(i2c_bus)
 
     if scl_pin_number is None or sda_pin_number is None:
         print("Could not extract SCL/SDA pins. Skipping bus reset.")
@@ -91,9 +111,45 @@ class _I2CHelper:
     is_soft = isinstance(i2c_bus, SoftI2C)
 
     if is_soft:
-        return SoftI2C(scl=Pin(scl_pin_number), sda=Pin(sda_pin_number), freq=_I2CHelper.frequency)
+        new_bus = SoftI2C(scl=Pin(scl_pin_number), sda=Pin(sda_pin_number), freq=frequency)
     else:
-        return I2C(interface, scl=Pin(scl_pin_number), sda=Pin(sda_pin_number), freq=_I2CHelper.frequency)
+        new_bus = I2C(interface, scl=Pin(scl_pin_number), sda=Pin(sda_pin_number), freq=frequency)
+    # The new bus uses the same pins, no need to parse its string representation again
+    _I2CHelper._bus_parameters[id(new_bus)] = (new_bus, (interface, scl_pin_number, sda_pin_number, frequency))
+    return new_bus
+
+  @staticmethod
+  def recover_bus(i2c_bus: I2C) -> I2C:
+    """
+    Resets a stuck bus and moves everything that used it to the new bus object.
+    The Modulinos switch to the new bus object on their next transaction.
+    If the bus has already been recovered (e.g. by another Modulino), the new bus object is returned right away.
+
+    Returns:
+      I2C: The bus object to use from now on.
+    """
+    arbiter = BusArbiter.for_bus(i2c_bus)
+    with arbiter:
+      if arbiter.replacement is not None:
+        return arbiter.replacement
+      new_bus = _I2CHelper.reset_bus(i2c_bus)
+      if new_bus is i2c_bus:
+        return i2c_bus
+
+      queue = arbiter.command_queue
+      if queue is not None:
+        queue._move_to(new_bus)
+        arbiter.command_queue = None
+      monitor = arbiter.health_monitor
+      if monitor is not None:
+        monitor._move_to(new_bus)
+        arbiter.health_monitor = None
+      arbiter.replacement = new_bus
+      if _I2CHelper.i2c_bus is i2c_bus:
+        _I2CHelper.i2c_bus = new_bus
+      _ScanCache.invalidate(i2c_bus)
+      _I2CHelper._bus_parameters.pop(id(i2c_bus), None)
+    return new_bus
 
   @staticmethod
   def get_interface() -> I2C:
@@ -125,6 +181,135 @@ class _I2CHelper:
     if interface_info.type == "sw":
       return SoftI2C(scl=Pin(interface_info.scl), sda=Pin(interface_info.sda), freq=_I2CHelper.frequency)
 
+# 7-bit addresses of all known Modulinos at their default address.
+# Auto discovery probes these first so that a single pass over the bus
+# answers the discovery of all Modulinos created during boot.
+_KNOWN_ADDRESSES = KNOWN_ADDRESSES
+
+class _ScanCache:
+  """
+  Remembers the result of address probes per bus so that repeated scans
+  (e.g. one per auto discovering constructor) don't have to touch the bus again.
+  The cache needs to be invalidated explicitly when devices are added or removed.
+  """
+  _entries: dict = {} # id(bus) -> (bus, {address: present})
+
+  @staticmethod
+  def get(bus: I2C) -> dict:
+    """
+    Returns the dictionary of probed addresses for the given bus.
+    """
+    entry = _ScanCache._entries.get(id(bus))
+    if entry is None or entry[0] is not bus:
+      entry = (bus, {})
+      _ScanCache._entries[id(bus)] = entry
+    return entry[1]
+
+  @staticmethod
+  def contains(bus: I2C) -> bool:
+    """
+    Returns True if the bus has been probed since the last invalidation.
+    """
+    entry = _ScanCache._entries.get(id(bus))
+    return entry is not None and entry[0] is bus and len(entry[1]) > 0
+
+  @staticmethod
+  def invalidate(bus: I2C = None) -> None:
+    """
+    Forgets the probe results of the given bus or of all buses if no bus is given.
+    """
+    if bus is None:
+      _ScanCache._entries.clear()
+    else:
+      _ScanCache._entries.pop(id(bus), None)
+
+class RetryPolicy:
+  """
+  Decides how Modulino.read() and Modulino.write() handle bus errors such as
+  timeouts or I/O errors caused by electrical noise.
+  A failed transfer is retried after a short backoff. If enabled with reset_after and the transfer keeps failing,
+  the bus is recovered by clocking out a stuck device (see Modulino.reset_bus()) and all Modulinos on the bus
+  are moved to the new bus object before the transfer is tried again.
+  Errors that indicate a missing device (ENODEV) are raised immediately.
+
+  Modulinos don't retry by default. Assign a policy to a single Modulino (e.g. `matrix.retry_policy = RetryPolicy()`)
+  or to Modulino.retry_policy to use it for all Modulinos that don't have their own one.
+  """
+
+  def __init__(self, retries: int = 2, backoff_ms: int = 1, reset_after: int = 0, errors: tuple = (EIO, ETIMEDOUT)):
+    """
+    Initializes the retry policy.
+
+    Parameters:
+      retries (int): How often a failed transfer is repeated before the error is raised.
+      backoff_ms (int): The wait before the first retry. It doubles with every further retry.
+      reset_after (int): The amount of failed attempts after which the bus is recovered before retrying.
+                         0 (the default) disables the bus recovery. The recovery replaces the bus object
+                         of all Modulinos on the bus, so it needs to be enabled explicitly.
+      errors (tuple): The errno values that are retried.
+    """
+    self.retries = retries
+    self.backoff_ms = backoff_ms
+    self.reset_after = reset_after
+    self.errors = errors
+    self.reset_stats()
+
+  def handle(self, modulino: "Modulino", error: OSError, attempt: int) -> bool:
+    """
+    Handles a failed transfer. Waits and recovers the bus if needed.
+
+    Parameters:
+      modulino (Modulino): The Modulino whose transfer failed.
+      error (OSError): The error raised by the transfer.
+      attempt (int): The number of failed attempts of this transfer so far.
+
+    Returns:
+      bool: True if the transfer should be repeated, False if the error should be raised.
+    """
+    return self._handle(modulino.i2c_bus, error, attempt)
+
+  def _handle(self, bus: I2C, error: OSError, attempt: int) -> bool:
+    """
+    Handles a failed transfer on the given bus, see handle().
+    Also used by the CommandQueue, whose writes aren't bound to a single Modulino.
+    """
+    if not error.args or error.args[0] not in self.errors:
+      return False
+    if attempt > self.retries:
+      self._failures += 1
+      return False
+
+    self._retries += 1
+    sleep_ms(self.backoff_ms << (attempt - 1))
+    if self.reset_after > 0 and attempt >= self.reset_after:
+      start = ticks_us()
+      if _I2CHelper.recover_bus(bus) is not bus:
+        self._resets += 1
+      self._recovery_us += ticks_diff(ticks_us(), start)
+    return True
+
+  @property
+  def stats(self) -> dict:
+    """
+    Returns the amount of retried transfers, bus recoveries, transfers that failed
+    despite the retries and the total time in microseconds spent on recovering the bus.
+    """
+    return {
+      "retries": self._retries,
+      "resets": self._resets,
+      "failures": self._failures,
+      "recovery_us": self._recovery_us,
+    }
+
+  def reset_stats(self) -> None:
+    """
+    Resets the statistics.
+    """
+    self._retries = 0
+    self._resets = 0
+    self._failures = 0
+    self._recovery_us = 0
+
 class Modulino:
   """
   Base class for all Modulino devices.
@@ -148,6 +333,12 @@ class Modulino:
   This property should be overridden in derived classes.
   """
 
+  retry_policy: RetryPolicy | None = None
+  """
+  Determines how read() and write() handle bus errors. None (the default) raises bus errors right away.
+  Assign a RetryPolicy to a single Modulino to retry its transfers only.
+  """
+
   def __init__(self, i2c_bus: I2C = None, address: int = None, name: str = None, check_connection: bool = True) -> None:
     """
     Initializes the Modulino object with the given i2c bus and address.
@@ -170,6 +361,8 @@ class Modulino:
 
     self.name = name
     self.address = address
+    self._pin_strap = None # Tuple of the address it was read from and the pin strap address
+    self._arbiter = None
 
     if self.address is None:
       if len(self.default_addresses) == 0:
@@ -200,7 +393,12 @@ class Modulino:
     if len(default_addresses) == 0:
       return None
 
-    devices_on_bus = Modulino.scan(self.i2c_bus, default_addresses)
+    # On the first discovery on this bus probe all known Modulino addresses at once.
+    # Constructors of other Modulinos can then be served from the cache.
+    if not _ScanCache.contains(self.i2c_bus):
+      Modulino.scan(self.i2c_bus, _KNOWN_ADDRESSES, use_cache=True)
+
+    devices_on_bus = Modulino.scan(self.i2c_bus, default_addresses, use_cache=True)
     if len(devices_on_bus) > 0:
       return devices_on_bus[0]
     return None
@@ -218,7 +416,8 @@ class Modulino:
       return False
 
     try:
-        self.i2c_bus.writeto(addr, b'')
+        with self.bus_arbiter:
+          self.i2c_bus.writeto(addr, b'')
         return True
     except OSError:
         return False
@@ -233,13 +432,20 @@ class Modulino:
     At boot it checks the internal flash in case its address has been overridden by the user
     which would take precedence.
 
+    The value is read from the device once and then cached,
+    because it's defined by the hardware and therefore can't change.
+
     Returns:
       int | None: The pin strap address of the modulino.
     """
     if self.address is None:
       return None
-    data = self.i2c_bus.readfrom(self.address, 1, True)
+    if self._pin_strap is not None and self._pin_strap[0] == self.address:
+      return self._pin_strap[1]
+    with self.bus_arbiter:
+      data = self.i2c_bus.readfrom(self.address, 1, True)
     # The first byte is always the pinstrap address
+    self._pin_strap = (self.address, data[0])
     return data[0]
 
   def change_address(self, new_address: int):
@@ -256,11 +462,16 @@ class Modulino:
     data += b'\x00' * (self.send_buffer_size - len(data)) # Pad the rest of the buffer with zeros.
 
     try:
-      self.write(data)
+      self._flush_command_queue()
+      with self.bus_arbiter:
+        self.i2c_bus.writeto(self.address, data)
     except OSError:
       raise RuntimeError("Failed to write the new address to the device. Make sure the device is connected and try again.")
 
+    if self._pin_strap is not None:
+      self._pin_strap = (new_address, self._pin_strap[1]) # The pin strap address doesn't change with the address
     self.address = new_address
+    _ScanCache.invalidate(self.i2c_bus)
 
   def enter_bootloader(self):
     """
@@ -279,14 +490,102 @@ class Modulino:
     # If more than the expected amount is sent, the write command
     # raises an ENODEV error because the device resets while writing.    
     buffer += b'\x00' * (self.send_buffer_size - len(buffer))
+    _ScanCache.invalidate(self.i2c_bus)
+    self._flush_command_queue()
     try:
-      self.i2c_bus.writeto(self.address, buffer, True)
+      with self.bus_arbiter:
+        self.i2c_bus.writeto(self.address, buffer, True)
       sleep(0.25) # Wait for the device to reset
       return True
     except OSError as e:
       # ENODEV (e.errno == 19) can be thrown if the device resets while writing out the buffer
       return False
 
+  @property
+  def bus_arbiter(self) -> BusArbiter:
+    """
+    The arbiter that serializes the transactions on the bus of this Modulino.
+    It can be used to reserve the bus for a sequence of transactions
+    and provides the contention statistics of the bus.
+    """
+    return self._rebind_bus()
+
+  def _rebind_bus(self) -> BusArbiter:
+    """
+    Returns the arbiter of the bus. If the bus has been recovered in the meantime,
+    the Modulino is moved to the new bus object first.
+    """
+    arbiter = self._arbiter
+    if arbiter is None or arbiter.bus is not self.i2c_bus:
+      arbiter = BusArbiter.for_bus(self.i2c_bus)
+      self._arbiter = arbiter
+    if arbiter.replacement is not None:
+      while arbiter.replacement is not None:
+        arbiter = BusArbiter.for_bus(arbiter.replacement)
+      self.i2c_bus = arbiter.bus
+      self._arbiter = arbiter
+      self._on_bus_replaced()
+    return arbiter
+
+  def _on_bus_replaced(self) -> None:
+    """
+    Called after the Modulino has been moved to a new bus object.
+    Derived classes that keep references to the bus (e.g. in a sensor driver) update them here.
+    """
+    pass
+
+  def _on_reconnected(self) -> None:
+    """
+    Called when the device has been connected again after it was unplugged, e.g. by the HotplugWatcher.
+    The device has lost its configuration. Derived classes that configure the device reset their state here.
+    """
+    pass
+
+  def _handle_bus_error(self, error: OSError, attempt: int) -> None:
+    """
+    Lets the retry policy handle a failed transfer. Raises the error if it shouldn't be retried.
+    """
+    policy = self.retry_policy
+    if policy is None or not policy.handle(self, error, attempt):
+      raise error
+
+  @property
+  def command_queue(self):
+    """
+    The CommandQueue of the bus of this Modulino.
+    When it's started, the writes of all Modulinos on the bus are collected and sent together by its flush() method.
+    """
+    from .command_queue import CommandQueue
+    return CommandQueue.for_bus(self.i2c_bus)
+
+  @property
+  def health_monitor(self):
+    """
+    The HealthMonitor of the bus of this Modulino.
+    When it's started, it records the transactions, errors and latencies of all Modulinos on the bus.
+    """
+    from .health import HealthMonitor
+    return HealthMonitor.for_bus(self.i2c_bus)
+
+  @property
+  def health(self) -> dict | None:
+    """
+    The transaction statistics of this Modulino recorded by the health monitor of the bus
+    or None if nothing has been recorded (e.g. because the monitor hasn't been started).
+    """
+    monitor = self.bus_arbiter.health_monitor
+    if monitor is None:
+      return None
+    return monitor.device(self.address)
+
+  def _flush_command_queue(self) -> None:
+    """
+    Sends the queued writes of the bus, e.g. before a command that has to reach the device immediately.
+    """
+    queue = self.bus_arbiter.command_queue
+    if queue is not None:
+      queue.flush()
+
   def read(self, read_buffer: bytearray) -> None:
     """
     Reads the given amount of bytes from the i2c device defined by the length of the read_buffer.
@@ -295,22 +594,94 @@ class Modulino:
     if self.address is None:
       raise RuntimeError("I2C address is not set.")
 
-    self.i2c_bus.readfrom_into(self.address, read_buffer, True)
+    queue = self._rebind_bus().command_queue
+    if queue is not None and queue.has_pending(self.address):
+      # Make sure the device has received the queued writes before reading its state
+      queue.flush()
+
+    attempt = 0
+    while True:
+      arbiter = self._rebind_bus()
+      monitor = arbiter.health_monitor
+      try:
+        with arbiter:
+          if monitor is None or not monitor._active:
+            self.i2c_bus.readfrom_into(self.address, read_buffer, True)
+          else:
+            start = ticks_us()
+            self.i2c_bus.readfrom_into(self.address, read_buffer, True)
+            monitor.record(self.address, len(read_buffer), ticks_diff(ticks_us(), start))
+        return
+      except OSError as error:
+        if monitor is not None and monitor._active:
+          monitor.record_error(self.address, error)
+        attempt += 1
+        self._handle_bus_error(error, attempt)
 
   def write(self, data_buffer: bytearray) -> bool:
     """
     Writes the given buffer to the i2c device.
+    If the command queue of the bus is active, the data is queued instead and sent by its flush() method.
 
     Parameters:
       data_buffer (bytearray): The data to be written to the device.
 
     Returns:
-      bool: True if the data was written successfully, False otherwise.
+      bool: True if the data was written (or queued) successfully, False otherwise.
     """
     if self.address is None:
       return False
-    self.i2c_bus.writeto(self.address, data_buffer)
-    return True
+    queue = self._rebind_bus().command_queue
+    if queue is not None and queue.active:
+      queue.enqueue(self.address, data_buffer, self.retry_policy)
+      return True
+
+    attempt = 0
+    while True:
+      arbiter = self._rebind_bus()
+      monitor = arbiter.health_monitor
+      try:
+        with arbiter:
+          if monitor is None or not monitor._active:
+            self.i2c_bus.writeto(self.address, data_buffer)
+          else:
+            start = ticks_us()
+            self.i2c_bus.writeto(self.address, data_buffer)
+            monitor.record(self.address, len(data_buffer), ticks_diff(ticks_us(), start))
+        return True
+      except OSError as error:
+        if monitor is not None and monitor._active:
+          monitor.record_error(self.address, error)
+        attempt += 1
+        self._handle_bus_error(error, attempt)
+
+  async def aread(self, read_buffer: bytearray) -> None:
+    """
+    Coroutine version of read().
+    It yields to the event loop before the transfer so that other tasks can run in between transfers.
+    The transfer itself is still blocking, but only for the time the bytes take on the bus.
+    """
+    import asyncio
+    await asyncio.sleep_ms(0)
+    async with self.bus_arbiter:
+      self.read(read_buffer)
+
+  async def awrite(self, data_buffer: bytearray) -> bool:
+    """
+    Coroutine version of write().
+    It yields to the event loop before the transfer so that other tasks can run in between transfers.
+    The transfer itself is still blocking, but only for the time the bytes take on the bus.
+
+    Parameters:
+      data_buffer (bytearray): The data to be written to the device.
+
+    Returns:
+      bool: True if the data was written successfully, False otherwise.
+    """
+    import asyncio
+    await asyncio.sleep_ms(0)
+    async with self.bus_arbiter:
+      return self.write(data_buffer)
 
   @property
   def has_default_address(self) -> bool:
@@ -330,19 +701,54 @@ class Modulino:
     raise NotImplementedError("The send_buffer_size property must be overridden in the derived class.")
 
   @staticmethod
-  def scan(bus: I2C, target_addresses: list[int] | None = None) -> list[int]:
+  def scan(bus: I2C, target_addresses: list[int] | None = None, use_cache: bool = False) -> list[int]:
+    """
+    Probes the given addresses (or the whole address range) and returns the ones that responded.
+
+    Parameters:
+      bus (I2C): The I2C bus to scan.
+      target_addresses (list[int] | None): The 7-bit addresses to probe. If omitted, all addresses are probed.
+      use_cache (bool): Whether to reuse earlier probe results for this bus.
+                        Addresses that haven't been probed yet are probed and added to the cache.
+
+    Returns:
+      list[int]: The addresses of the devices that responded in ascending order of the candidates.
+    """
     addresses = bytearray() # Use 8bit data type
     # General call address (0x00) is skipped in default range
     candidates = target_addresses if target_addresses is not None else range(1,128)
+    cache = _ScanCache.get(bus) if use_cache else None
+    arbiter = BusArbiter.for_bus(bus)
 
     for address in candidates:
-        try:
-            bus.writeto(address, b'')
+        present = cache.get(address) if cache is not None else None
+
+        if present is None:
+            try:
+                # Each probe is a transaction of its own so that other threads aren't blocked for the whole scan
+                with arbiter:
+                    bus.writeto(address, b'')
+                present = True
+            except OSError:
+                present = False
+            if cache is not None:
+                cache[address] = present
+
+        if present:
             addresses.append(address)
-        except OSError:
-            pass
     return list(addresses)
 
+  @staticmethod
+  def invalidate_scan_cache(bus: I2C = None) -> None:
+    """
+    Discards cached scan results so that the next scan probes the bus again.
+    Call this after connecting or disconnecting Modulinos at runtime.
+
+    Parameters:
+      bus (I2C): The bus whose results should be discarded. If omitted, the results of all buses are discarded.
+    """
+    _ScanCache.invalidate(bus)
+
   @staticmethod
   def reset_bus(i2c_bus: I2C) -> I2C:
     """
@@ -15,7 +15,7 @@ class ModulinoMovement(Modulino):
     default_addresses = [0x6A, 0x6B]
     has_mcu = False
 
-    def __init__(self, i2c_bus = None, address: int | None = None, check_connection: bool = True) -> None:
+    def __init__(self, i2c_bus = None, address: int | None = None, check_connection: bool = True, defer_init: bool = False) -> None:
         """
         Initializes the Modulino Movement.
 
@@ -23,9 +23,37 @@ class ModulinoMovement(Modulino):
             i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
             address (int): The I2C address of the module. If not provided, the default address will be used.
             check_connection (bool): Whether to check the connection to the module.
+            defer_init (bool): Whether to postpone the configuration of the sensor until the sensor is used for the first time.
         """
         super().__init__(i2c_bus, address, "Movement", check_connection=check_connection)
-        self.sensor = LSM6DSOX(self.i2c_bus, address=self.address)
+        self._sensor = None
+        if not defer_init:
+            self._init_sensor()
+
+    def _init_sensor(self) -> None:
+        """
+        Creates and configures the sensor driver.
+        """
+        self._sensor = LSM6DSOX(self.i2c_bus, address=self.address)
+
+    @property
+    def sensor(self) -> LSM6DSOX:
+        """
+        The underlying LSM6DSOX driver.
+        It's created on first access if the initialization was deferred.
+        """
+        self._rebind_bus()
+        if self._sensor is None:
+            self._init_sensor()
+        return self._sensor
+
+    def _on_bus_replaced(self) -> None:
+        # The driver keeps a reference to the old bus object, create it again on next use
+        self._sensor = None
+
+    def _on_reconnected(self) -> None:
+        # The sensor has been power cycled, configure it again on next use
+        self._sensor = None
 
     @property
     def acceleration(self) -> MovementValues:
@@ -35,7 +63,8 @@ class ModulinoMovement(Modulino):
                             These values can be accessed as .x, .y, and .z properties
                             or by using the index operator for tuple unpacking.
         """
-        sensor_values = self.sensor.accel()
+        with self.bus_arbiter:
+            sensor_values = self.sensor.accel()
         return MovementValues(sensor_values[0], sensor_values[1], sensor_values[2])
     
     @property
@@ -56,7 +85,8 @@ class ModulinoMovement(Modulino):
                             These values can be accessed as .x, .y, and .z properties
                             or by using the index operator for tuple unpacking.
         """
-        sensor_values = self.sensor.gyro()
+        with self.bus_arbiter:
+            sensor_values = self.sensor.gyro()
         return MovementValues(sensor_values[0], sensor_values[1], sensor_values[2])
     
     @property
@@ -0,0 +1,420 @@
+import asyncio
+from time import ticks_ms, ticks_add, ticks_diff
+from micropython import const
+from .pixels import ModulinoPixels, NUM_LEDS
+from .gamma import GAMMA_8BIT
+from ._effect_tables import HUE_TABLE as _HUE, WAVE_TABLE as _WAVE
+
+# Progress and intensity levels are fixed-point numbers with 8 fractional bits, _ONE stands for 1.0
+_FRACTION_BITS = const(8)
+_ONE = const(256)
+
+def _progress(elapsed_ms: int, duration_ms: int) -> int:
+    """
+    Returns the progress of a transition as a fixed-point number between 0 and _ONE.
+    """
+    if duration_ms <= 0 or elapsed_ms >= duration_ms:
+        return _ONE
+    if elapsed_ms <= 0:
+        return 0
+    return (elapsed_ms << _FRACTION_BITS) // duration_ms
+
+def _lerp(from_color: int, to_color: int, level: int) -> int:
+    """
+    Interpolates between two packed colors (0xRRGGBB). level is a fixed-point number between 0 and _ONE.
+    """
+    r = (from_color >> 16) & 0xFF
+    g = (from_color >> 8) & 0xFF
+    b = from_color & 0xFF
+    r += (((to_color >> 16) & 0xFF) - r) * level >> _FRACTION_BITS
+    g += (((to_color >> 8) & 0xFF) - g) * level >> _FRACTION_BITS
+    b += ((to_color & 0xFF) - b) * level >> _FRACTION_BITS
+    return r << 16 | g << 8 | b
+
+def hue_to_packed(hue: int) -> int:
+    """
+    Returns the fully saturated color of a hue as a packed color (0xRRGGBB).
+
+    Parameters:
+        hue (int): The hue between 0 and 255 (red -> yellow -> green -> cyan -> blue -> magenta -> red).
+                   Values outside of the range wrap around.
+
+    Returns:
+        int: The packed color.
+    """
+    offset = (hue & 0xFF) * 3
+    return _HUE[offset] << 16 | _HUE[offset + 1] << 8 | _HUE[offset + 2]
+
+class PixelEffect:
+    """
+    Base class of the effects that are played by the PixelAnimator.
+    An effect computes the colors of its LEDs from the time that has passed since it was started,
+    so it always shows the right frame no matter how often it's rendered.
+    """
+
+    def render(self, leds: "PixelAnimator", count: int, elapsed_ms: int) -> bool:
+        """
+        Writes the colors of the LEDs of the effect with leds.set().
+
+        Parameters:
+            leds (PixelAnimator): The animator to write the colors to.
+            count (int): The amount of LEDs the effect is played on. Index 0 is the first LED of the effect.
+            elapsed_ms (int): The time since the effect was started in milliseconds.
+
+        Returns:
+            bool: True if the effect has finished, i.e. it won't change anymore and doesn't need to be rendered again.
+        """
+        raise NotImplementedError
+
+class FadeEffect(PixelEffect):
+    """
+    Fades all LEDs from one color to another.
+    """
+
+    def __init__(self, from_color: int, to_color: int, duration_ms: int = 1000):
+        """
+        Initializes the effect.
+
+        Parameters:
+            from_color (int): The packed start color (0xRRGGBB, see ModulinoPixels.pack_rgb()).
+            to_color (int): The packed end color.
+            duration_ms (int): The duration of the fade in milliseconds.
+        """
+        self.from_color = from_color
+        self.to_color = to_color
+        self.duration_ms = duration_ms
+
+    def render(self, leds, count, elapsed_ms):
+        progress = _progress(elapsed_ms, self.duration_ms)
+        color = _lerp(self.from_color, self.to_color, progress)
+        for i in range(count):
+            leds.set(i, color)
+        return progress == _ONE
+
+class GradientEffect(PixelEffect):
+    """
+    Shows a gradient between two colors. If a period is given, the gradient scrolls along the LEDs.
+    """
+
+    def __init__(self, start_color: int, end_color: int, period_ms: int = 0):
+        """
+        Initializes the effect.
+
+        Parameters:
+            start_color (int): The packed color of the first LED (0xRRGGBB, see ModulinoPixels.pack_rgb()).
+            end_color (int): The packed color of the last LED.
+            period_ms (int): The time in milliseconds the gradient takes to scroll by all LEDs. 0 shows a still gradient.
+        """
+        self.start_color = start_color
+        self.end_color = end_color
+        self.period_ms = period_ms
+
+    def render(self, leds, count, elapsed_ms):
+        if count == 1:
+            leds.set(0, self.start_color)
+            return True
+        period = self.period_ms
+        span = (count - 1) << _FRACTION_BITS
+        shift = 0
+        if period > 0:
+            # The scrolling gradient goes from start to end and back so that it wraps around without a jump
+            span = count << _FRACTION_BITS
+            shift = (elapsed_ms % period) * span // period
+        for i in range(count):
+            position = (i << _FRACTION_BITS) + shift
+            if period > 0:
+                position = position % span
+                # Folds the position so that the colors go back to the start color in the second half
+                position = position * 2
+                if position > span:
+                    position = 2 * span - position
+            leds.set(i, _lerp(self.start_color, self.end_color, (position << _FRACTION_BITS) // span))
+        return period <= 0
+
+class RainbowEffect(PixelEffect):
+    """
+    Cycles the LEDs through the colors of the rainbow.
+    """
+
+    def __init__(self, period_ms: int = 2000, spread: int = 32):
+        """
+        Initializes the effect.
+
+        Parameters:
+            period_ms (int): The time in milliseconds for a full cycle through the hues.
+            spread (int): The hue difference between two neighbouring LEDs (256 is a full cycle).
+                          0 shows the same color on all LEDs.
+        """
+        if period_ms <= 0:
+            raise ValueError("The period must be positive")
+        self.period_ms = period_ms
+        self.spread = spread
+
+    def render(self, leds, count, elapsed_ms):
+        hue = ((elapsed_ms % self.period_ms) << _FRACTION_BITS) // self.period_ms
+        spread = self.spread
+        for i in range(count):
+            offset = ((hue + i * spread) & 0xFF) * 3
+            leds.set(i, _HUE[offset] << 16 | _HUE[offset + 1] << 8 | _HUE[offset + 2])
+        return False
+
+class ChaseEffect(PixelEffect):
+    """
+    Moves a light with a fading tail along the LEDs.
+    """
+
+    def __init__(self, color: int, period_ms: int = 800, tail: int = 3, background: int = 0):
+        """
+        Initializes the effect.
+
+        Parameters:
+            color (int): The packed color of the light (0xRRGGBB, see ModulinoPixels.pack_rgb()).
+            period_ms (int): The time in milliseconds the light takes to go around once.
+            tail (int): The length of the fading tail in LEDs.
+            background (int): The packed color of the LEDs that aren't lit by the light.
+        """
+        if period_ms <= 0:
+            raise ValueError("The period must be positive")
+        if tail < 0:
+            raise ValueError("The tail can't be negative")
+        self.color = color
+        self.period_ms = period_ms
+        self.tail = tail
+        self.background = background
+
+    def render(self, leds, count, elapsed_ms):
+        span = count << _FRACTION_BITS
+        head = (elapsed_ms % self.period_ms) * span // self.period_ms
+        length = (self.tail + 1) << _FRACTION_BITS
+        for i in range(count):
+            # Distance of the LED behind the head
+            distance = (head - (i << _FRACTION_BITS)) % span
+            if distance < length:
+                leds.set(i, _lerp(self.background, self.color, _ONE - (distance << _FRACTION_BITS) // length))
+            else:
+                leds.set(i, self.background)
+        return False
+
+class BreatheEffect(PixelEffect):
+    """
+    Lets all LEDs slowly fade in and out.
+    """
+
+    def __init__(self, color: int, period_ms: int = 3000, minimum: int = 0):
+        """
+        Initializes the effect.
+
+        Parameters:
+            color (int): The packed color (0xRRGGBB, see ModulinoPixels.pack_rgb()).
+            period_ms (int): The time in milliseconds for one breath.
+            minimum (int): The lowest intensity in percent.
+        """
+        if period_ms <= 0:
+            raise ValueError("The period must be positive")
+        if minimum < 0 or minimum > 100:
+            raise ValueError(f"Minimum value {minimum} should be between 0 and 100")
+        self.color = color
+        self.period_ms = period_ms
+        self.minimum = minimum * _ONE // 100
+
+    def render(self, leds, count, elapsed_ms):
+        wave = _WAVE[((elapsed_ms % self.period_ms) << _FRACTION_BITS) // self.period_ms]
+        level = self.minimum + (_ONE - self.minimum) * wave // 255
+        color = _lerp(0, self.color, level)
+        for i in range(count):
+            leds.set(i, color)
+        return False
+
+class BlendEffect(PixelEffect):
+    """
+    Cross-fades from one frame to another. A frame is a sequence with a packed color per LED.
+    """
+
+    def __init__(self, from_frame, to_frame, duration_ms: int = 1000):
+        """
+        Initializes the effect.
+
+        Parameters:
+            from_frame (list[int]): The packed colors (0xRRGGBB) of the LEDs at the start.
+            to_frame (list[int]): The packed colors of the LEDs at the end.
+            duration_ms (int): The duration of the blend in milliseconds.
+        """
+        if len(from_frame) != len(to_frame):
+            raise ValueError("The frames must have the same length")
+        self.from_frame = from_frame
+        self.to_frame = to_frame
+        self.duration_ms = duration_ms
+
+    def render(self, leds, count, elapsed_ms):
+        progress = _progress(elapsed_ms, self.duration_ms)
+        from_frame = self.from_frame
+        to_frame = self.to_frame
+        for i in range(min(count, len(from_frame))):
+            leds.set(i, _lerp(from_frame[i], to_frame[i], progress))
+        return progress == _ONE
+
+class PixelAnimator:
+    """
+    Plays effects on the Modulino Pixels. Each effect can be played on a range of the LEDs,
+    e.g. a rainbow on the first four LEDs and a breathing light on the others.
+
+    The animator is driven by tick(), either from a main loop or from the asyncio task of run().
+    A tick renders the effects at most once per frame interval and only sends the colors to the module
+    if they changed, see ModulinoPixels.show(). Effects that have finished (e.g. a fade that reached its color)
+    aren't rendered anymore, so a still frame costs neither CPU nor bus time.
+
+    The effects use integer math only and look up hues, the breathing curve and the gamma correction
+    in precomputed tables (see tools/generate_gamma.py). Rendering a frame doesn't allocate memory.
+
+    Example:
+
+        animator = PixelAnimator(pixels)
+        animator.play(RainbowEffect(period_ms=3000), 0, 3)
+        animator.play(BreatheEffect(ModulinoPixels.pack_rgb(0, 0, 255)), 4, 7)
+        while True:
+            animator.tick()
+            sleep_ms(5)
+    """
+
+    def __init__(self, pixels: ModulinoPixels, fps: int = 50, brightness: int = 100, gamma: bool = True):
+        """
+        Initializes the animator.
+
+        Parameters:
+            pixels (ModulinoPixels): The Modulino Pixels to play the effects on.
+            fps (int): The maximum amount of frames per second.
+            brightness (int): The brightness of the LEDs. It should be a value between 0 and 100.
+                              See ModulinoPixels.perceptual_brightness for how it's mapped to the LEDs.
+            gamma (bool): Whether to correct the colors so that the fades look even to the eye.
+        """
+        if fps <= 0:
+            raise ValueError("The frame rate must be positive")
+        self.pixels = pixels
+        self._interval_ms = 1000 // fps
+        self._next_frame = ticks_ms()
+        self._data = pixels.data
+        self._gamma = GAMMA_8BIT if gamma else None
+        self._offset = 0 # The byte offset of the first LED of the effect that is rendered
+        self._slots = [] # [effect, index_from, index_to, start_ms, finished]
+        self._running = False
+        # The brightness mapping of the pixels is looked up on every frame
+        self._brightness_lut = pixels._brightness_lut
+        self._brightness_byte = 0
+        self.brightness = brightness
+
+    @property
+    def brightness(self) -> int:
+        """
+        The brightness of the LEDs between 0 and 100.
+        """
+        return self._brightness
+
+    @brightness.setter
+    def brightness(self, value: int) -> None:
+        if value < 0 or value > 100:
+            raise ValueError(f"Brightness value {value} should be between 0 and 100")
+        self._brightness = value
+        # The effects need to be rendered again with the new brightness
+        for slot in self._slots:
+            slot[4] = False
+
+    def play(self, effect: PixelEffect, index_from: int = 0, index_to: int = NUM_LEDS - 1, now: int = None) -> None:
+        """
+        Starts an effect on the given (inclusive) range of LEDs. Effects that overlap with the range are removed.
+
+        Parameters:
+            effect (PixelEffect): The effect to play.
+            index_from (int): The first LED of the effect.
+            index_to (int): The last LED of the effect.
+            now (int): The start time from time.ticks_ms(). If omitted, the current time is used.
+        """
+        self.pixels._check_range(index_from, index_to)
+        if now is None:
+            now = ticks_ms()
+        self._slots = [slot for slot in self._slots if slot[2] < index_from or slot[1] > index_to]
+        self._slots.append([effect, index_from, index_to, now, False])
+        # Show the first frame on the next tick
+        self._next_frame = now
+
+    def clear(self) -> None:
+        """
+        Removes all effects. The LEDs keep their current colors.
+        """
+        self._slots = []
+
+    @property
+    def finished(self) -> bool:
+        """
+        Returns True if all effects have finished and the LEDs won't change anymore.
+        """
+        for slot in self._slots:
+            if not slot[4]:
+                return False
+        return True
+
+    def set(self, index: int, color: int, brightness: int = None) -> None:
+        """
+        Writes a color into the LED buffer. Called by the effects while they are rendered.
+
+        Parameters:
+            index (int): The index of the LED relative to the first LED of the effect.
+            color (int): The packed color (0xRRGGBB).
+            brightness (int): The brightness of the LED between 0 and 100. Defaults to the brightness of the animator.
+        """
+        data = self._data
+        i = self._offset + index * 4
+        data[i] = self._brightness_byte if brightness is None else self._brightness_lut[brightness]
+        gamma = self._gamma
+        if gamma is None:
+            data[i + 1] = color & 0xFF
+            data[i + 2] = (color >> 8) & 0xFF
+            data[i + 3] = (color >> 16) & 0xFF
+        else:
+            data[i + 1] = gamma[color & 0xFF]
+            data[i + 2] = gamma[(color >> 8) & 0xFF]
+            data[i + 3] = gamma[(color >> 16) & 0xFF]
+
+    def tick(self, now: int = None) -> bool:
+        """
+        Renders the effects if the next frame is due and sends the LEDs if they changed.
+
+        Parameters:
+            now (int): The current time from time.ticks_ms(). If omitted, the current time is used.
+
+        Returns:
+            bool: True if a frame has been sent to the module.
+        """
+        if now is None:
+            now = ticks_ms()
+        if ticks_diff(now, self._next_frame) < 0:
+            return False
+        self._next_frame = ticks_add(now, self._interval_ms)
+
+        rendered = False
+        self._brightness_lut = self.pixels._brightness_lut
+        self._brightness_byte = self._brightness_lut[self._brightness]
+        for slot in self._slots:
+            if slot[4]:
+                continue
+            self._offset = slot[1] * 4
+            slot[4] = slot[0].render(self, slot[2] - slot[1] + 1, ticks_diff(now, slot[3]))
+            rendered = True
+        if not rendered:
+            return False
+        return self.pixels.show()
+
+    async def run(self) -> None:
+        """
+        Plays the effects until stop() is called.
+        While all effects have finished, the task only checks for new effects once per frame interval.
+        """
+        self._running = True
+        while self._running:
+            self.tick()
+            await asyncio.sleep_ms(max(0, ticks_diff(self._next_frame, ticks_ms())))
+
+    def stop(self) -> None:
+        """
+        Stops run() after the current frame.
+        """
+        self._running = False
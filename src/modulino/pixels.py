@@ -1,5 +1,6 @@
 from .modulino import Modulino
 from .helpers import map_value_int
+from .gamma import PERCEPTUAL_BRIGHTNESS
 
 from micropython import const
 
@@ -55,13 +56,23 @@ ModulinoColor.WHITE = ModulinoColor(255, 255, 255)
 
 NUM_LEDS = const(8)
 
+# Each LED takes 4 bytes: brightness (0xE0 | 0..31), blue, green, red
+_LED_FRAME_SIZE = const(4)
+_BRIGHTNESS_MARKER = const(0xE0)
+
+# Maps the brightness in percent to the 5 bit brightness byte of the LED frame
+_BRIGHTNESS_LUT = bytes([map_value_int(brightness, 0, 100, 0, 0x1f) | _BRIGHTNESS_MARKER for brightness in range(101)])
+# Same, but with the gamma correction of the eye so that equal brightness steps look equal
+_PERCEPTUAL_BRIGHTNESS_LUT = bytes([level | _BRIGHTNESS_MARKER for level in PERCEPTUAL_BRIGHTNESS])
+_CLEARED_FRAME = bytes([_BRIGHTNESS_MARKER, 0, 0, 0] * NUM_LEDS)
+
 class ModulinoPixels(Modulino):
   """
   Class to interact with the LEDs of the Modulino Pixels.
   """
   default_addresses = [0x6C]
 
-  def __init__(self, i2c_bus = None, address=None, check_connection: bool = True):
+  def __init__(self, i2c_bus = None, address=None, check_connection: bool = True, defer_init: bool = False):
     """
     Initializes the Modulino Pixels.
 
@@ -69,13 +80,37 @@ class ModulinoPixels(Modulino):
         i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
         address (int): The I2C address of the module. If not provided, the default address will be used.
         check_connection (bool): Whether to check the connection to the module.
+        defer_init (bool): Accepted for compatibility with the other Modulinos. The constructor doesn't communicate with the module.
     """
     super().__init__(i2c_bus, address, "Pixels", check_connection=check_connection)
+    # The LED frames are written in place, the buffer is never replaced
+    self.data = bytearray(NUM_LEDS * _LED_FRAME_SIZE)
+    self._frame = memoryview(self.data)
+    self._shown_data = bytearray(NUM_LEDS * _LED_FRAME_SIZE) # The data of the last show()
+    self._shown = False
+    self._brightness_lut = _BRIGHTNESS_LUT
     self.clear_all()
 
   @property
   def send_buffer_size(self) -> int:
-    return NUM_LEDS * 4
+    return NUM_LEDS * _LED_FRAME_SIZE
+
+  @property
+  def perceptual_brightness(self) -> bool:
+    """
+    Whether the brightness values (0..100) are gamma corrected, so that e.g. 50 looks half as bright as 100
+    and fading the brightness looks even. When disabled (default) the brightness is mapped linearly to the 32
+    levels of the LEDs. The setting applies to the brightness values that are set afterwards.
+    """
+    return self._brightness_lut is _PERCEPTUAL_BRIGHTNESS_LUT
+
+  @perceptual_brightness.setter
+  def perceptual_brightness(self, value: bool) -> None:
+    self._brightness_lut = _PERCEPTUAL_BRIGHTNESS_LUT if value else _BRIGHTNESS_LUT
+
+  def _on_reconnected(self) -> None:
+    # The module has lost the colors, send them again on the next show()
+    self._shown = False
   
   def set_range_rgb(self, index_from: int, index_to: int, r: int, g: int, b: int, brightness: int = 100) -> 'ModulinoPixels':
     """
@@ -92,13 +127,58 @@ class ModulinoPixels(Modulino):
     Returns:
         ModulinoPixels: The object itself. Allows for daisy chaining of methods.
     """
-    self.set_range_color(index_from, index_to, ModulinoColor(r, g, b), brightness)
+    self._check_range(index_from, index_to)
+    self._write_leds(index_from, index_to, self.pack_rgb(r, g, b), self._brightness_byte(brightness))
     return self
 
-  def _color_to_bytes(self, color: ModulinoColor, brightness: int) -> bytes:
-    mapped_brightness = map_value_int(brightness, 0, 100, 0, 0x1f)
-    color_data_bytes =  int(color) | mapped_brightness | 0xE0
-    return color_data_bytes.to_bytes(4, 'little')
+  def _check_range(self, index_from: int, index_to: int) -> None:
+    if index_to < index_from:
+      raise ValueError(f"LED index_to {index_to} should be greater than or equal to index_from {index_from}")
+    if index_from < 0 or index_from >= NUM_LEDS:
+      raise ValueError(f"LED index_from out of range {index_from} (Valid: 0..{NUM_LEDS - 1})")
+    if index_to < 0 or index_to >= NUM_LEDS:
+      raise ValueError(f"LED index_to out of range {index_to} (Valid: 0..{NUM_LEDS - 1})")
+
+  @staticmethod
+  def pack_rgb(r: int, g: int, b: int) -> int:
+    """
+    Packs the given RGB values into an integer (0xRRGGBB) that can be used with the packed color methods,
+    e.g. set_packed(). Packing a color once and reusing it avoids creating color objects in animations.
+
+    Parameters:
+        r (int): The red value of the color.
+        g (int): The green value of the color.
+        b (int): The blue value of the color.
+
+    Returns:
+        int: The packed color.
+    """
+    if r < 0 or r > 255:
+      raise ValueError(f"Red value {r} should be between 0 and 255")
+    if g < 0 or g > 255:
+      raise ValueError(f"Green value {g} should be between 0 and 255")
+    if b < 0 or b > 255:
+      raise ValueError(f"Blue value {b} should be between 0 and 255")
+    return r << 16 | g << 8 | b
+
+  def _brightness_byte(self, brightness: int) -> int:
+    if brightness < 0 or brightness > 100:
+      raise ValueError(f"Brightness value {brightness} should be between 0 and 100")
+    return self._brightness_lut[brightness]
+
+  def _write_leds(self, index_from: int, index_to: int, packed_color: int, brightness_byte: int) -> None:
+    """
+    Writes the LED frames of the given (inclusive) range into the buffer.
+    """
+    data = self.data
+    blue = packed_color & 0xFF
+    green = (packed_color >> 8) & 0xFF
+    red = (packed_color >> 16) & 0xFF
+    for i in range(index_from * _LED_FRAME_SIZE, (index_to + 1) * _LED_FRAME_SIZE, _LED_FRAME_SIZE):
+      data[i] = brightness_byte
+      data[i + 1] = blue
+      data[i + 2] = green
+      data[i + 3] = red
 
   def set_range_color(self, index_from: int, index_to: int, color: ModulinoColor, brightness: int = 100) -> 'ModulinoPixels':
     """
@@ -113,17 +193,8 @@ class ModulinoPixels(Modulino):
     Returns:
         ModulinoPixels: The object itself. Allows for daisy chaining of methods.
     """
-    if index_to < index_from:
-      raise ValueError(f"LED index_to {index_to} should be greater than or equal to index_from {index_from}")
-    if index_from < 0 or index_from >= NUM_LEDS:
-      raise ValueError(f"LED index_from out of range {index_from} (Valid: 0..{NUM_LEDS - 1})")
-    if index_to < 0 or index_to >= NUM_LEDS:
-      raise ValueError(f"LED index_to out of range {index_to} (Valid: 0..{NUM_LEDS - 1})")
-
-    byte_start_index = index_from * 4
-    byte_end_index = (index_to + 1) * 4
-    data = self._color_to_bytes(color, brightness)
-    self.data[byte_start_index : byte_end_index] = data * (index_to - index_from + 1)  
+    self._check_range(index_from, index_to)
+    self._write_leds(index_from, index_to, color.r << 16 | color.g << 8 | color.b, self._brightness_byte(brightness))
     return self
 
   def set_all_rgb(self, r: int, g: int, b: int, brightness: int = 100) -> 'ModulinoPixels':
@@ -139,7 +210,7 @@ class ModulinoPixels(Modulino):
     Returns:
         ModulinoPixels: The object itself. Allows for daisy chaining of methods.
     """
-    self.set_all_color(ModulinoColor(r, g, b), brightness)
+    self._write_leds(0, NUM_LEDS - 1, self.pack_rgb(r, g, b), self._brightness_byte(brightness))
     return self
 
   def set_all_color(self, color: ModulinoColor, brightness: int = 100) -> 'ModulinoPixels':
@@ -171,9 +242,7 @@ class ModulinoPixels(Modulino):
     if idx < 0 or idx >= NUM_LEDS:
       raise ValueError(f"LED index out of range {idx} (Valid: 0..{NUM_LEDS - 1})")
 
-    byte_index = idx * 4
-    data = self._color_to_bytes(rgb, brightness)
-    self.data[byte_index : byte_index + 4] = data
+    self._write_leds(idx, idx, rgb.r << 16 | rgb.g << 8 | rgb.b, self._brightness_byte(brightness))
     return self
 
   def set_rgb(self, idx: int, r: int, g: int, b: int, brightness: int = 100) -> 'ModulinoPixels':
@@ -190,9 +259,53 @@ class ModulinoPixels(Modulino):
     Returns:
         ModulinoPixels: The object itself. Allows for daisy chaining of methods.
     """
-    self.set_color(idx, ModulinoColor(r, g, b), brightness)
+    if idx < 0 or idx >= NUM_LEDS:
+      raise ValueError(f"LED index out of range {idx} (Valid: 0..{NUM_LEDS - 1})")
+
+    self._write_leds(idx, idx, self.pack_rgb(r, g, b), self._brightness_byte(brightness))
+    return self
+
+  def set_packed(self, idx: int, color: int, brightness: int = 100) -> 'ModulinoPixels':
+    """
+    Sets the color of the given LED index to a packed color (0xRRGGBB, see pack_rgb()).
+    This is the fastest way to set a color, no objects are created.
+
+    Parameters:
+        idx (int): The index of the LED (0..7).
+        color (int): The packed color.
+        brightness (int): The brightness of the LED. It should be a value between 0 and 100.
+
+    Returns:
+        ModulinoPixels: The object itself. Allows for daisy chaining of methods.
+    """
+    if idx < 0 or idx >= NUM_LEDS:
+      raise ValueError(f"LED index out of range {idx} (Valid: 0..{NUM_LEDS - 1})")
+
+    self._write_leds(idx, idx, color, self._brightness_byte(brightness))
+    return self
+
+  def fill_packed(self, color: int, brightness: int = 100) -> 'ModulinoPixels':
+    """
+    Sets the color of all the LEDs to a packed color (0xRRGGBB, see pack_rgb()).
+
+    Parameters:
+        color (int): The packed color.
+        brightness (int): The brightness of the LEDs. It should be a value between 0 and 100.
+
+    Returns:
+        ModulinoPixels: The object itself. Allows for daisy chaining of methods.
+    """
+    self._write_leds(0, NUM_LEDS - 1, color, self._brightness_byte(brightness))
     return self
 
+  @property
+  def frame(self) -> memoryview:
+    """
+    The LED frames that are sent by show(), 4 bytes per LED: brightness (0xE0 | 0..31), blue, green, red.
+    Effects can write into it directly. It stays valid for the lifetime of the object.
+    """
+    return self._frame
+
   def set_brightness(self, idx: int, brightness: int) -> 'ModulinoPixels':
     """
     Sets the brightness of the given LED index.
@@ -210,9 +323,8 @@ class ModulinoPixels(Modulino):
     if brightness < 0 or brightness > 100:
       raise ValueError(f"Brightness value {brightness} should be between 0 and 100")
 
-    byte_index = (idx * 4) # The brightness is stored in the first byte of the 4-byte data (little-endian)
-    mapped_brightness = map_value_int(brightness, 0, 100, 0, 0x1f) # Map to 0..31
-    self.data[byte_index] = mapped_brightness | 0xE0 # Fill bits 5..7 with 1
+    byte_index = (idx * _LED_FRAME_SIZE) # The brightness is stored in the first byte of the LED frame
+    self.data[byte_index] = self._brightness_lut[brightness]
     return self
 
   def set_all_brightness(self, brightness: int) -> 'ModulinoPixels':
@@ -225,8 +337,10 @@ class ModulinoPixels(Modulino):
     Returns:
         ModulinoPixels: The object itself. Allows for daisy chaining of methods.
     """
-    for i in range(NUM_LEDS):
-      self.set_brightness(i, brightness)
+    brightness_byte = self._brightness_byte(brightness)
+    data = self.data
+    for i in range(0, NUM_LEDS * _LED_FRAME_SIZE, _LED_FRAME_SIZE):
+      data[i] = brightness_byte
     return self
 
   def clear(self, idx: int) -> 'ModulinoPixels':
@@ -239,7 +353,10 @@ class ModulinoPixels(Modulino):
     Returns:
         ModulinoPixels: The object itself. Allows for daisy chaining of methods.
     """
-    self.set_color(idx, ModulinoColor(0, 0, 0), 0)
+    if idx < 0 or idx >= NUM_LEDS:
+      raise ValueError(f"LED index out of range {idx} (Valid: 0..{NUM_LEDS - 1})")
+
+    self._write_leds(idx, idx, 0, _BRIGHTNESS_MARKER)
     return self
 
   def clear_range(self, start: int, end: int) -> 'ModulinoPixels':
@@ -259,9 +376,7 @@ class ModulinoPixels(Modulino):
       raise ValueError(f"LED end index out of range {end} (Valid: 0..{NUM_LEDS - 1})")
     if end < start:
       raise ValueError(f"LED end index {end} should be greater than or equal to start index {start}")
-    byte_start_index = start * 4
-    byte_end_index = (end + 1) * 4
-    self.data[byte_start_index : byte_end_index] = bytearray([0xE0] * (end - start + 1) * 4)
+    self._write_leds(start, end, 0, _BRIGHTNESS_MARKER)
     return self
         
   def clear_all(self) -> 'ModulinoPixels':
@@ -271,7 +386,7 @@ class ModulinoPixels(Modulino):
     Returns:
         ModulinoPixels: The object itself. Allows for daisy chaining of methods.
     """
-    self.data = bytearray([0xE0] * NUM_LEDS * 4)
+    self.data[:] = _CLEARED_FRAME
     return self
   
   def __setitem__(self, idx: int, color: tuple | ModulinoColor) -> None:
@@ -298,9 +413,23 @@ class ModulinoPixels(Modulino):
     brightness = 100 if len(color) == 3 else color[3]
     self.set_rgb(idx, color[0], color[1], color[2], brightness)    
 
-  def show(self) -> None:
+  def show(self, force: bool = False) -> bool:
     """
     Applies the changes to the LEDs. This function needs to be called after any changes to the LEDs.
     Otherwise, the changes will not be visible.
-    """
-    self.write(self.data)
+    If nothing has changed since the last call, nothing is sent.
+
+    Parameters:
+        force (bool): Whether to send the data even if nothing has changed,
+                      e.g. after the module has been power cycled.
+
+    Returns:
+        bool: True if the data has been sent.
+    """
+    if self._shown and not force and self.data == self._shown_data:
+      return False
+    if self.write(self.data):
+      self._shown_data[:] = self.data
+      self._shown = True
+      return True
+    return False
@@ -1,4 +1,5 @@
 from .modulino import Modulino
+from machine import I2C
 from micropython import const
 from collections import namedtuple
 
@@ -18,7 +19,7 @@ class ModulinoThermo(Modulino):
     DEFAULT_ADDRESS = const(0x44)
     has_mcu = False
 
-    def __init__(self, i2c_bus: I2C = None, address: int = DEFAULT_ADDRESS, check_connection: bool = True) -> None:
+    def __init__(self, i2c_bus: I2C = None, address: int = DEFAULT_ADDRESS, check_connection: bool = True, defer_init: bool = False) -> None:
         """
         Initializes the Modulino Thermo.
 
@@ -26,16 +27,46 @@ class ModulinoThermo(Modulino):
             i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
             address (int): The I2C address of the module. If not provided, the default address will be used.
             check_connection (bool): Whether to check the connection to the module.
+            defer_init (bool): Whether to postpone the creation of the sensor driver until the sensor is used for the first time.
         """
         super().__init__(i2c_bus, address, "Thermo", check_connection=check_connection)
-        self.sensor: hs3003.HS3003 = hs3003.HS3003(self.i2c_bus)
+        self._sensor: hs3003.HS3003 = None
+        if not defer_init:
+            self._init_sensor()
+
+    def _init_sensor(self) -> None:
+        """
+        Creates the sensor driver.
+        """
+        self._sensor = hs3003.HS3003(self.i2c_bus)
+
+    @property
+    def sensor(self) -> hs3003.HS3003:
+        """
+        The underlying HS3003 driver.
+        It's created on first access if the initialization was deferred.
+        """
+        self._rebind_bus()
+        if self._sensor is None:
+            self._init_sensor()
+        return self._sensor
+
+    def _on_bus_replaced(self) -> None:
+        # The driver keeps a reference to the old bus object, create it again on next use
+        self._sensor = None
+
+    def _on_reconnected(self) -> None:
+        # The sensor has been power cycled, configure it again on next use
+        self._sensor = None
 
     @property
     def measurements(self) -> Measurement:
         """
         Return Temperature and Relative Humidity or None if the data is stalled
         """
-        (temperature, humidity) = self.sensor.measurements
+        # The measurement is triggered and read in separate transactions
+        with self.bus_arbiter:
+            (temperature, humidity) = self.sensor.measurements
         
         if self.sensor._status_bit == 1:
             return Measurement(None, None)
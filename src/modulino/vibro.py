@@ -16,7 +16,7 @@ class ModulinoVibro(Modulino):
   """
   default_addresses = [0x70]
 
-  def __init__(self, i2c_bus=None, address=None, check_connection: bool = True):
+  def __init__(self, i2c_bus=None, address=None, check_connection: bool = True, defer_init: bool = False):
     """
     Initializes the Modulino Vibro.
 
@@ -24,16 +24,28 @@ class ModulinoVibro(Modulino):
         i2c_bus (I2C): The I2C bus to use. If not provided, the default I2C bus will be used.
         address (int): The I2C address of the module. If not provided, the default address will be used.
         check_connection (bool): Whether to check the connection to the module.
+        defer_init (bool): Whether to skip turning off the motor on initialization.
+                           The motor keeps its current state until it's turned on or off for the first time.
     """
     super().__init__(i2c_bus, address, "Vibro", check_connection=check_connection)
     self.data = bytearray(12)
     self.frequency = 1000  # Default frequency in Hz
-    self.off()
+    if not defer_init:
+      self.off()
 
   @property
   def send_buffer_size(self) -> int:
     return 12
 
+  def _encode_vibration(self, lenght_ms: int, power: int) -> None:
+    """
+    Encodes the vibration into the send buffer.
+    Shared by on() and avibrate(), which only differ in how they wait.
+    """
+    self.data[0:4] = self.frequency.to_bytes(4, 'little')
+    self.data[4:8] = lenght_ms.to_bytes(4, 'little')
+    self.data[8:12] = power.to_bytes(4, 'little')
+
   def on(self, lenght_ms: int = 0xFFFF, power = PowerLevel.MEDIUM, blocking: bool = False) -> None:
     """
     Vibrates the motor for the specified duration and power level.
@@ -42,15 +54,30 @@ class ModulinoVibro(Modulino):
         lenght_ms: The duration of the vibration in milliseconds. If omitted, it defaults to 65535 ms (maximum duration).
         blocking: If set to True, the function will wait until the vibration is finished.
     """    
-    self.data[0:4] = self.frequency.to_bytes(4, 'little')
-    self.data[4:8] = lenght_ms.to_bytes(4, 'little')
-    self.data[8:12] = power.to_bytes(4, 'little')
+    self._encode_vibration(lenght_ms, power)
     self.write(self.data)
     
     if blocking:
       # Subtract 5ms to accommodate for the time it takes to send the data
       sleep_ms(lenght_ms - 5)
 
+  async def avibrate(self, lenght_ms: int = 0xFFFF, power = PowerLevel.MEDIUM, blocking: bool = False) -> None:
+    """
+    Coroutine version of on().
+    If blocking is set to True, it waits for the vibration to finish without blocking the event loop.
+
+    Parameters:
+        lenght_ms: The duration of the vibration in milliseconds. If omitted, it defaults to 65535 ms (maximum duration).
+        blocking: If set to True, the coroutine will return once the vibration is finished.
+    """
+    self._encode_vibration(lenght_ms, power)
+    await self.awrite(self.data)
+
+    if blocking:
+      import asyncio
+      # Subtract 5ms to accommodate for the time it takes to send the data
+      await asyncio.sleep_ms(lenght_ms - 5)
+
   def off(self) -> None:
     """
     Stops the motor from vibrating.
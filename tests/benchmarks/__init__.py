@@ -0,0 +1,37 @@
+"""
+Benchmark suite for the driver hot paths.
+Every case runs against the simulated bus from the `sim` package and reports
+transactions, bytes and simulated bus time per operation as well as allocated
+bytes and wall time per operation. The bus metrics are deterministic and are
+compared against the baselines stored in baselines.json.
+See __main__.py for the command line usage.
+"""
+
+import json
+from .cases import CASES, Case
+
+BASELINES_PATH = __file__.rsplit("/", 1)[0] + "/baselines.json"
+
+
+def load_baselines() -> dict:
+    """
+    Returns the stored baselines or an empty dictionary if there are none.
+    """
+    try:
+        with open(BASELINES_PATH, "r") as f:
+            return json.load(f)
+    except OSError:
+        return {}
+
+
+def save_baselines(baselines: dict) -> None:
+    """
+    Stores the given baselines, one case per line to keep diffs readable.
+    """
+    with open(BASELINES_PATH, "w") as f:
+        f.write("{\n")
+        names = sorted(baselines)
+        for i, name in enumerate(names):
+            separator = "," if i < len(names) - 1 else ""
+            f.write(f"  {json.dumps(name)}: {json.dumps(baselines[name])}{separator}\n")
+        f.write("}\n")
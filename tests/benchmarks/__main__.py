@@ -0,0 +1,68 @@
+"""
+Runs the benchmark suite and compares it against the stored baselines.
+
+Usage:
+    PYTHONPATH=src:tests python3 -m benchmarks [--update] [--threshold 0.1] [--iterations 200] [case ...]
+
+Options:
+    --update: Stores the current results as the new baselines.
+    --threshold: Relative increase of a bus metric that counts as regression. Defaults to 0.1 (10%).
+    --iterations: The amount of measured operations per case.
+    case: Only run the cases whose name starts with one of the given prefixes.
+
+Exits with status 1 if any regression was found.
+"""
+
+import sys
+from . import CASES, BASELINES_PATH, load_baselines, save_baselines
+from .runner import measure, compare, format_table
+
+
+def _parse_args(argv: list) -> dict:
+    options = {"update": False, "threshold": 0.1, "iterations": 200, "filters": []}
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--update":
+            options["update"] = True
+        elif arg == "--threshold":
+            i += 1
+            options["threshold"] = float(argv[i])
+        elif arg == "--iterations":
+            i += 1
+            options["iterations"] = int(argv[i])
+        else:
+            options["filters"].append(arg)
+        i += 1
+    return options
+
+
+def main(argv: list) -> int:
+    options = _parse_args(argv)
+    baselines = load_baselines()
+    results = {}
+
+    for case in CASES:
+        if options["filters"] and not any(case.name.startswith(f) for f in options["filters"]):
+            continue
+        if not case.available():
+            print(f"Skipping {case.name}: module '{case.requires}' is not installed.")
+            continue
+        results[case.name] = measure(case, options["iterations"])
+
+    print(format_table(results, baselines))
+
+    if options["update"]:
+        for name, metrics in results.items():
+            baselines[name] = {key: metrics[key] for key in ("transactions", "bytes", "bus_time_us")}
+        save_baselines(baselines)
+        print(f"Baselines written to {BASELINES_PATH}")
+        return 0
+
+    regressions = compare(results, baselines, options["threshold"])
+    for name, metric, old, new in regressions:
+        print(f"REGRESSION {name}: {metric} {old:.1f} -> {new:.1f}")
+    return 1 if regressions else 0
+
+
+sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,323 @@
+"""
+Benchmark cases for the driver hot paths.
+Each case receives a fresh simulated bus and returns the operation to measure.
+Setup costs (constructors, mode switches) are not part of the measurement.
+"""
+
+import sim
+
+
+class Case:
+    """
+    A named benchmark case.
+    """
+
+    def __init__(self, name: str, devices, setup, requires: str = None):
+        """
+        Parameters:
+            name (str): The name of the case as it appears in the report and in the baselines.
+            devices (callable): Returns the device models to attach to the bus.
+            setup (callable): Receives the bus and returns the operation to measure.
+            requires (str): Name of a third party module the case needs. The case is skipped if it's missing.
+        """
+        self.name = name
+        self.devices = devices
+        self.setup = setup
+        self.requires = requires
+
+    def available(self) -> bool:
+        if self.requires is None:
+            return True
+        try:
+            __import__(self.requires)
+            return True
+        except ImportError:
+            return False
+
+    def create(self):
+        """
+        Returns a tuple of the bus and the operation to measure.
+        """
+        bus = sim.SimI2C(devices=self.devices())
+        return bus, self.setup(bus)
+
+
+def _led_matrix_show(use_grayscale: bool):
+    def setup(bus):
+        from modulino import ModulinoLEDMatrix
+        matrix = ModulinoLEDMatrix(bus, use_grayscale=use_grayscale)
+        size = matrix.send_buffer_size
+        frames = (b'\x77' * size, b'\xFF' * size)
+        state = [0]
+
+        def op():
+            state[0] ^= 1
+            matrix.set_frame(frames[state[0]]).show()
+        return op
+    return setup
+
+
+def _led_matrix_pixel(bus):
+    from modulino import ModulinoLEDMatrix
+    matrix = ModulinoLEDMatrix(bus, use_grayscale=True)
+    state = [0]
+
+    def op():
+        # A single pixel changes per frame, the typical case for sparse animations
+        count = state[0] = state[0] + 1
+        index = count % 96
+        matrix.set_pixel(index % 12, index // 12, (count // 96) % 15 + 1).show()
+    return op
+
+
+def _led_matrix_redraw(bus):
+    from modulino import ModulinoLEDMatrix
+    matrix = ModulinoLEDMatrix(bus, use_grayscale=True)
+    state = [0]
+
+    def op():
+        # The whole scene is redrawn every tick but only changes every tenth tick, e.g. a clock face
+        state[0] += 1
+        position = (state[0] // 10) % 8
+        matrix.fill(0).rect(2, 1, 8, 6, 5).set_pixel(3 + position % 6, 3, 15).show()
+    return op
+
+
+def _led_matrix_delta(bus):
+    import sys
+    # The encoder lives in the repository's tools folder next to the tests folder
+    tests_dir = __file__.rsplit("/", 2)[0]
+    sys.path.append(tests_dir + "/../tools/led-matrix")
+    from delta_codec import encode_frames
+    from modulino import ModulinoLEDMatrix, DeltaAnimation
+    matrix = ModulinoLEDMatrix(bus, use_grayscale=True)
+    # A bar sweeping over a static background, only a few bytes change per frame
+    frames = []
+    for step in range(12):
+        frame = bytearray(b'\x11' * 48)
+        for row in range(8):
+            frame[row * 6 + step // 2] = 0xF0 if step % 2 == 0 else 0x0F
+        frames.append(bytes(frame))
+    frames = DeltaAnimation(matrix, encode_frames(frames), 30)._generate_frames(True)
+
+    def op():
+        next(frames)
+        matrix.show()
+    return op
+
+
+def _led_matrix_canvas(bus):
+    from modulino import ModulinoLEDMatrix, LEDMatrixCanvas
+    matrices = [ModulinoLEDMatrix(bus, address=0x40 + i, use_grayscale=True) for i in range(8)]
+    canvas = LEDMatrixCanvas(matrices, columns=4)
+    canvas.show()
+    state = [0]
+
+    def op():
+        # A bar that moves over a 48x16 canvas, only the matrices it enters or leaves are sent
+        state[0] = (state[0] + 1) % canvas.width
+        canvas.clear().vline(state[0], 0, canvas.height).show()
+    return op
+
+
+def _pixels_show(bus):
+    from modulino import ModulinoPixels
+    pixels = ModulinoPixels(bus)
+    state = [0]
+
+    def op():
+        state[0] = (state[0] + 1) & 0xFF
+        pixels.set_all_rgb(state[0], 0, 255 - state[0], 50).show()
+    return op
+
+
+def _pixels_show_static(bus):
+    from modulino import ModulinoPixels
+    pixels = ModulinoPixels(bus)
+    color = pixels.pack_rgb(255, 64, 0)
+
+    def op():
+        # A control loop that redraws the same colors in every iteration
+        pixels.fill_packed(color, 50).show()
+    return op
+
+
+def _pixels_effects(bus):
+    from modulino import ModulinoPixels, PixelAnimator, RainbowEffect
+    pixels = ModulinoPixels(bus)
+    animator = PixelAnimator(pixels)
+    animator.play(RainbowEffect(period_ms=2000), now=0)
+    state = [0]
+
+    def op():
+        # One frame at 50 fps with the simulated clock
+        state[0] += 20
+        animator.tick(state[0])
+    return op
+
+
+def _output_frame(batched: bool):
+    def setup(bus):
+        from modulino import ModulinoLEDMatrix, ModulinoPixels, ModulinoButtons, ModulinoBuzzer
+        matrix = ModulinoLEDMatrix(bus, use_grayscale=True)
+        pixels = ModulinoPixels(bus)
+        buttons = ModulinoButtons(bus)
+        buzzer = ModulinoBuzzer(bus)
+        queue = matrix.command_queue
+        if batched:
+            queue.start()
+        state = [0]
+
+        def op():
+            # One frame of a control loop that updates all outputs, the pixels twice
+            state[0] += 1
+            frame = state[0]
+            matrix.fill(frame & 0x0F).show()
+            pixels.set_all_rgb(frame & 0xFF, 0, 0, 50).show()
+            pixels.set_rgb(0, 0, 255, 0, 50).show()
+            buttons.set_led_status(frame & 1, 0, 1)
+            buzzer.tone(440 + (frame & 0xFF), 100)
+            queue.flush()
+        return op
+    return setup
+
+
+def _buttons_update(monitored):
+    def setup(bus):
+        from modulino import ModulinoButtons
+        buttons = ModulinoButtons(bus)
+        buttons.on_button_a_press = lambda: None
+        buttons.on_button_a_release = lambda: None
+        firmware = bus.device(buttons.address)
+        state = [0]
+        if monitored:
+            buttons.health_monitor.start()
+
+        def op():
+            state[0] += 1
+            firmware.buttons[0] = (state[0] >> 2) & 1  # Toggle every fourth poll
+            buttons.update()
+        return op
+    return setup
+
+
+def _knob_update(bus):
+    from modulino import ModulinoKnob
+    knob = ModulinoKnob(bus)
+    knob.on_rotate_clockwise = lambda steps, value: None
+    knob.on_rotate_counter_clockwise = lambda steps, value: None
+    firmware = bus.device(knob.address)
+    knob.update()
+
+    def op():
+        firmware.rotate(1)
+        knob.update()
+    return op
+
+
+def _joystick_update(bus):
+    from modulino import ModulinoJoystick
+    joystick = ModulinoJoystick(bus)
+    firmware = bus.device(joystick.address)
+    state = [0]
+
+    def op():
+        state[0] = (state[0] + 7) & 0xFF
+        firmware.x = state[0]
+        joystick.update()
+    return op
+
+
+def _distance(bus):
+    from modulino import ModulinoDistance
+    bus.device(0x29).distance_mm = 250
+    sensor = ModulinoDistance(bus)
+    return lambda: sensor.distance
+
+
+def _movement_acceleration(bus):
+    from modulino import ModulinoMovement
+    bus.device(0x6A).set_acceleration(0, 0, 8192)
+    sensor = ModulinoMovement(bus)
+    return lambda: sensor.acceleration
+
+
+def _scan(bus):
+    from modulino import Modulino
+    return lambda: Modulino.scan(bus)
+
+
+def _hotplug_poll(bus):
+    from modulino import HotplugWatcher
+    watcher = HotplugWatcher(bus)
+    watcher.poll()  # Initial enumeration
+    return watcher.poll
+
+
+def _available_devices(defer_init: bool):
+    def setup(bus):
+        from modulino import DeviceManager
+        manager = DeviceManager(bus)
+        # Repeated enumerations reuse the scan results of the first one
+        return lambda: manager.available_devices(rescan=False, defer_init=defer_init)
+    return setup
+
+
+def _discover_chain(bus):
+    import modulino
+    classes = (
+        modulino.ModulinoButtons,
+        modulino.ModulinoKnob,
+        modulino.ModulinoPixels,
+        modulino.ModulinoBuzzer,
+        modulino.ModulinoVibro,
+        modulino.ModulinoLatchRelay,
+        modulino.ModulinoJoystick,
+        modulino.ModulinoLEDMatrix,
+    )
+
+    def op():
+        # Simulates a boot: every Modulino is created with auto discovery on a fresh bus
+        modulino.Modulino.invalidate_scan_cache(bus)
+        for cls in classes:
+            cls(bus)
+    return op
+
+
+def _mcu_chain():
+    return [
+        sim.ButtonsFirmware(),
+        sim.KnobFirmware(),
+        sim.PixelsFirmware(),
+        sim.BuzzerFirmware(),
+        sim.VibroFirmware(),
+        sim.LatchRelayFirmware(),
+        sim.JoystickFirmware(),
+        sim.LEDMatrixFirmware(),
+    ]
+
+
+CASES = [
+    Case("led_matrix.show.mono", lambda: [sim.LEDMatrixFirmware()], _led_matrix_show(False)),
+    Case("led_matrix.show.gs4", lambda: [sim.LEDMatrixFirmware()], _led_matrix_show(True)),
+    Case("led_matrix.set_pixel.gs4", lambda: [sim.LEDMatrixFirmware()], _led_matrix_pixel),
+    Case("led_matrix.redraw.gs4", lambda: [sim.LEDMatrixFirmware()], _led_matrix_redraw),
+    Case("led_matrix.delta.gs4", lambda: [sim.LEDMatrixFirmware()], _led_matrix_delta),
+    Case("led_matrix.canvas.gs4", lambda: [sim.LEDMatrixFirmware(address=0x40 + i) for i in range(8)], _led_matrix_canvas),
+    Case("pixels.show", lambda: [sim.PixelsFirmware()], _pixels_show),
+    Case("pixels.show.static", lambda: [sim.PixelsFirmware()], _pixels_show_static),
+    Case("pixels.effects.rainbow", lambda: [sim.PixelsFirmware()], _pixels_effects),
+    Case("outputs.frame", _mcu_chain, _output_frame(False)),
+    Case("outputs.frame.batched", _mcu_chain, _output_frame(True)),
+    Case("buttons.update", lambda: [sim.ButtonsFirmware()], _buttons_update(False)),
+    Case("buttons.update.monitored", lambda: [sim.ButtonsFirmware()], _buttons_update(True)),
+    Case("knob.update", lambda: [sim.KnobFirmware()], _knob_update),
+    Case("joystick.update", lambda: [sim.JoystickFirmware()], _joystick_update),
+    Case("distance.distance", lambda: [sim.VL53L4CDChip()], _distance),
+    Case("movement.acceleration", lambda: [sim.LSM6DSOXChip()], _movement_acceleration, requires="lsm6dsox"),
+    Case("modulino.scan", _mcu_chain, _scan),
+    Case("hotplug.poll", _mcu_chain, _hotplug_poll),
+    Case("device_manager.available_devices", _mcu_chain, _available_devices(False)),
+    Case("device_manager.available_devices.deferred", _mcu_chain, _available_devices(True)),
+    Case("boot.discover_chain", _mcu_chain, _discover_chain),
+]
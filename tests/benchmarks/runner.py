@@ -0,0 +1,113 @@
+"""
+Measures the benchmark cases and compares them against stored baselines.
+"""
+
+import gc
+import sys
+from time import ticks_us, ticks_diff
+
+BUS_METRICS = ("transactions", "bytes", "bus_time_us")
+"""Metrics that only depend on the driver code and are therefore compared against the baselines."""
+
+
+def _measure_allocations(op, iterations: int) -> int:
+    """
+    Returns the amount of bytes allocated per operation.
+    On MicroPython this is exact. On CPython the peak of transient allocations per operation is used instead.
+    """
+    if sys.implementation.name == "micropython":
+        gc.collect()
+        gc.disable()
+        try:
+            before = gc.mem_alloc()
+            for _ in range(iterations):
+                op()
+            return (gc.mem_alloc() - before) // iterations
+        finally:
+            gc.enable()
+
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(iterations):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            op()
+            total += tracemalloc.get_traced_memory()[1] - current
+        return total // iterations
+    finally:
+        tracemalloc.stop()
+
+
+def measure(case, iterations: int = 200, warmup: int = 5) -> dict:
+    """
+    Runs a benchmark case and returns the per operation metrics.
+
+    Parameters:
+        case (Case): The case to run.
+        iterations (int): The amount of measured operations.
+        warmup (int): The amount of operations to run before measuring.
+    """
+    bus, op = case.create()
+    for _ in range(warmup):
+        op()
+
+    bus.reset_stats()
+    start = ticks_us()
+    for _ in range(iterations):
+        op()
+    wall_time = ticks_diff(ticks_us(), start)
+    stats = bus.snapshot()
+
+    return {
+        "transactions": stats["transactions"] / iterations,
+        "bytes": (stats["bytes_written"] + stats["bytes_read"]) / iterations,
+        "bus_time_us": stats["bus_time_us"] / iterations,
+        "alloc_bytes": _measure_allocations(op, min(iterations, 20)),
+        "wall_time_us": wall_time / iterations,
+    }
+
+
+def compare(results: dict, baselines: dict, threshold: float) -> list:
+    """
+    Compares the results against the baselines.
+
+    Parameters:
+        results (dict): Case name -> metrics as returned by measure().
+        baselines (dict): Case name -> stored metrics.
+        threshold (float): Relative increase that counts as regression, e.g. 0.1 for 10%.
+
+    Returns:
+        list: A list of (case name, metric, baseline value, new value) tuples for every regression.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        for metric in BUS_METRICS:
+            if metric not in baseline:
+                continue
+            if metrics[metric] > baseline[metric] * (1 + threshold):
+                regressions.append((name, metric, baseline[metric], metrics[metric]))
+    return regressions
+
+
+def format_table(results: dict, baselines: dict) -> str:
+    """
+    Formats the results as a table. Bus metrics that differ from the baseline show the baseline in brackets.
+    """
+    header = f"{'case':<44}{'trans/op':>14}{'bytes/op':>16}{'bus us/op':>18}{'alloc B/op':>12}{'wall us/op':>12}"
+    lines = [header, "-" * len(header)]
+    for name, metrics in results.items():
+        baseline = baselines.get(name, {})
+        cells = []
+        for metric, width in zip(BUS_METRICS, (14, 16, 18)):
+            value = metrics[metric]
+            cell = f"{value:.1f}"
+            if metric in baseline and baseline[metric] != value:
+                cell += f" ({baseline[metric]:.1f})"
+            cells.append(f"{cell:>{width}}")
+        lines.append(f"{name:<44}{''.join(cells)}{metrics['alloc_bytes']:>12}{metrics['wall_time_us']:>12.1f}")
+    return "\n".join(lines)
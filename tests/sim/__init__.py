@@ -0,0 +1,63 @@
+"""
+Simulated I2C bus and Modulino device models.
+Allows running the drivers on a host (CPython or the MicroPython unix port)
+without any hardware attached, e.g. to measure bus usage on a CI machine.
+
+Example:
+
+    import sim
+    from modulino import ModulinoButtons
+
+    bus = sim.SimI2C(devices=[sim.ButtonsFirmware()])
+    buttons = ModulinoButtons(bus)
+    buttons.update()
+    print(bus.snapshot())
+
+Run from the repository root with both `src` and `tests` on the module search path, e.g.
+`PYTHONPATH=src:tests python3 script.py` or `MICROPYPATH=src:tests:.frozen micropython script.py`.
+The sensor drivers the package depends on (lsm6dsox, ltr381rgb, micropython_hs3003)
+need to be on the search path as well.
+"""
+
+from . import host
+host.install()
+
+from .host import use_bus
+from .bus import SimI2C, SimSoftI2C, BusStats
+from .devices import (
+    SimDevice,
+    ModulinoFirmware,
+    ButtonsFirmware,
+    KnobFirmware,
+    PixelsFirmware,
+    BuzzerFirmware,
+    VibroFirmware,
+    LatchRelayFirmware,
+    JoystickFirmware,
+    LEDMatrixFirmware,
+    RegisterDevice,
+    LSM6DSOXChip,
+    LTR381RGBChip,
+    HS3003Chip,
+    VL53L4CDChip,
+)
+
+
+def full_chain(freq: int = 100000, **kwargs) -> SimI2C:
+    """
+    Returns a bus with one of each Modulino attached at its default address.
+    """
+    return SimI2C(freq=freq, devices=[
+        ButtonsFirmware(),
+        KnobFirmware(),
+        PixelsFirmware(),
+        BuzzerFirmware(),
+        VibroFirmware(),
+        LatchRelayFirmware(),
+        JoystickFirmware(),
+        LEDMatrixFirmware(),
+        LSM6DSOXChip(),
+        LTR381RGBChip(),
+        HS3003Chip(),
+        VL53L4CDChip(),
+    ], **kwargs)
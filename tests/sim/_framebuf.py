@@ -0,0 +1,180 @@
+"""
+Host replacement for the `framebuf` module.
+Implements the pixel formats and drawing primitives used by the Modulino drivers.
+Text rendering is not supported because the built-in font is not available on the host.
+"""
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS4_HMSB = 2
+GS8 = 6
+
+
+class FrameBuffer:
+
+    def __init__(self, buffer, width: int, height: int, format: int, stride: int = None):
+        if format not in (MONO_VLSB, MONO_HLSB, MONO_HMSB, GS4_HMSB, GS8):
+            raise ValueError("invalid format")
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = width if stride is None else stride
+        if format == GS4_HMSB:
+            self.stride = (self.stride + 1) & ~1
+        elif format in (MONO_HLSB, MONO_HMSB):
+            self.stride = (self.stride + 7) & ~7
+
+    def _get(self, x: int, y: int) -> int:
+        buffer = self.buffer
+        format = self.format
+        if format == MONO_VLSB:
+            return (buffer[(y >> 3) * self.stride + x] >> (y & 7)) & 1
+        if format == GS4_HMSB:
+            value = buffer[(x + y * self.stride) >> 1]
+            return value & 0x0F if x & 1 else value >> 4
+        if format == GS8:
+            return buffer[x + y * self.stride]
+        index = (x + y * self.stride) >> 3
+        bit = x & 7 if format == MONO_HMSB else 7 - (x & 7)
+        return (buffer[index] >> bit) & 1
+
+    def _set(self, x: int, y: int, color: int) -> None:
+        buffer = self.buffer
+        format = self.format
+        if format == MONO_VLSB:
+            index = (y >> 3) * self.stride + x
+            mask = 1 << (y & 7)
+            buffer[index] = (buffer[index] | mask) if color & 1 else (buffer[index] & ~mask)
+        elif format == GS4_HMSB:
+            index = (x + y * self.stride) >> 1
+            if x & 1:
+                buffer[index] = (buffer[index] & 0xF0) | (color & 0x0F)
+            else:
+                buffer[index] = (buffer[index] & 0x0F) | ((color & 0x0F) << 4)
+        elif format == GS8:
+            buffer[x + y * self.stride] = color & 0xFF
+        else:
+            index = (x + y * self.stride) >> 3
+            bit = x & 7 if format == MONO_HMSB else 7 - (x & 7)
+            mask = 1 << bit
+            buffer[index] = (buffer[index] | mask) if color & 1 else (buffer[index] & ~mask)
+
+    def pixel(self, x: int, y: int, color: int = None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        if color is None:
+            return self._get(x, y)
+        self._set(x, y, color)
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, color: int) -> None:
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, color)
+
+    def fill(self, color: int) -> None:
+        self.fill_rect(0, 0, self.width, self.height, color)
+
+    def hline(self, x: int, y: int, w: int, color: int) -> None:
+        self.fill_rect(x, y, w, 1, color)
+
+    def vline(self, x: int, y: int, h: int, color: int) -> None:
+        self.fill_rect(x, y, 1, h, color)
+
+    def rect(self, x: int, y: int, w: int, h: int, color: int, fill: bool = False) -> None:
+        if fill:
+            self.fill_rect(x, y, w, h, color)
+            return
+        self.fill_rect(x, y, w, 1, color)
+        self.fill_rect(x, y + h - 1, w, 1, color)
+        self.fill_rect(x, y, 1, h, color)
+        self.fill_rect(x + w - 1, y, 1, h, color)
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, color: int) -> None:
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        error = dx + dy
+        while True:
+            self.pixel(x1, y1, color)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * error
+            if e2 >= dy:
+                error += dy
+                x1 += sx
+            if e2 <= dx:
+                error += dx
+                y1 += sy
+
+    def ellipse(self, x: int, y: int, xr: int, yr: int, color: int, fill: bool = False, mask: int = 0x0F) -> None:
+        quadrants = ((1, -1, 0x01), (-1, -1, 0x02), (-1, 1, 0x04), (1, 1, 0x08))
+        for yy in range(0, yr + 1):
+            for xx in range(0, xr + 1):
+                # Point lies inside the ellipse (x/xr)^2 + (y/yr)^2 <= 1
+                inside = (xx * xx) * (yr * yr) + (yy * yy) * (xr * xr) <= (xr * xr) * (yr * yr)
+                if not inside:
+                    continue
+                outer_x = ((xx + 1) * (xx + 1)) * (yr * yr) + (yy * yy) * (xr * xr) > (xr * xr) * (yr * yr)
+                outer_y = (xx * xx) * (yr * yr) + ((yy + 1) * (yy + 1)) * (xr * xr) > (xr * xr) * (yr * yr)
+                if not fill and not (outer_x or outer_y):
+                    continue
+                for qx, qy, bit in quadrants:
+                    if mask & bit:
+                        self.pixel(x + qx * xx, y + qy * yy, color)
+
+    def poly(self, x: int, y: int, coords, color: int, fill: bool = False) -> None:
+        count = len(coords) // 2
+        if count == 0:
+            return
+        points = [(coords[2 * i] + x, coords[2 * i + 1] + y) for i in range(count)]
+        if fill:
+            min_y = min(point[1] for point in points)
+            max_y = max(point[1] for point in points)
+            for yy in range(min_y, max_y + 1):
+                nodes = []
+                for i in range(count):
+                    ax, ay = points[i]
+                    bx, by = points[(i + 1) % count]
+                    if (ay <= yy < by) or (by <= yy < ay):
+                        nodes.append(ax + (yy - ay) * (bx - ax) // (by - ay))
+                nodes.sort()
+                for i in range(0, len(nodes) - 1, 2):
+                    self.hline(nodes[i], yy, nodes[i + 1] - nodes[i] + 1, color)
+        for i in range(count):
+            ax, ay = points[i]
+            bx, by = points[(i + 1) % count]
+            self.line(ax, ay, bx, by, color)
+
+    def text(self, s: str, x: int, y: int, color: int = 1) -> None:
+        raise NotImplementedError("Text rendering is not available on the host")
+
+    def scroll(self, xstep: int, ystep: int) -> None:
+        width = self.width
+        height = self.height
+        xs = range(width - 1, -1, -1) if xstep > 0 else range(width)
+        ys = range(height - 1, -1, -1) if ystep > 0 else range(height)
+        for yy in ys:
+            for xx in xs:
+                sx = xx - xstep
+                sy = yy - ystep
+                if 0 <= sx < width and 0 <= sy < height:
+                    self._set(xx, yy, self._get(sx, sy))
+
+    def blit(self, source, x: int, y: int, key: int = -1, palette=None) -> None:
+        if isinstance(source, tuple):
+            source = FrameBuffer(*source)
+        for yy in range(source.height):
+            for xx in range(source.width):
+                color = source._get(xx, yy)
+                if palette is not None:
+                    color = palette._get(color, 0)
+                if color == key:
+                    continue
+                self.pixel(x + xx, y + yy, color)
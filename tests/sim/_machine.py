@@ -0,0 +1,31 @@
+"""
+Host replacement for the `machine` module.
+I2C and SoftI2C are simulated buses without any devices attached.
+"""
+
+from .bus import SimI2C as I2C, SimSoftI2C as SoftI2C
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+
+    def __init__(self, id, mode: int = -1, pull: int = -1, *, value: int = None):
+        self.id = id
+        self.mode = mode
+        self._value = 1 if value is None else value
+
+    def value(self, value: int = None):
+        if value is None:
+            # Released lines are pulled up, so an idle bus always reads high
+            return 1 if self.mode == self.OPEN_DRAIN else self._value
+        self._value = value
+
+    def on(self) -> None:
+        self._value = 1
+
+    def off(self) -> None:
+        self._value = 0
@@ -0,0 +1,15 @@
+"""
+Host replacement for the `micropython` module.
+"""
+
+
+def const(value):
+    return value
+
+
+def native(function):
+    return function
+
+
+def viper(function):
+    return function
@@ -0,0 +1,331 @@
+"""
+A pure Python stand-in for machine.I2C / machine.SoftI2C.
+It routes every transfer to the device models attached to it and keeps
+track of transactions, transferred bytes and the time the transfers
+would have taken on a real bus at the configured clock frequency.
+"""
+
+import time
+from errno import ENODEV, EIO
+
+# Bit times per transaction overhead: START (or repeated START) + address byte incl. ACK
+_ADDRESS_PHASE_BITS = 10
+_STOP_BITS = 1
+_BITS_PER_BYTE = 9  # 8 data bits + ACK/NACK
+
+
+class BusStats:
+    """
+    Counters collected by a simulated bus.
+    A transaction is any bus call that addresses a device, i.e. everything
+    between a START (or repeated START) and the next STOP or repeated START.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Resets all counters to zero.
+        """
+        self.transactions = 0
+        self.nacks = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.clock_cycles = 0
+        self.penalty_us = 0
+        self.per_address = {}  # address -> [transactions, bytes written, bytes read]
+
+    @property
+    def bytes(self) -> int:
+        """
+        The total amount of payload bytes transferred in both directions.
+        """
+        return self.bytes_written + self.bytes_read
+
+    def snapshot(self, freq: int) -> dict:
+        """
+        Returns the counters as a dictionary.
+
+        Parameters:
+            freq (int): The bus frequency used to convert clock cycles to time.
+        """
+        return {
+            "transactions": self.transactions,
+            "nacks": self.nacks,
+            "bytes_written": self.bytes_written,
+            "bytes_read": self.bytes_read,
+            "bus_time_us": self.clock_cycles * 1000000 // freq + self.penalty_us,
+        }
+
+
+def _pin_id(pin):
+    if pin is None or isinstance(pin, int):
+        return pin
+    return getattr(pin, "id", None)
+
+
+class SimI2C:
+    """
+    Simulated I2C controller with the same API as machine.I2C.
+    Device models (see devices.py) are attached to it by their 7-bit address.
+    Addresses without a device are NACKed with OSError(ENODEV), just like on real hardware.
+
+    Controllers that are created with the same bus number and pins share the same wires,
+    i.e. the attached devices, the statistics and injected faults. This mirrors re-creating
+    a machine.I2C object for the same pins, e.g. after a bus recovery.
+    """
+
+    _wires = {}  # (class name, id, scl, sda) -> controller that created the wires
+
+    def __init__(self, id: int = 0, *, scl=None, sda=None, freq: int = 100000, timeout: int = 50000,
+                 nack_penalty_us: int = 0, devices: list = None, record: bool = False, realtime: bool = False):
+        """
+        Initializes the simulated bus.
+
+        Parameters:
+            id (int): The bus number. Only used for the string representation.
+            scl: Ignored. Accepted for API compatibility.
+            sda: Ignored. Accepted for API compatibility.
+            freq (int): The simulated bus clock in Hz. Modulinos run at 100kHz.
+            timeout (int): Ignored. Accepted for API compatibility.
+            nack_penalty_us (int): Extra time in microseconds charged for every NACKed address.
+                                   Some ports spend considerable time waiting before they report a missing device.
+            devices (list): Device models to attach to the bus.
+            record (bool): Whether to record every transaction in the `log` list.
+            realtime (bool): Whether every transaction blocks for its simulated bus time.
+                             Useful to test timing sensitive code such as animations.
+        """
+        self.id = id
+        self.scl = _pin_id(scl)
+        self.sda = _pin_id(sda)
+        self.freq = freq
+        self.nack_penalty_us = nack_penalty_us
+        self.stats = BusStats()
+        self.record = record
+        self.realtime = realtime
+        self.log = []  # (operation, address, bytes written, bytes read)
+        self._devices = {}
+        self._fault = [0, 0, False]  # errno, remaining transactions, stuck until the controller is re-created
+
+        if self.scl is not None and self.sda is not None:
+            key = (type(self).__name__, id, self.scl, self.sda)
+            wires = SimI2C._wires.get(key)
+            if wires is None:
+                SimI2C._wires[key] = self
+            else:
+                self._devices = wires._devices
+                self.stats = wires.stats
+                self._fault = wires._fault
+                # Re-creating the controller recovers a stuck bus
+                if self._fault[2]:
+                    self._fault[:] = [0, 0, False]
+
+        for device in devices or []:
+            self.attach(device)
+
+    def __repr__(self) -> str:
+        if self.scl is not None and self.sda is not None:
+            return f"SimI2C({self.id}, scl={self.scl}, sda={self.sda}, freq={self.freq})"
+        return f"SimI2C({self.id}, freq={self.freq})"
+
+    def inject_fault(self, error: int = EIO, count: int = 1, stuck: bool = False) -> None:
+        """
+        Makes the next transactions fail with OSError(error), e.g. to simulate electrical noise.
+
+        Parameters:
+            error (int): The errno of the raised errors, e.g. EIO or ETIMEDOUT.
+            count (int): The amount of transactions that fail.
+            stuck (bool): If True, all transactions fail until a new controller is created for the same pins,
+                          like a bus that is held low by a device until it's recovered.
+        """
+        self._fault[:] = [error, count, stuck]
+
+    def init(self, *, freq: int = None, **kwargs) -> None:
+        if freq is not None:
+            self.freq = freq
+
+    def deinit(self) -> None:
+        pass
+
+    # Device management
+
+    def attach(self, device, address: int = None):
+        """
+        Attaches a device model to the bus.
+
+        Parameters:
+            device (SimDevice): The device model.
+            address (int): The 7-bit address. Defaults to the device's own address.
+
+        Returns:
+            SimDevice: The attached device.
+        """
+        if address is not None:
+            device.address = address
+        if device.address in self._devices:
+            raise ValueError(f"Address {hex(device.address)} is already in use")
+        device.bus = self
+        self._devices[device.address] = device
+        return device
+
+    def detach(self, device_or_address):
+        """
+        Removes a device from the bus, e.g. to simulate unplugging it.
+
+        Returns:
+            SimDevice: The removed device or None if no device was found.
+        """
+        address = device_or_address if isinstance(device_or_address, int) else device_or_address.address
+        device = self._devices.pop(address, None)
+        if device is not None:
+            device.bus = None
+        return device
+
+    def move(self, device, new_address: int) -> None:
+        """
+        Moves a device to a new address. Used by devices that can change their address.
+        """
+        self._devices.pop(device.address, None)
+        device.address = new_address
+        self._devices[new_address] = device
+
+    def device(self, address: int):
+        """
+        Returns the device model attached at the given address or None.
+        """
+        return self._devices.get(address)
+
+    @property
+    def devices(self) -> list:
+        """
+        Returns all attached device models sorted by address.
+        """
+        return [self._devices[address] for address in sorted(self._devices)]
+
+    # Accounting
+
+    def _account(self, operation: str, address: int, written: int, read: int, stop: bool) -> None:
+        stats = self.stats
+        stats.transactions += 1
+        stats.bytes_written += written
+        stats.bytes_read += read
+        cycles = _ADDRESS_PHASE_BITS + (written + read) * _BITS_PER_BYTE + (_STOP_BITS if stop else 0)
+        stats.clock_cycles += cycles
+        counters = stats.per_address.get(address)
+        if counters is None:
+            counters = stats.per_address[address] = [0, 0, 0]
+        counters[0] += 1
+        counters[1] += written
+        counters[2] += read
+        if self.record:
+            self.log.append((operation, address, written, read))
+        if self.realtime:
+            time.sleep_us(cycles * 1000000 // self.freq)
+
+    def _target(self, operation: str, address: int):
+        fault = self._fault
+        if fault[2] or fault[1] > 0:
+            if not fault[2]:
+                fault[1] -= 1
+            self.stats.transactions += 1
+            if self.record:
+                self.log.append((operation, address, 0, 0))
+            raise OSError(fault[0])
+
+        device = self._devices.get(address)
+        if device is None or not device.responds():
+            stats = self.stats
+            stats.transactions += 1
+            stats.nacks += 1
+            stats.clock_cycles += _ADDRESS_PHASE_BITS + _STOP_BITS
+            stats.penalty_us += self.nack_penalty_us
+            if self.record:
+                self.log.append((operation, address, 0, 0))
+            if self.realtime:
+                time.sleep_us((_ADDRESS_PHASE_BITS + _STOP_BITS) * 1000000 // self.freq + self.nack_penalty_us)
+            raise OSError(ENODEV)
+        return device
+
+    @property
+    def bus_time_us(self) -> int:
+        """
+        The accumulated simulated bus time in microseconds.
+        """
+        return self.stats.clock_cycles * 1000000 // self.freq + self.stats.penalty_us
+
+    def reset_stats(self) -> None:
+        """
+        Resets the statistics and the transaction log.
+        """
+        self.stats.reset()
+        self.log.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current statistics as a dictionary.
+        """
+        return self.stats.snapshot(self.freq)
+
+    # machine.I2C API
+
+    def scan(self) -> list:
+        result = []
+        for address in range(0x08, 0x78):
+            try:
+                self._target("scan", address)
+            except OSError:
+                continue
+            self._account("scan", address, 0, 0, True)
+            result.append(address)
+        return result
+
+    def writeto(self, addr: int, buf, stop: bool = True) -> int:
+        device = self._target("writeto", addr)
+        self._account("writeto", addr, len(buf), 0, stop)
+        device.write(bytes(buf), stop)
+        return len(buf) + 1  # Number of ACKs received
+
+    def writevto(self, addr: int, vector, stop: bool = True) -> int:
+        data = b''.join(bytes(buf) for buf in vector)
+        return self.writeto(addr, data, stop)
+
+    def readfrom(self, addr: int, nbytes: int, stop: bool = True) -> bytes:
+        device = self._target("readfrom", addr)
+        self._account("readfrom", addr, 0, nbytes, stop)
+        return bytes(device.read(nbytes))
+
+    def readfrom_into(self, addr: int, buf, stop: bool = True) -> None:
+        device = self._target("readfrom_into", addr)
+        self._account("readfrom_into", addr, 0, len(buf), stop)
+        buf[:] = device.read(len(buf))
+
+    def readfrom_mem(self, addr: int, memaddr: int, nbytes: int, *, addrsize: int = 8) -> bytes:
+        device = self._target("readfrom_mem", addr)
+        # The register address is written, then a repeated START begins the read: two transactions
+        self._account("readfrom_mem", addr, addrsize // 8, 0, False)
+        self._account("readfrom_mem", addr, 0, nbytes, True)
+        return bytes(device.read_mem(memaddr, nbytes, addrsize))
+
+    def readfrom_mem_into(self, addr: int, memaddr: int, buf, *, addrsize: int = 8) -> None:
+        device = self._target("readfrom_mem_into", addr)
+        # The register address is written, then a repeated START begins the read: two transactions
+        self._account("readfrom_mem_into", addr, addrsize // 8, 0, False)
+        self._account("readfrom_mem_into", addr, 0, len(buf), True)
+        buf[:] = device.read_mem(memaddr, len(buf), addrsize)
+
+    def writeto_mem(self, addr: int, memaddr: int, buf, *, addrsize: int = 8) -> None:
+        device = self._target("writeto_mem", addr)
+        self._account("writeto_mem", addr, addrsize // 8 + len(buf), 0, True)
+        device.write_mem(memaddr, bytes(buf), addrsize)
+
+
+class SimSoftI2C(SimI2C):
+    """
+    Simulated bit-banged I2C controller. Behaves like SimI2C.
+    """
+
+    def __repr__(self) -> str:
+        if self.scl is not None and self.sda is not None:
+            return f"SimSoftI2C(scl={self.scl}, sda={self.sda}, freq={self.freq})"
+        return f"SimSoftI2C(freq={self.freq})"
@@ -0,0 +1,447 @@
+"""
+Register level models of the Modulino firmware and of the sensor chips
+used on the Modulinos without a microcontroller.
+The models implement just enough behaviour for the drivers to run unmodified
+and expose helpers to change their state, e.g. pressing a button.
+"""
+
+from struct import pack, unpack_from
+
+_BOOTLOADER_ADDRESS = 0x64
+
+
+class SimDevice:
+    """
+    Base class for all device models attached to a SimI2C bus.
+    """
+
+    address: int = None
+
+    def __init__(self, address: int = None):
+        if address is not None:
+            self.address = address
+        self.bus = None
+        self.present = True
+
+    def responds(self) -> bool:
+        """
+        Whether the device ACKs its address. Set `present` to False to simulate a device that stopped responding.
+        """
+        return self.present
+
+    def write(self, data: bytes, stop: bool) -> None:
+        pass
+
+    def read(self, nbytes: int) -> bytes:
+        return bytes(nbytes)
+
+    def read_mem(self, memaddr: int, nbytes: int, addrsize: int) -> bytes:
+        self.write(memaddr.to_bytes(addrsize // 8, 'big'), False)
+        return self.read(nbytes)
+
+    def write_mem(self, memaddr: int, data: bytes, addrsize: int) -> None:
+        self.write(memaddr.to_bytes(addrsize // 8, 'big') + data, True)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({hex(self.address)})"
+
+
+# Modulinos with a microcontroller
+
+class ModulinoFirmware(SimDevice):
+    """
+    Model of the common Modulino firmware.
+    Reads return the 8-bit pinstrap address followed by the device status.
+    Writes are only processed if their length matches the expected command size.
+    """
+
+    pinstrap: int = None
+    """The 8-bit pinstrap address of the module. The 7-bit bus address is derived from it."""
+
+    command_size: int = 0
+    """The amount of bytes the firmware expects per write."""
+
+    def __init__(self, address: int = None, pinstrap: int = None):
+        if pinstrap is not None:
+            self.pinstrap = pinstrap
+        super().__init__(address if address is not None else self.pinstrap >> 1)
+        self.commands_received = 0
+        self.commands_ignored = 0
+        self.in_bootloader = False
+
+    def status(self) -> bytes:
+        """
+        Returns the status bytes that follow the pinstrap address in each read.
+        """
+        return b''
+
+    def on_command(self, data: bytes) -> None:
+        """
+        Handles a command of the expected size.
+        """
+        pass
+
+    def read(self, nbytes: int) -> bytes:
+        data = bytes([self.pinstrap]) + self.status()
+        if len(data) < nbytes:
+            data += bytes(nbytes - len(data))
+        return data[:nbytes]
+
+    def write(self, data: bytes, stop: bool) -> None:
+        if len(data) == 0:
+            return  # Address probe
+        if len(data) != self.command_size:
+            self.commands_ignored += 1
+            return
+        self.commands_received += 1
+
+        if data[0:2] == b'CF':
+            if self.bus is not None:
+                self.bus.move(self, data[2] >> 1)
+            return
+
+        if data[0:3] == b'DIE':
+            self.in_bootloader = True
+            if self.bus is not None:
+                self.bus.move(self, _BOOTLOADER_ADDRESS)
+            return
+
+        self.on_command(data)
+
+
+class ButtonsFirmware(ModulinoFirmware):
+    pinstrap = 0x7C
+    command_size = 3
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.buttons = bytearray(3)
+        self.leds = bytearray(3)
+
+    def press(self, index: int) -> None:
+        self.buttons[index] = 1
+
+    def release(self, index: int) -> None:
+        self.buttons[index] = 0
+
+    def status(self) -> bytes:
+        return bytes(self.buttons)
+
+    def on_command(self, data: bytes) -> None:
+        self.leds[:] = data
+
+
+class KnobFirmware(ModulinoFirmware):
+    pinstrap = 0x74
+    command_size = 4
+
+    def __init__(self, address: int = None, pinstrap: int = None):
+        super().__init__(address, pinstrap)
+        self.value = 0
+        self.pressed = False
+
+    def rotate(self, steps: int) -> None:
+        self.value = (self.value + steps + 0x8000) % 0x10000 - 0x8000
+
+    def status(self) -> bytes:
+        return pack('<hB', self.value, 1 if self.pressed else 0)
+
+    def on_command(self, data: bytes) -> None:
+        self.value = unpack_from('<h', data)[0]
+
+
+class PixelsFirmware(ModulinoFirmware):
+    pinstrap = 0x6C
+    command_size = 32
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.leds = bytearray(32)
+
+    def on_command(self, data: bytes) -> None:
+        self.leds[:] = data
+
+
+class BuzzerFirmware(ModulinoFirmware):
+    pinstrap = 0x3C
+    command_size = 8
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.frequency = 0
+        self.duration = 0
+
+    def on_command(self, data: bytes) -> None:
+        self.frequency, self.duration = unpack_from('<II', data)
+
+
+class VibroFirmware(ModulinoFirmware):
+    pinstrap = 0x70
+    command_size = 12
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.frequency = 0
+        self.duration = 0
+        self.power = 0
+
+    def on_command(self, data: bytes) -> None:
+        self.frequency, self.duration, self.power = unpack_from('<III', data)
+
+
+class LatchRelayFirmware(ModulinoFirmware):
+    pinstrap = 0x04
+    command_size = 3
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.state = None  # Unknown until the first command
+
+    def status(self) -> bytes:
+        if self.state is None:
+            return b'\x00\x00'
+        return b'\x00\x01' if self.state else b'\x01\x00'
+
+    def on_command(self, data: bytes) -> None:
+        self.state = data[0] == 1
+
+
+class JoystickFirmware(ModulinoFirmware):
+    pinstrap = 0x58
+    command_size = 3
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.x = 128
+        self.y = 128
+        self.pressed = False
+
+    def status(self) -> bytes:
+        return bytes([self.x, self.y, 1 if self.pressed else 0])
+
+
+class LEDMatrixFirmware(ModulinoFirmware):
+    """
+    Model of the LED matrix firmware. It starts in monochrome mode and
+    expects 12 bytes per write in monochrome and 48 bytes in grayscale mode.
+    """
+    pinstrap = 0x72
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.mode = b'MON'
+        self.frame = bytearray(12)
+        self.frames_received = 0
+
+    @property
+    def command_size(self) -> int:
+        return 48 if self.mode == b'GS4' else 12
+
+    def status(self) -> bytes:
+        return self.mode
+
+    def on_command(self, data: bytes) -> None:
+        if data[0:3] in (b'MON', b'GS4'):
+            self.mode = data[0:3]
+            self.frame = bytearray(self.command_size)
+            return
+        self.frame[:] = data
+        self.frames_received += 1
+
+
+# Sensors without a microcontroller
+
+class RegisterDevice(SimDevice):
+    """
+    Generic register file with an auto-incrementing register pointer.
+    Subclasses can intercept accesses by overriding `read_register` and `write_register`.
+    """
+
+    register_address_size: int = 1
+    register_count: int = 0x100
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.registers = bytearray(self.register_count)
+        self._pointer = 0
+
+    def read_register(self, register: int) -> int:
+        return self.registers[register % self.register_count]
+
+    def write_register(self, register: int, value: int) -> None:
+        self.registers[register % self.register_count] = value
+
+    def set_registers(self, register: int, data: bytes) -> None:
+        """
+        Sets register values without triggering side effects.
+        """
+        self.registers[register:register + len(data)] = data
+
+    def write(self, data: bytes, stop: bool) -> None:
+        size = self.register_address_size
+        if len(data) < size:
+            return
+        self._pointer = int.from_bytes(data[0:size], 'big')
+        for value in data[size:]:
+            self.write_register(self._pointer, value)
+            self._pointer += 1
+
+    def read(self, nbytes: int) -> bytes:
+        data = bytearray(nbytes)
+        for i in range(nbytes):
+            data[i] = self.read_register(self._pointer)
+            self._pointer += 1
+        return data
+
+
+class LSM6DSOXChip(RegisterDevice):
+    """
+    Model of the LSM6DSOX IMU used on the Modulino Movement.
+    """
+    address = 0x6A
+
+    _WHO_AM_I = 0x0F
+    _CTRL3_C = 0x12
+    _STATUS_REG = 0x1E
+    _OUTX_L_G = 0x22
+    _OUTX_L_XL = 0x28
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.registers[self._WHO_AM_I] = 0x6C
+        self.registers[self._CTRL3_C] = 0x04  # IF_INC enabled
+        self.registers[self._STATUS_REG] = 0x07  # Temperature, gyro and accel data available
+
+    def set_acceleration(self, x: int, y: int, z: int) -> None:
+        """
+        Sets the raw 16-bit accelerometer output.
+        """
+        self.set_registers(self._OUTX_L_XL, pack('<hhh', x, y, z))
+
+    def set_angular_velocity(self, x: int, y: int, z: int) -> None:
+        """
+        Sets the raw 16-bit gyroscope output.
+        """
+        self.set_registers(self._OUTX_L_G, pack('<hhh', x, y, z))
+
+    def write_register(self, register: int, value: int) -> None:
+        if register == self._CTRL3_C:
+            value &= ~0x01  # Software reset completes immediately
+        super().write_register(register, value)
+
+
+class LTR381RGBChip(RegisterDevice):
+    """
+    Model of the LTR-381RGB-01 light sensor used on the Modulino Light.
+    """
+    address = 0x53
+
+    _PART_ID = 0x06
+    _MAIN_STATUS = 0x07
+    _DATA_IR = 0x0A
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.registers[self._PART_ID] = 0xC2
+        self.registers[self._MAIN_STATUS] = 0x08  # New data available
+        self.set_channels(0, 0, 0, 0)
+
+    def set_channels(self, ir: int, green: int, red: int, blue: int) -> None:
+        """
+        Sets the raw 20-bit channel readings.
+        """
+        data = bytearray()
+        for value in (ir, green, red, blue):
+            data += value.to_bytes(3, 'little')
+        self.set_registers(self._DATA_IR, data)
+
+
+class HS3003Chip(SimDevice):
+    """
+    Model of the HS3003 temperature and humidity sensor used on the Modulino Thermo.
+    Any write triggers a measurement. The first read afterwards returns fresh data,
+    subsequent reads flag the data as stale.
+    """
+    address = 0x44
+
+    def __init__(self, address: int = None):
+        super().__init__(address)
+        self.temperature = 21.0
+        self.humidity = 45.0
+        self._fresh = False
+
+    def write(self, data: bytes, stop: bool) -> None:
+        self._fresh = True
+
+    def read(self, nbytes: int) -> bytes:
+        humidity = int(self.humidity * 0x3FFF / 100)
+        temperature = int((self.temperature + 40) * 0x3FFF / 165)
+        status = 0x00 if self._fresh else 0x40
+        self._fresh = False
+        data = bytes([status | (humidity >> 8), humidity & 0xFF, temperature >> 6, (temperature << 2) & 0xFC])
+        return data[:nbytes]
+
+
+class VL53L4CDChip(RegisterDevice):
+    """
+    Model of the VL53L4CD time of flight sensor used on the Modulino Distance.
+    It uses 16-bit register addresses. After ranging is started a new measurement
+    becomes available once the data ready status has been polled `ready_after_polls` times.
+    """
+    address = 0x29
+    register_address_size = 2
+    register_count = 0x200
+
+    _OSC_FREQUENCY = 0x0006
+    _GPIO_HV_MUX_CTRL = 0x0030
+    _GPIO_TIO_HV_STATUS = 0x0031
+    _SYSTEM_INTERRUPT_CLEAR = 0x0086
+    _SYSTEM_START = 0x0087
+    _RESULT_RANGE_STATUS = 0x0089
+    _RESULT_DISTANCE = 0x0096
+    _RESULT_OSC_CALIBRATE_VAL = 0x00DE
+    _FIRMWARE_SYSTEM_STATUS = 0x00E5
+    _IDENTIFICATION_MODEL_ID = 0x010F
+
+    def __init__(self, address: int = None, ready_after_polls: int = 0):
+        super().__init__(address)
+        self.ready_after_polls = ready_after_polls
+        self.ranging = False
+        self.distance_mm = 0
+        self._data_ready = False
+        self._polls_left = 0
+        self.set_registers(self._OSC_FREQUENCY, pack('>H', 0x4000))
+        self.set_registers(self._RESULT_OSC_CALIBRATE_VAL, pack('>H', 0x01F0))
+        self.registers[self._FIRMWARE_SYSTEM_STATUS] = 0x03  # Booted
+        self.registers[self._RESULT_RANGE_STATUS] = 0x09  # Range valid
+        self.set_registers(self._IDENTIFICATION_MODEL_ID, b'\xEB\xAA')
+
+    def _schedule_measurement(self) -> None:
+        self._data_ready = False
+        self._polls_left = self.ready_after_polls
+
+    def read_register(self, register: int) -> int:
+        if register == self._GPIO_TIO_HV_STATUS:
+            if self.ranging and not self._data_ready:
+                if self._polls_left == 0:
+                    self._data_ready = True
+                else:
+                    self._polls_left -= 1
+            active_high = not (self.registers[self._GPIO_HV_MUX_CTRL] & 0x10)
+            return 1 if self._data_ready == active_high else 0
+        if register == self._RESULT_DISTANCE:
+            return (self.distance_mm >> 8) & 0xFF
+        if register == self._RESULT_DISTANCE + 1:
+            return self.distance_mm & 0xFF
+        return super().read_register(register)
+
+    def write_register(self, register: int, value: int) -> None:
+        if register == self._SYSTEM_START:
+            self.ranging = value != 0
+            if self.ranging:
+                self._schedule_measurement()
+        elif register == self._SYSTEM_INTERRUPT_CLEAR and value & 0x01:
+            if self.ranging:
+                self._schedule_measurement()
+            return
+        super().write_register(register, value)
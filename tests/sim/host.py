@@ -0,0 +1,93 @@
+"""
+Makes the Modulino package importable on the host.
+Neither CPython nor the MicroPython unix port ship an I2C capable `machine` module.
+CPython additionally lacks the `micropython` and `framebuf` modules as well as
+the `ticks_*` functions in `time` and `sleep_ms` in `asyncio`.
+The missing pieces are replaced by host implementations; modules that already
+provide what the drivers need are left untouched.
+"""
+
+import sys
+
+
+def _ticks_period_helpers(time):
+    period = 1 << 30
+    mask = period - 1
+    half = period // 2
+
+    def ticks_ms():
+        return (time.monotonic_ns() // 1000000) & mask
+
+    def ticks_us():
+        return (time.monotonic_ns() // 1000) & mask
+
+    def ticks_add(ticks, delta):
+        return (ticks + delta) & mask
+
+    def ticks_diff(ticks1, ticks2):
+        return ((ticks1 - ticks2 + half) & mask) - half
+
+    def sleep_ms(ms):
+        time.sleep(ms / 1000)
+
+    def sleep_us(us):
+        time.sleep(us / 1000000)
+
+    return {
+        "ticks_ms": ticks_ms,
+        "ticks_us": ticks_us,
+        "ticks_add": ticks_add,
+        "ticks_diff": ticks_diff,
+        "sleep_ms": sleep_ms,
+        "sleep_us": sleep_us,
+    }
+
+
+def _install_time() -> None:
+    import time
+    if hasattr(time, "ticks_ms"):
+        return
+    for name, function in _ticks_period_helpers(time).items():
+        setattr(time, name, function)
+
+
+def _install_asyncio() -> None:
+    import asyncio
+    if hasattr(asyncio, "sleep_ms"):
+        return
+
+    async def sleep_ms(ms):
+        await asyncio.sleep(ms / 1000)
+
+    asyncio.sleep_ms = sleep_ms
+
+
+def _install_module(name: str, replacement, required_attribute: str = None) -> None:
+    try:
+        module = __import__(name)
+        if required_attribute is None or hasattr(module, required_attribute):
+            return
+    except ImportError:
+        pass
+    sys.modules[name] = replacement
+
+
+def install() -> None:
+    """
+    Installs the host replacements. Safe to call multiple times.
+    """
+    from . import _micropython, _framebuf, _machine
+    _install_module("micropython", _micropython)
+    _install_module("framebuf", _framebuf)
+    _install_module("machine", _machine, "I2C")
+    _install_time()
+    _install_asyncio()
+
+
+def use_bus(bus) -> None:
+    """
+    Makes the given bus the default bus returned by `_I2CHelper.get_interface()`,
+    so that Modulinos created without an explicit bus use it.
+    """
+    from modulino.modulino import _I2CHelper
+    _I2CHelper.i2c_bus = bus
@@ -0,0 +1,77 @@
+"""
+Shared setup of the unit tests.
+The tests run the drivers on the host against the simulated bus of `tests/sim`:
+
+```
+python -m pytest tests/unit
+```
+
+The sensor drivers the package depends on (lsm6dsox, ltr381rgb, micropython_hs3003, vl53l4cd)
+need to be on the module search path for the tests of the sensor Modulinos, otherwise those tests are skipped.
+"""
+
+import os
+import sys
+
+import pytest
+
+_TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(_TESTS_DIR), "src"))
+sys.path.insert(0, _TESTS_DIR)
+
+import sim  # noqa: E402  Installs the host replacements before the package is imported
+
+
+@pytest.fixture(autouse=True)
+def _reset_bus_state():
+    """
+    Forgets the per-bus state of the package between tests,
+    because a new simulated bus may get the id of a bus of an earlier test.
+    """
+    from modulino.modulino import _ScanCache
+    from modulino.bus_arbiter import BusArbiter
+    _ScanCache.invalidate()
+    BusArbiter._arbiters.clear()
+    sim.SimI2C._wires.clear()
+    yield
+
+
+@pytest.fixture
+def make_bus():
+    """
+    Returns a function that creates a simulated bus with the given device models attached.
+    """
+    def make(*devices, **kwargs):
+        kwargs.setdefault("record", True)
+        return sim.SimI2C(devices=list(devices), **kwargs)
+    return make
+
+
+class VirtualClock:
+    """
+    Replaces `ticks_ms` in the modules under test so that timing can be stepped explicitly.
+    """
+
+    def __init__(self, monkeypatch):
+        self._monkeypatch = monkeypatch
+        self.now = 1000
+
+    def ticks_ms(self) -> int:
+        return self.now
+
+    def advance(self, ms: int) -> int:
+        self.now += ms
+        return self.now
+
+    def install(self, *modules) -> "VirtualClock":
+        for module in modules:
+            self._monkeypatch.setattr(module, "ticks_ms", self.ticks_ms)
+        return self
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Returns a VirtualClock, install() it into the modules whose timing is tested.
+    """
+    return VirtualClock(monkeypatch)
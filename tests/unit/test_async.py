@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+import sim
+from modulino import ModulinoBuzzer, ModulinoVibro, ModulinoButtons, ModulinoDistance
+from modulino.vibro import PowerLevel
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_tone_encodes_the_same_command(make_bus, asynchronous):
+    firmware = sim.BuzzerFirmware()
+    buzzer = ModulinoBuzzer(make_bus(firmware))
+
+    if asynchronous:
+        _run(buzzer.atone(440, 20, blocking=True))
+    else:
+        buzzer.tone(440, 20, blocking=True)
+
+    assert (firmware.frequency, firmware.duration) == (440, 20)
+
+
+def test_atone_validates_like_tone(make_bus):
+    buzzer = ModulinoBuzzer(make_bus(sim.BuzzerFirmware()))
+
+    with pytest.raises(ValueError):
+        _run(buzzer.atone(100))
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_vibration_encodes_the_same_command(make_bus, asynchronous):
+    firmware = sim.VibroFirmware()
+    vibro = ModulinoVibro(make_bus(firmware))
+
+    if asynchronous:
+        _run(vibro.avibrate(30, PowerLevel.INTENSE))
+    else:
+        vibro.on(30, PowerLevel.INTENSE)
+
+    assert (firmware.frequency, firmware.duration, firmware.power) == (1000, 30, PowerLevel.INTENSE)
+
+
+def test_blocking_atone_lets_other_tasks_run(make_bus):
+    buzzer = ModulinoBuzzer(make_bus(sim.BuzzerFirmware()))
+    ticks = []
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(len(ticks))
+            await asyncio.sleep_ms(5)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await buzzer.atone(440, 40, blocking=True)
+        await task
+
+    _run(main())
+    assert ticks == [0, 1, 2]
+
+
+def test_aupdate_reports_button_changes(make_bus):
+    firmware = sim.ButtonsFirmware()
+    buttons = ModulinoButtons(make_bus(firmware))
+    pressed = []
+    buttons.on_button_a_press = lambda: pressed.append("A")
+
+    _run(buttons.aupdate())
+    firmware.press(0)
+    assert _run(buttons.aupdate()) is True
+    assert pressed == ["A"]
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_distance_waits_for_the_measurement(make_bus, asynchronous):
+    chip = sim.VL53L4CDChip(ready_after_polls=3)
+    chip.distance_mm = 1234
+    distance = ModulinoDistance(make_bus(chip))
+
+    value = _run(distance.adistance()) if asynchronous else distance.distance
+
+    assert value == pytest.approx(123.4)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_distance_is_none_for_invalid_readings(make_bus, asynchronous):
+    chip = sim.VL53L4CDChip()
+    distance = ModulinoDistance(make_bus(chip))
+
+    value = _run(distance.adistance()) if asynchronous else distance.distance
+
+    assert value is None
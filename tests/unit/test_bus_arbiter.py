@@ -0,0 +1,110 @@
+import asyncio
+import threading
+
+import sim
+from modulino import BusArbiter, DeviceManager, Modulino, ModulinoButtons, ModulinoBuzzer
+
+
+def _devices(make_bus):
+    bus = make_bus(sim.ButtonsFirmware(), sim.BuzzerFirmware())
+    buttons = ModulinoButtons(bus)
+    buzzer = ModulinoBuzzer(bus)
+    bus.reset_stats()
+    return bus, buttons, buzzer
+
+
+def test_for_bus_returns_one_arbiter_per_bus(make_bus):
+    bus = make_bus()
+    other = make_bus()
+
+    assert BusArbiter.for_bus(bus) is BusArbiter.for_bus(bus)
+    assert BusArbiter.for_bus(bus) is not BusArbiter.for_bus(other)
+
+
+def test_nested_transactions_reserve_the_bus_once(make_bus):
+    bus, buttons, _ = _devices(make_bus)
+    arbiter = BusArbiter.for_bus(bus)
+    arbiter.reset_stats()
+
+    with arbiter:
+        with arbiter:
+            buttons.update()  # The driver enters the arbiter a third time
+        assert arbiter._depth == 1
+    assert arbiter._depth == 0
+    assert arbiter.stats["acquisitions"] == 1
+
+    # The bus is free again for another thread
+    result = []
+    thread = threading.Thread(target=lambda: result.append(buttons.update() is not None))
+    thread.start()
+    thread.join(1)
+    assert result == [True]
+
+
+def test_task_keeps_the_bus_across_awaits(make_bus):
+    bus, buttons, buzzer = _devices(make_bus)
+    arbiter = BusArbiter.for_bus(bus)
+
+    async def transaction():
+        async with arbiter:
+            await buzzer.awrite(buzzer.data)
+            await asyncio.sleep_ms(5)
+            buzzer.write(buzzer.data)  # Synchronous calls of the holder are nested
+            await buzzer.awrite(buzzer.data)
+
+    async def intruder():
+        await asyncio.sleep_ms(1)
+        await buttons.aupdate()
+
+    async def main():
+        await asyncio.gather(transaction(), intruder())
+
+    asyncio.run(main())
+
+    addresses = [entry[1] for entry in bus.log]
+    buzzer_address = sim.BuzzerFirmware.pinstrap >> 1
+    buttons_address = sim.ButtonsFirmware.pinstrap >> 1
+    assert addresses == [buzzer_address] * 3 + [buttons_address]
+    assert arbiter.stats["contentions"] >= 1
+    assert arbiter._async_owner is None
+
+
+def test_threads_wait_for_the_holder(make_bus):
+    bus, buttons, buzzer = _devices(make_bus)
+    arbiter = BusArbiter.for_bus(bus)
+    holding = threading.Event()
+
+    def other_thread():
+        holding.wait(1)
+        buttons.update()
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    with arbiter:
+        buzzer.write(buzzer.data)
+        holding.set()
+        thread.join(0.05)  # The other thread can't get the bus meanwhile
+        buzzer.write(buzzer.data)
+    thread.join(1)
+
+    addresses = [entry[1] for entry in bus.log]
+    assert addresses == [sim.BuzzerFirmware.pinstrap >> 1] * 2 + [sim.ButtonsFirmware.pinstrap >> 1]
+    assert arbiter.stats["contentions"] == 1
+    assert arbiter.stats["max_wait_us"] > 0
+
+
+def test_discovery_reserves_the_bus(make_bus):
+    bus, buttons, _ = _devices(make_bus)
+    arbiter = BusArbiter.for_bus(bus)
+    buttons_address = sim.ButtonsFirmware.pinstrap >> 1
+    buzzer_address = sim.BuzzerFirmware.pinstrap >> 1
+
+    arbiter.reset_stats()
+    assert Modulino.scan(bus, [buttons_address, buzzer_address, 0x10]) == [buttons_address, buzzer_address]
+    assert arbiter.stats["acquisitions"] == 3  # One reservation per probe
+
+    arbiter.reset_stats()
+    buttons._pin_strap = None
+    assert buttons.pin_strap_address == sim.ButtonsFirmware.pinstrap
+    assert DeviceManager(bus)._read_pin_strap_address(buzzer_address) == sim.BuzzerFirmware.pinstrap
+    assert arbiter.stats["acquisitions"] == 2
@@ -0,0 +1,109 @@
+import pytest
+
+import sim
+import modulino.buttons
+from modulino import ModulinoButtons
+
+
+@pytest.fixture
+def buttons(make_bus, clock):
+    clock.install(modulino.buttons)
+    firmware = sim.ButtonsFirmware()
+    buttons = ModulinoButtons(make_bus(firmware))
+    events = []
+    for index, name in enumerate("abc"):
+        setattr(buttons, f"on_button_{name}_press", lambda index=index: events.append(("press", index)))
+        setattr(buttons, f"on_button_{name}_release", lambda index=index: events.append(("release", index)))
+        setattr(buttons, f"on_button_{name}_long_press", lambda index=index: events.append(("long", index)))
+    return buttons, firmware, events
+
+
+def test_is_pressed_is_unknown_before_the_first_update(buttons):
+    buttons, firmware, events = buttons
+    firmware.press(1)
+
+    assert buttons.is_pressed(1) is None
+    assert buttons.update() is True
+    assert events == []  # A button held at startup doesn't cause a press event
+    assert buttons.is_pressed(1) is True
+    assert buttons.is_pressed(0) is False
+    assert (buttons.button_a_pressed, buttons.button_b_pressed, buttons.button_c_pressed) == (False, True, False)
+
+
+def test_edges_are_reported_per_button(buttons):
+    buttons, firmware, events = buttons
+    buttons.update()
+
+    firmware.press(0)
+    firmware.press(2)
+    assert buttons.update() is True
+    assert events == [("press", 0), ("press", 2)]
+
+    events.clear()
+    assert buttons.update() is False
+    assert events == []
+
+    firmware.release(0)
+    firmware.press(1)
+    assert buttons.update() is True
+    assert events == [("release", 0), ("press", 1)]  # In button order
+
+    events.clear()
+    firmware.release(1)
+    firmware.release(2)
+    buttons.update()
+    assert events == [("release", 1), ("release", 2)]
+
+
+def test_long_press_fires_once_after_the_duration(buttons, clock):
+    buttons, firmware, events = buttons
+    buttons.long_press_duration = 500
+    buttons.update()
+    firmware.press(1)
+    buttons.update()
+    events.clear()
+
+    clock.advance(500)
+    buttons.update()
+    assert events == []  # The duration has to be exceeded
+
+    clock.advance(1)
+    buttons.update()
+    clock.advance(1000)
+    buttons.update()
+    assert events == [("long", 1)]
+
+    events.clear()
+    firmware.release(1)
+    buttons.update()
+    assert events == [("release", 1)]
+
+
+def test_released_button_doesnt_long_press(buttons, clock):
+    buttons, firmware, events = buttons
+    buttons.long_press_duration = 500
+    buttons.update()
+    firmware.press(0)
+    buttons.update()
+    clock.advance(400)
+    firmware.release(0)
+    buttons.update()
+    clock.advance(400)
+    buttons.update()
+
+    assert events == [("press", 0), ("release", 0)]
+
+
+def test_callbacks_are_dispatched_to_their_button(buttons):
+    buttons, firmware, _ = buttons
+    calls = []
+    buttons.on_button_b_press = lambda: calls.append("b")
+    buttons.on_button_a_press = None
+    buttons.on_button_c_press = None
+    buttons.update()
+
+    assert buttons.on_button_b_press is buttons._press_callbacks[1]
+    for index in range(3):
+        firmware.press(index)
+    buttons.update()
+    assert calls == ["b"]
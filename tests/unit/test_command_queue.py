@@ -0,0 +1,111 @@
+from errno import EIO
+
+import pytest
+
+import sim
+from modulino import CommandQueue, RetryPolicy
+
+
+class _RecordingDevice(sim.SimDevice):
+    """
+    Remembers every write it receives.
+    """
+
+    def __init__(self, address):
+        super().__init__(address)
+        self.writes = []
+
+    def write(self, data, stop):
+        self.writes.append(bytes(data))
+
+
+def _queue(make_bus, *addresses, **kwargs):
+    devices = [_RecordingDevice(address) for address in addresses]
+    bus = make_bus(*devices, **kwargs)
+    queue = CommandQueue.for_bus(bus)
+    queue.start()
+    return queue, devices
+
+
+def test_writes_of_other_lengths_are_not_overtaken(make_bus):
+    queue, (matrix,) = _queue(make_bus, 0x39)
+
+    queue.enqueue(0x39, b"A")
+    queue.enqueue(0x39, b"frame1")
+    queue.enqueue(0x39, b"B")
+    queue.enqueue(0x39, b"frame2")
+
+    assert queue.flush() == 4
+    assert matrix.writes == [b"A", b"frame1", b"B", b"frame2"]
+    assert queue.stats["deduplicated"] == 0
+
+
+def test_last_write_to_a_device_is_replaced(make_bus):
+    queue, (matrix, pixels) = _queue(make_bus, 0x39, 0x36)
+
+    queue.enqueue(0x39, b"frame1")
+    queue.enqueue(0x36, b"red")
+    queue.enqueue(0x39, b"frame2")  # Replaces frame1, pixels is another device
+    queue.enqueue(0x36, b"blu")
+
+    assert queue.pending == 2
+    assert queue.flush() == 2
+    assert matrix.writes == [b"frame2"]
+    assert pixels.writes == [b"blu"]
+    assert queue.stats["deduplicated"] == 2
+
+
+def test_queued_data_is_copied_and_buffers_are_reused(make_bus):
+    queue, (device,) = _queue(make_bus, 0x39)
+    data = bytearray(b"one")
+
+    queue.enqueue(0x39, data)
+    data[:] = b"two"
+    queue.flush()
+    buffer = queue._entries[0][1]
+    queue.enqueue(0x39, data)
+    queue.flush()
+
+    assert device.writes == [b"one", b"two"]
+    assert queue._entries[0][1] is buffer
+
+
+def test_failed_write_is_retried_with_its_policy(make_bus):
+    queue, (first, second) = _queue(make_bus, 0x39, 0x36)
+    policy = RetryPolicy(retries=2, backoff_ms=0, reset_after=0)
+
+    queue.enqueue(0x39, b"first", policy)
+    queue.enqueue(0x36, b"second", policy)
+    queue.bus.inject_fault(EIO, count=1)
+
+    assert queue.flush() == 2
+    assert first.writes == [b"first"]
+    assert second.writes == [b"second"]
+    assert policy.stats["retries"] == 1
+
+
+def test_write_without_policy_discards_the_batch(make_bus):
+    queue, (first, second) = _queue(make_bus, 0x39, 0x36)
+
+    queue.enqueue(0x39, b"first")
+    queue.enqueue(0x36, b"second")
+    queue.bus.inject_fault(EIO, count=1)
+
+    with pytest.raises(OSError):
+        queue.flush()
+    assert queue.pending == 0
+    assert first.writes == [] and second.writes == []
+
+
+def test_stuck_bus_is_recovered_during_flush(make_bus):
+    queue, (device,) = _queue(make_bus, 0x39, scl=5, sda=4)
+    old_bus = queue.bus
+    policy = RetryPolicy(retries=2, backoff_ms=0, reset_after=1)
+
+    queue.enqueue(0x39, b"frame", policy)
+    old_bus.inject_fault(EIO, stuck=True)
+
+    assert queue.flush() == 1
+    assert queue.bus is not old_bus
+    assert device.writes == [b"frame"]
+    assert policy.stats["resets"] == 1
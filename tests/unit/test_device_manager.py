@@ -0,0 +1,48 @@
+import sim
+from modulino import DeviceManager, Modulino, ModulinoButtons
+
+
+def test_available_devices_finds_devices_attached_after_the_first_call(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    manager = DeviceManager(bus)
+    assert [type(device) for device in manager.available_devices()] == [ModulinoButtons]
+
+    bus.attach(sim.KnobFirmware())
+    devices = manager.available_devices()
+
+    assert sorted(type(device).__name__ for device in devices) == ["ModulinoButtons", "ModulinoKnob"]
+
+
+def test_available_devices_misses_new_devices_with_cached_results(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    manager = DeviceManager(bus)
+    manager.available_devices()
+
+    bus.attach(sim.KnobFirmware())
+    bus.reset_stats()
+    devices = manager.available_devices(rescan=False)
+
+    assert [type(device) for device in devices] == [ModulinoButtons]
+    # Only the pinstrap address of the known Modulino is read
+    assert bus.stats.transactions == 1
+
+
+def test_available_devices_probes_the_whole_bus_by_default(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    manager = DeviceManager(bus)
+    manager.available_devices()
+    bus.reset_stats()
+
+    manager.available_devices()
+
+    # 127 probes plus the pinstrap address of the Buttons
+    assert bus.stats.transactions == 128
+
+
+def test_available_devices_fills_the_scan_cache(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    DeviceManager(bus).available_devices()
+    bus.reset_stats()
+
+    assert Modulino.scan(bus, use_cache=True) == [sim.ButtonsFirmware.pinstrap >> 1]
+    assert bus.stats.transactions == 0
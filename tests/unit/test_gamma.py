@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+
+from modulino import gamma
+
+_TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "tools")
+
+
+def test_checked_in_tables_are_up_to_date():
+    result = subprocess.run([sys.executable, os.path.join(_TOOLS_DIR, "generate_gamma.py"), "--check"],
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout
+
+
+def test_tables_are_bytes_and_monotonic():
+    for table, length, top in ((gamma.GAMMA_8BIT, 256, 255), (gamma.GAMMA_4BIT, 256, 15), (gamma.PERCEPTUAL_BRIGHTNESS, 101, 31)):
+        assert isinstance(table, bytes)
+        assert len(table) == length
+        assert table[0] == 0 and table[-1] == top
+        assert all(a <= b for a, b in zip(table, table[1:]))
+
+
+def test_perceptual_brightness_keeps_the_leds_on():
+    assert min(gamma.PERCEPTUAL_BRIGHTNESS[1:]) == 1
@@ -0,0 +1,139 @@
+import pytest
+
+import sim
+from modulino import ModulinoButtons
+from modulino.gestures import GestureRecognizer
+
+A = 0b001
+B = 0b010
+C = 0b100
+
+
+def _recognizer(**kwargs):
+    recognizer = GestureRecognizer(3, **kwargs)
+    recognizer.feed(0, 0)  # Initial state
+    return recognizer
+
+
+def _play(recognizer, samples):
+    for now, state in samples:
+        recognizer.feed(state, now)
+
+
+def test_single_click_is_reported_on_release():
+    recognizer = _recognizer()
+    events = []
+    recognizer.add_click(0, lambda: events.append("click"))
+
+    _play(recognizer, [(100, A), (200, 0)])
+    assert events == ["click"]
+
+
+def test_press_longer_than_click_max_isnt_a_click():
+    recognizer = _recognizer(click_max_ms=400)
+    events = []
+    recognizer.add_click(0, lambda: events.append("click"))
+
+    _play(recognizer, [(100, A), (501, 0)])
+    assert events == []
+
+
+def test_double_click_waits_for_the_multi_click_window():
+    recognizer = _recognizer(multi_click_ms=300)
+    events = []
+    recognizer.add_click(0, lambda: events.append(1))
+    recognizer.add_click(0, lambda: events.append(2), count=2)
+    recognizer.add_click(0, lambda: events.append(3), count=3)
+
+    # A single click is only reported once no second click can follow
+    _play(recognizer, [(100, A), (150, 0), (400, 0)])
+    assert events == []
+    _play(recognizer, [(451, 0)])
+    assert events == [1]
+
+    # Two clicks within the window
+    _play(recognizer, [(1000, A), (1050, 0), (1300, A), (1350, 0), (1651, 0)])
+    assert events == [1, 2]
+
+    # The highest registered count is reported right away
+    _play(recognizer, [(2000, A), (2050, 0), (2100, A), (2150, 0), (2200, A), (2250, 0)])
+    assert events == [1, 2, 3]
+
+
+def test_hold_fires_once_and_suppresses_the_click():
+    recognizer = _recognizer()
+    events = []
+    recognizer.add_click(1, lambda: events.append("click"))
+    recognizer.add_hold(1, lambda: events.append("hold"), duration_ms=800)
+
+    _play(recognizer, [(100, B), (899, B)])
+    assert events == []
+    _play(recognizer, [(900, B), (1500, B), (1600, 0)])
+    assert events == ["hold"]
+
+
+def test_repeat_interval_shrinks_down_to_the_minimum():
+    recognizer = _recognizer()
+    counts = []
+    times = []
+    recognizer.add_repeat(2, lambda count: (counts.append(count), times.append(now)),
+                          delay_ms=500, interval_ms=200, min_interval_ms=100, acceleration=50)
+
+    recognizer.feed(C, 0)
+    for now in range(10, 1200, 10):
+        recognizer.feed(C, now)
+    recognizer.feed(0, 1200)
+
+    # 500 ms delay, then 200, 100, 100, ... ms
+    assert times == [500, 700, 800, 900, 1000, 1100]
+    assert counts == [1, 2, 3, 4, 5, 6]
+
+
+def test_chord_needs_all_buttons_within_the_window():
+    recognizer = _recognizer(chord_window_ms=100)
+    events = []
+    recognizer.add_click(0, lambda: events.append("A"))
+    recognizer.add_chord((0, 2), lambda: events.append("A+C"))
+
+    _play(recognizer, [(0, A), (80, A | C), (150, 0)])
+    assert events == ["A+C"]  # The buttons of the chord don't click
+
+    # C comes too late, so releasing A is a click
+    _play(recognizer, [(1000, A), (1101, A | C), (1200, 0)])
+    assert events == ["A+C", "A"]
+
+
+def test_buttons_pressed_on_the_first_sample_are_ignored():
+    recognizer = GestureRecognizer(3)
+    events = []
+    recognizer.add_click(0, lambda: events.append("click"))
+
+    _play(recognizer, [(0, A), (100, 0)])
+    assert events == []
+    _play(recognizer, [(200, A), (300, 0)])
+    assert events == ["click"]
+
+
+def test_invalid_gestures_are_rejected():
+    recognizer = GestureRecognizer(3)
+    with pytest.raises(ValueError):
+        recognizer.add_click(3, lambda: None)
+    with pytest.raises(ValueError):
+        recognizer.add_chord((1,), lambda: None)
+    with pytest.raises(ValueError):
+        recognizer.add_repeat(0, lambda count: None, acceleration=100)
+
+
+def test_buttons_feed_their_recognizer(make_bus):
+    firmware = sim.ButtonsFirmware()
+    buttons = ModulinoButtons(make_bus(firmware))
+    events = []
+    buttons.gestures.add_click(1, lambda: events.append("B"))
+
+    buttons.update()
+    firmware.press(1)
+    buttons.update()
+    firmware.release(1)
+    buttons.update()
+
+    assert events == ["B"]
@@ -0,0 +1,80 @@
+from errno import EIO
+
+import pytest
+
+import sim
+import modulino.health
+from modulino import DeviceManager, HealthMonitor, ModulinoButtons, ModulinoBuzzer
+
+_BUTTONS = sim.ButtonsFirmware.pinstrap >> 1
+_BUZZER = sim.BuzzerFirmware.pinstrap >> 1
+
+
+def _devices(make_bus):
+    bus = make_bus(sim.ButtonsFirmware(), sim.BuzzerFirmware())
+    buttons = ModulinoButtons(bus)
+    buzzer = ModulinoBuzzer(bus)
+    return bus, buttons, buzzer
+
+
+def test_nothing_is_recorded_until_started(make_bus):
+    _, buttons, _ = _devices(make_bus)
+
+    buttons.update()
+    assert buttons.health is None
+
+    buttons.health_monitor.start()
+    buttons.update()
+    buttons.update()
+    health = buttons.health
+    assert health["transactions"] == 2
+    assert health["bytes"] == 2 * 4  # Pinstrap byte and three buttons
+
+    buttons.health_monitor.stop()
+    buttons.update()
+    assert buttons.health["transactions"] == 2
+
+
+def test_errors_and_last_seen_are_recorded(make_bus, clock):
+    clock.install(modulino.health)
+    bus, buttons, _ = _devices(make_bus)
+    buttons.health_monitor.start()
+
+    buttons.update()
+    clock.advance(250)
+    bus.inject_fault(EIO, count=1)
+    with pytest.raises(OSError):
+        buttons.update()
+
+    health = buttons.health
+    assert health["errors"] == 1
+    assert health["last_error"] == EIO
+    assert health["error_rate"] == 0.5
+    assert health["last_seen_ms"] == 250
+
+
+def test_command_queue_batches_are_recorded(make_bus):
+    _, _, buzzer = _devices(make_bus)
+    monitor = buzzer.health_monitor
+    monitor.start()
+
+    with buzzer.command_queue:
+        buzzer.tone(440)
+        buzzer.tone(880)  # Replaces the first tone
+
+    assert monitor.device(_BUZZER)["transactions"] == 1
+    assert monitor.device(_BUZZER)["bytes"] == 8
+
+
+def test_health_snapshot_reports_missing_devices(make_bus):
+    bus, buttons, buzzer = _devices(make_bus)
+    HealthMonitor.for_bus(bus).start()
+    buttons.update()
+    buzzer.tone(440)
+
+    bus.detach(_BUZZER)
+    snapshot = DeviceManager(bus).health_snapshot()
+
+    assert snapshot[_BUTTONS]["present"] is True
+    assert snapshot[_BUZZER]["present"] is False
+    assert snapshot[_BUZZER]["transactions"] == 1
@@ -0,0 +1,188 @@
+import sim
+from modulino import HotplugWatcher, ModulinoKnob, ModulinoLEDMatrix
+
+_BUTTONS = sim.ButtonsFirmware.pinstrap >> 1
+
+
+def _watcher(bus, **kwargs):
+    watcher = HotplugWatcher(bus, **kwargs)
+    events = []
+    watcher.on_attach = lambda device: events.append(("attach", device))
+    watcher.on_detach = lambda device: events.append(("detach", device))
+    return watcher, events
+
+
+def test_first_poll_reports_the_connected_devices(make_bus):
+    bus = make_bus(sim.ButtonsFirmware(), sim.KnobFirmware())
+    watcher, events = _watcher(bus)
+
+    assert watcher.poll() is True
+    assert sorted(type(device).__name__ for _, device in events) == ["ModulinoButtons", "ModulinoKnob"]
+    assert all(kind == "attach" for kind, _ in events)
+    assert watcher.poll() is False
+
+
+def test_device_is_detached_after_miss_limit_probes(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    watcher, events = _watcher(bus, miss_limit=3)
+    watcher.poll()
+    buttons = watcher.devices[0]
+    events.clear()
+
+    bus.detach(_BUTTONS)
+    assert watcher.poll() is False
+    assert watcher.poll() is False
+    assert watcher.devices == [buttons]
+
+    assert watcher.poll() is True
+    assert events == [("detach", buttons)]
+    assert watcher.devices == []
+
+
+def test_single_missed_probe_doesnt_detach(make_bus):
+    firmware = sim.ButtonsFirmware()
+    bus = make_bus(firmware)
+    watcher, events = _watcher(bus, miss_limit=2)
+    watcher.poll()
+    events.clear()
+
+    firmware.present = False
+    watcher.poll()
+    firmware.present = True
+    watcher.poll()
+    watcher.poll()
+
+    assert events == []
+    assert len(watcher.devices) == 1
+
+
+def test_returning_device_is_reattached_with_the_same_object(make_bus):
+    firmware = sim.ButtonsFirmware()
+    bus = make_bus(firmware)
+    watcher, events = _watcher(bus, miss_limit=1)
+    watcher.poll()
+    buttons = watcher.devices[0]
+    buttons.on_button_a_press = lambda: None
+
+    bus.detach(_BUTTONS)
+    watcher.poll()
+    events.clear()
+    bus.attach(firmware)
+
+    assert watcher.poll() is True
+    assert events == [("attach", buttons)]
+    assert watcher.devices[0].on_button_a_press is not None
+
+
+def _replug(bus, watcher, events, old_firmware, new_firmware):
+    # A module that is plugged in again has restarted with its default state
+    bus.detach(old_firmware)
+    watcher.poll()
+    events.clear()
+    bus.attach(new_firmware)
+    watcher.poll()
+
+
+def test_reattached_led_matrix_gets_its_mode_and_frame_again(make_bus):
+    firmware = sim.LEDMatrixFirmware()
+    bus = make_bus(firmware)
+    watcher, events = _watcher(bus, miss_limit=1)
+    watcher.poll()
+    matrix = watcher.devices[0]
+    assert isinstance(matrix, ModulinoLEDMatrix)
+    matrix.use_grayscale = True
+    matrix.set_pixel(0, 0).show()
+
+    restarted = sim.LEDMatrixFirmware()
+    _replug(bus, watcher, events, firmware, restarted)
+    assert events == [("attach", matrix)]
+
+    matrix.show()  # Nothing has been drawn since the last frame
+    assert restarted.mode == b"GS4"
+    assert restarted.frames_received == 1
+    assert restarted.frame[0] == 0xF0
+
+
+def test_reattached_knob_starts_from_the_new_counter_silently(make_bus):
+    firmware = sim.KnobFirmware()
+    bus = make_bus(firmware)
+    watcher, events = _watcher(bus, miss_limit=1)
+    watcher.poll()
+    knob = watcher.devices[0]
+    turns = []
+    knob.on_rotate_clockwise = lambda steps, value: turns.append((steps, value))
+    knob.on_rotate_counter_clockwise = lambda steps, value: turns.append((steps, value))
+    knob.update()
+    firmware.rotate(40)
+    knob.update()
+    turns.clear()
+
+    restarted = sim.KnobFirmware()
+    _replug(bus, watcher, events, firmware, restarted)
+    assert events == [("attach", knob)]
+
+    assert knob.update() is False  # The jump from 40 to 0 isn't a rotation
+    assert knob.value == 0
+    restarted.rotate(2)
+    knob.update()
+    assert turns == [(2, 2)]
+    assert knob._set_bug_detected is None  # Detected again on the next set
+
+
+def test_unknown_device_is_identified_once(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    watcher, events = _watcher(bus, slice_size=127)
+    watcher.poll()
+    events.clear()
+
+    stranger = sim.SimDevice(0x20)  # Its reads don't contain a known pinstrap address
+    bus.attach(stranger)
+    for _ in range(3):
+        watcher.poll()
+
+    def identifications():
+        return sum(1 for op, address, _, _ in bus.log if op == "readfrom" and address == 0x20)
+
+    assert events == []
+    assert identifications() == 1
+
+    # Once it disappeared, the device at the address is identified again
+    stranger.present = False
+    watcher.poll()
+    stranger.present = True
+    watcher.poll()
+    assert identifications() == 2
+
+
+def test_other_kind_of_modulino_at_the_address_gets_a_new_object(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    watcher, events = _watcher(bus, miss_limit=1)
+    watcher.poll()
+
+    bus.detach(_BUTTONS)
+    watcher.poll()
+    events.clear()
+    bus.attach(sim.KnobFirmware(), _BUTTONS)
+
+    watcher.poll()
+    assert len(events) == 1
+    assert isinstance(events[0][1], ModulinoKnob)
+
+
+def test_new_device_is_found_within_one_round_of_slices(make_bus):
+    bus = make_bus(sim.ButtonsFirmware())
+    watcher, events = _watcher(bus, slice_size=16)
+    watcher.poll()
+    events.clear()
+    bus.reset_stats()
+
+    bus.attach(sim.KnobFirmware())
+    polls = 0
+    while not events:
+        watcher.poll()
+        polls += 1
+        assert polls <= 127 // 16 + 1
+
+    assert isinstance(events[0][1], ModulinoKnob)
+    # A poll only probes the known device and one slice
+    assert bus.stats.transactions <= polls * (1 + 16) + 2
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+import sim
+import modulino.input_hub
+from modulino import ModulinoButtons, InputHub
+
+
+class _FailingDevice:
+    def update(self):
+        raise OSError(19)
+
+
+@pytest.fixture
+def hub(clock):
+    clock.install(modulino.input_hub)
+    return InputHub(interval_ms=20, idle_interval_ms=80, coalesce_ms=5)
+
+
+def _buttons(make_bus):
+    firmware = sim.ButtonsFirmware()
+    return ModulinoButtons(make_bus(firmware)), firmware
+
+
+def test_interval_doubles_while_idle_and_resets_on_change(make_bus, clock, hub):
+    buttons, firmware = _buttons(make_bus)
+    hub.add(buttons)
+
+    intervals = []
+    for _ in range(4):
+        hub.poll()
+        intervals.append(hub.interval_ms(buttons))
+        clock.advance(hub.interval_ms(buttons))
+    assert intervals == [40, 80, 80, 80]
+
+    firmware.press(0)
+    hub.poll()
+    assert hub.interval_ms(buttons) == 20
+    assert hub.stats["changes"] == 1
+
+
+def test_initial_state_is_not_reported_as_change(make_bus, hub):
+    buttons, firmware = _buttons(make_bus)
+    firmware.press(1)
+    hub.add(buttons)
+
+    hub.poll()
+    assert hub.stats == {"wakeups": 1, "polls": 1, "changes": 0, "errors": 0}
+
+
+def test_devices_due_within_the_window_are_polled_together(make_bus, clock, hub):
+    first, _ = _buttons(make_bus)
+    second = ModulinoButtons(make_bus(sim.ButtonsFirmware()))
+    hub.add(first)
+    hub.add(second, interval_ms=23, idle_interval_ms=80)
+    hub.poll()
+    hub.reset_stats()
+
+    # Both are due in 40 and 46 ms, which is within the 5 ms window after 41 ms
+    clock.advance(41)
+    hub.poll()
+    assert hub.stats["wakeups"] == 1
+    assert hub.stats["polls"] == 2
+
+
+def test_failing_device_is_backed_off_without_stopping_the_others(make_bus, clock, hub):
+    buttons, firmware = _buttons(make_bus)
+    failing = _FailingDevice()
+    hub.add(buttons)
+    hub.add(failing)
+
+    hub.poll()
+    firmware.press(2)
+    clock.advance(40)
+    hub.poll()
+
+    assert hub.interval_ms(failing) == 80
+    assert hub.stats["errors"] == 1
+    assert hub.stats["changes"] == 1
+
+
+def test_wait_merges_repeated_changes(make_bus, clock, hub):
+    buttons, firmware = _buttons(make_bus)
+    hub.add(buttons)
+    hub.poll()
+
+    for index in range(3):
+        firmware.press(index)
+        clock.advance(hub.interval_ms(buttons))
+        hub.poll()
+
+    async def collect():
+        first = await hub.wait()
+        try:
+            second = await asyncio.wait_for(hub.wait(), 0.01)
+        except asyncio.TimeoutError:
+            second = None
+        return first, second
+
+    first, second = asyncio.run(collect())
+    assert first is buttons
+    assert second is None
+    assert hub.stats["changes"] == 3
+
+
+def test_add_rejects_duplicates_and_invalid_intervals(make_bus, hub):
+    buttons, _ = _buttons(make_bus)
+    hub.add(buttons)
+    with pytest.raises(ValueError):
+        hub.add(buttons)
+    with pytest.raises(ValueError):
+        hub.add(_FailingDevice(), interval_ms=50, idle_interval_ms=10)
@@ -0,0 +1,104 @@
+import pytest
+
+import sim
+import modulino.joystick
+from modulino import ModulinoJoystick
+
+
+@pytest.fixture
+def joystick(make_bus, monkeypatch):
+    monkeypatch.setattr(modulino.joystick, "sleep_ms", lambda ms: None)
+    firmware = sim.JoystickFirmware()
+    bus = make_bus(firmware)
+    joystick = ModulinoJoystick(bus)
+    bus.reset_stats()
+    return joystick, firmware, bus
+
+
+def _move(joystick, firmware, x, y):
+    firmware.x = x
+    firmware.y = y
+    joystick.update()
+    return joystick.x, joystick.y
+
+
+def test_full_deflection_maps_to_the_ends_of_the_range(joystick):
+    joystick, firmware, _ = joystick
+
+    assert _move(joystick, firmware, 255, 0) == (127, -128)
+    assert _move(joystick, firmware, 128, 128) == (0, 0)
+
+
+def test_deadzone_is_radial(joystick):
+    joystick, firmware, _ = joystick
+    joystick.deadzone_threshold = 10
+
+    assert _move(joystick, firmware, 137, 128) == (0, 0)  # 9 from the center
+    assert _move(joystick, firmware, 135, 135) == (0, 0)  # About 9.9 from the center
+    # A square deadzone would swallow this diagonal, a radial one reports it
+    assert _move(joystick, firmware, 136, 136) == (8, 8)
+    assert _move(joystick, firmware, 128, 139) == (0, 11)
+
+
+def test_calibration_centers_and_learns_the_extents(joystick):
+    joystick, firmware, bus = joystick
+    firmware.x, firmware.y = 120, 136  # Resting position of a worn stick
+
+    joystick.calibrate(samples=4)
+    assert joystick.calibrated
+    assert bus.stats.transactions == 4
+    assert _move(joystick, firmware, 120, 136) == (0, 0)
+
+    # The assumed extent of 100 until a larger deflection is seen
+    assert _move(joystick, firmware, 170, 136) == (64, 0)
+    # 120 is the largest deflection so far, it becomes the end of the range
+    assert _move(joystick, firmware, 240, 136) == (127, 0)
+    assert _move(joystick, firmware, 180, 136) == (64, 0)
+    # Other directions keep their own extent
+    assert _move(joystick, firmware, 120, 86) == (0, -64)
+
+    joystick.reset_calibration()
+    assert not joystick.calibrated
+    assert _move(joystick, firmware, 128, 128) == (0, 0)
+
+
+def test_oversampling_averages_several_reads(joystick):
+    joystick, firmware, bus = joystick
+    joystick.oversampling = 4
+
+    assert _move(joystick, firmware, 192, 128) == (64, 0)
+    assert bus.stats.transactions == 4
+
+
+def test_smoothing_follows_the_stick_gradually(joystick):
+    joystick, firmware, _ = joystick
+    joystick.smoothing = 1
+    joystick.change_threshold = 0
+
+    _move(joystick, firmware, 128, 128)
+    positions = [_move(joystick, firmware, 192, 128)[0] for _ in range(3)]
+
+    assert positions == [32, 48, 56]
+
+
+def test_small_changes_are_not_reported(joystick):
+    joystick, firmware, _ = joystick
+    joystick.change_threshold = 2
+    _move(joystick, firmware, 178, 128)
+
+    firmware.x = 180
+    assert joystick.update() is False
+    assert joystick.x == 50
+    firmware.x = 181
+    assert joystick.update() is True
+    assert joystick.x == 53
+
+
+def test_invalid_settings_are_rejected(joystick):
+    joystick = joystick[0]
+    with pytest.raises(ValueError):
+        joystick.calibrate(samples=0)
+    with pytest.raises(ValueError):
+        joystick.smoothing = 8
+    with pytest.raises(ValueError):
+        joystick.oversampling = 0
@@ -0,0 +1,125 @@
+import pytest
+
+import sim
+import modulino.knob
+from modulino import ModulinoKnob
+
+
+@pytest.fixture
+def knob(make_bus, clock):
+    clock.install(modulino.knob)
+    firmware = sim.KnobFirmware()
+    bus = make_bus(firmware)
+    knob = ModulinoKnob(bus)
+    events = []
+    knob.on_rotate_clockwise = lambda steps, value: events.append((steps, value))
+    knob.on_rotate_counter_clockwise = lambda steps, value: events.append((steps, value))
+    knob.update()
+    bus.reset_stats()
+    return knob, firmware, bus, events
+
+
+def _turn(knob, firmware, clock, steps, after_ms):
+    clock.advance(after_ms)
+    firmware.rotate(steps)
+    return knob.update()
+
+
+def test_steps_are_reported_unchanged_by_default(knob, clock):
+    knob, firmware, _, events = knob
+
+    _turn(knob, firmware, clock, 3, 5)
+    _turn(knob, firmware, clock, -1, 5)
+
+    assert events == [(3, 3), (-1, 2)]
+
+
+def test_fast_turns_are_accelerated_without_rewriting_the_counter(knob, clock):
+    knob, firmware, bus, events = knob
+    knob.acceleration = ModulinoKnob.default_acceleration
+
+    _turn(knob, firmware, clock, 1, 100)  # Slow: 100 ms per detent
+    _turn(knob, firmware, clock, 2, 60)  # 30 ms per detent: x2
+    _turn(knob, firmware, clock, 2, 10)  # 5 ms per detent: x8
+
+    assert events == [(1, 1), (4, 5), (16, 21)]
+    assert knob.value == 21
+    assert firmware.value == 5
+    assert bus.stats.bytes_written == 0
+
+
+def test_setting_the_value_resets_the_acceleration_offset(knob, clock):
+    knob, firmware, _, events = knob
+    knob.acceleration = ModulinoKnob.default_acceleration
+    _turn(knob, firmware, clock, 1, 100)
+    _turn(knob, firmware, clock, 2, 10)
+
+    knob.value = 50
+    _turn(knob, firmware, clock, 1, 100)
+
+    assert firmware.value == 51
+    assert knob.value == 51
+    assert events[-1] == (1, 51)
+
+
+def test_acceleration_is_clamped_to_the_range(knob, clock):
+    knob, firmware, _, events = knob
+    knob.range = (0, 10)
+    knob.acceleration = ModulinoKnob.default_acceleration
+
+    _turn(knob, firmware, clock, 1, 100)
+    _turn(knob, firmware, clock, 2, 10)  # Would be 17
+
+    assert knob.value == 10
+    assert events[-1] == (9, 10)
+    assert firmware.value == 10
+
+
+def test_updates_within_the_window_are_coalesced(knob, clock):
+    knob, firmware, _, events = knob
+    knob.coalesce_ms = 50
+
+    _turn(knob, firmware, clock, 1, 5)  # Reported right away
+    _turn(knob, firmware, clock, 2, 10)
+    _turn(knob, firmware, clock, 3, 10)
+    assert events == [(1, 1)]
+
+    _turn(knob, firmware, clock, 0, 30)  # The window has passed
+    assert events == [(1, 1), (5, 6)]
+
+
+def test_turns_that_cancel_out_are_not_reported(knob, clock):
+    knob, firmware, _, events = knob
+    knob.coalesce_ms = 50
+    _turn(knob, firmware, clock, 1, 5)
+
+    _turn(knob, firmware, clock, 2, 10)
+    _turn(knob, firmware, clock, -2, 10)
+    _turn(knob, firmware, clock, 0, 100)
+
+    assert events == [(1, 1)]
+
+
+def test_slow_callbacks_widen_the_window(knob, clock):
+    knob, firmware, _, events = knob
+    knob.coalesce_ms = 20
+
+    def slow_callback(steps, value):
+        events.append((steps, value))
+        clock.advance(100)
+
+    knob.on_rotate_clockwise = slow_callback
+    _turn(knob, firmware, clock, 1, 5)
+    _turn(knob, firmware, clock, 1, 50)  # Within the 100 ms the callback took
+    assert events == [(1, 1)]
+
+    _turn(knob, firmware, clock, 1, 60)
+    assert events == [(1, 1), (2, 3)]
+
+
+def test_invalid_settings_are_rejected(knob):
+    knob = knob[0]
+    with pytest.raises(ValueError):
+        knob.acceleration = ((0, 2),)
+    with pytest.raises(ValueError):
+        knob.coalesce_ms = -1
@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+
+import sim
+from modulino import ModulinoLEDMatrix, Animation, DeltaAnimation, MLAAnimation
+from modulino import led_matrix as led_matrix_module
+
+
+def _matrix(make_bus, use_grayscale=False):
+    firmware = sim.LEDMatrixFirmware()
+    bus = make_bus(firmware)
+    matrix = ModulinoLEDMatrix(bus, use_grayscale=use_grayscale)
+    matrix.clear().show()
+    matrix.reset_stats()
+    firmware.frames_received = 0
+    return matrix, firmware
+
+
+def test_show_sends_changed_frames_only(make_bus):
+    matrix, firmware = _matrix(make_bus)
+
+    matrix.set_pixel(0, 0).show()
+    matrix.set_pixel(0, 0).show()  # Same content
+    matrix.show()  # Nothing drawn
+
+    assert firmware.frames_received == 1
+    assert firmware.frame[0] == 0x01
+    assert matrix.bytes_saved == 24
+
+
+def test_direct_buffer_writes_need_mark_dirty(make_bus):
+    matrix, firmware = _matrix(make_bus)
+
+    matrix._framebuf_buffer[1] = 0xFF
+    matrix.show()
+    assert firmware.frames_received == 0
+
+    matrix.mark_dirty(1, 0, 1, 8).show()
+    assert firmware.frames_received == 1
+    assert firmware.frame[1] == 0xFF
+
+
+def test_dirty_region_covers_the_drawn_pixels(make_bus):
+    matrix, _ = _matrix(make_bus)
+
+    matrix.set_pixel(2, 3).hline(5, 6, 3)
+
+    assert matrix.dirty_region == (2, 3, 6, 4)
+    matrix.show()
+    assert matrix.dirty_region is None
+
+
+def test_delta_animation_rejects_empty_data(make_bus):
+    matrix, _ = _matrix(make_bus)
+
+    with pytest.raises(ValueError):
+        DeltaAnimation(matrix, b"", fps=100)
+
+
+def test_delta_animation_sends_decoded_frames(make_bus):
+    matrix, firmware = _matrix(make_bus)
+    # Frame 1 fills all 12 columns, frame 2 skips 11 columns and clears the last one
+    data = bytes([0xCB, 0xFF, 0x0A, 0xC0, 0x00])
+    animation = DeltaAnimation(matrix, data, fps=1000)
+
+    assert animation.frame_count == 2
+    animation.play()
+
+    assert firmware.frames_received == 2
+    assert bytes(firmware.frame) == b"\xff" * 11 + b"\x00"
+
+
+def _write_mla(path, frames):
+    data = bytearray(b"MLA\x01\x00\x00")
+    data += len(frames).to_bytes(2, "little")
+    for duration, frame in frames:
+        data += duration.to_bytes(2, "little") + frame
+    path.write_bytes(bytes(data))
+    return str(path)
+
+
+def test_mla_animation_rejects_files_without_frames(make_bus, tmp_path):
+    matrix, _ = _matrix(make_bus)
+    file_path = _write_mla(tmp_path / "empty.mla", [])
+
+    with pytest.raises(ValueError):
+        MLAAnimation(matrix, file_path)
+
+
+def test_mla_animation_streams_frames(make_bus, tmp_path):
+    matrix, firmware = _matrix(make_bus)
+    frames = [(1, bytes(range(12))), (1, b"\x00" * 11 + b"\x80")]
+    animation = MLAAnimation(matrix, _write_mla(tmp_path / "two.mla", frames))
+
+    assert animation.frame_count == 2
+    animation.play()
+
+    assert firmware.frames_received == 2
+    assert bytes(firmware.frame) == frames[1][1]
+
+
+def _timed_animation(make_bus, clock, monkeypatch, transfer_ms, durations, drop_frames=False):
+    matrix, firmware = _matrix(make_bus)
+    clock.install(led_matrix_module)
+    shown_at = []
+    show = matrix.show
+
+    def slow_show():
+        # Sending a frame takes transfer_ms
+        show()
+        shown_at.append(clock.advance(transfer_ms))
+        return matrix
+
+    monkeypatch.setattr(matrix, "show", slow_show)
+    frames = [(bytes([index + 1]) * 12, duration) for index, duration in enumerate(durations)]
+    return Animation(matrix, frames, drop_frames=drop_frames), firmware, shown_at
+
+
+def _run_schedule(animation, clock):
+    waits = []
+    for wait in animation._schedule(False):
+        waits.append(wait)
+        clock.advance(wait)
+    return waits
+
+
+def test_animation_sends_frames_early_to_meet_the_deadlines(make_bus, clock, monkeypatch):
+    animation, firmware, shown_at = _timed_animation(make_bus, clock, monkeypatch, 5, [20, 20, 20])
+
+    waits = _run_schedule(animation, clock)
+
+    # The first frame can't be sent early, the others become visible exactly at their deadlines
+    assert shown_at == [1005, 1020, 1040]
+    assert waits == [0, 10, 15, 20]
+    assert clock.now == 1060
+    assert firmware.frames_received == 3
+    assert animation.frames_shown == 3
+    assert animation.frames_dropped == 0
+    assert animation.max_jitter_ms == 5
+    assert animation.jitter_ms == pytest.approx(5 / 3)
+    assert animation.achieved_fps == pytest.approx(2 * 1000 / 35)
+
+
+def test_late_animation_keeps_yielding(make_bus, clock, monkeypatch):
+    animation, firmware, shown_at = _timed_animation(make_bus, clock, monkeypatch, 30, [10, 10, 10])
+
+    waits = _run_schedule(animation, clock)
+
+    # Every frame is late but still shown, and the generator still yields before each of them
+    assert waits == [0, 0, 0, 0]
+    assert shown_at == [1030, 1060, 1090]
+    assert firmware.frames_received == 3
+    assert animation.frames_dropped == 0
+    assert animation.max_jitter_ms == 70
+
+
+def test_late_animation_drops_frames(make_bus, clock, monkeypatch):
+    animation, firmware, shown_at = _timed_animation(make_bus, clock, monkeypatch, 30, [10] * 6, drop_frames=True)
+
+    _run_schedule(animation, clock)
+
+    # Frames whose display time passed while the previous frame was sent are skipped
+    assert shown_at == [1030, 1060]
+    assert animation.frames_shown == 2
+    assert animation.frames_dropped == 4
+    assert firmware.frames_received == 2
+    assert firmware.frame[0] == 4
+
+
+def test_late_async_animation_awaits_every_frame(make_bus, clock, monkeypatch):
+    animation, _, _ = _timed_animation(make_bus, clock, monkeypatch, 30, [10, 10, 10])
+    animation._async_mode = True
+    awaited = []
+
+    async def sleep_ms(ms):
+        awaited.append(ms)
+
+    monkeypatch.setattr(asyncio, "sleep_ms", sleep_ms)
+    asyncio.run(animation.play())
+
+    assert awaited == [0, 0, 0, 0]
@@ -0,0 +1,131 @@
+import pytest
+
+import sim
+from modulino import ModulinoLEDMatrix, LEDMatrixCanvas
+
+
+def _matrices(make_bus, count, use_grayscale=False):
+    firmwares = [sim.LEDMatrixFirmware(address=0x40 + i) for i in range(count)]
+    bus = make_bus(*firmwares)
+    matrices = [ModulinoLEDMatrix(bus, address=0x40 + i, use_grayscale=use_grayscale) for i in range(count)]
+    for matrix, firmware in zip(matrices, firmwares):
+        matrix.clear().show()
+        firmware.frames_received = 0
+    return matrices, firmwares
+
+
+def _frame(*columns):
+    """
+    Returns a monochrome frame with the given (column, bits) pairs set.
+    """
+    frame = bytearray(12)
+    for column, bits in columns:
+        frame[column] = bits
+    return bytes(frame)
+
+
+def test_tiles_are_sliced_from_a_row_of_matrices(make_bus):
+    matrices, firmwares = _matrices(make_bus, 2)
+    canvas = LEDMatrixCanvas(matrices)
+    assert (canvas.width, canvas.height) == (24, 8)
+
+    canvas.set_pixel(0, 0).set_pixel(12, 7).set_pixel(23, 3).show()
+
+    assert bytes(firmwares[0].frame) == _frame((0, 0x01))
+    assert bytes(firmwares[1].frame) == _frame((0, 0x80), (11, 0x08))
+
+
+def test_tiles_are_sliced_from_a_grid_of_matrices(make_bus):
+    matrices, firmwares = _matrices(make_bus, 4)
+    canvas = LEDMatrixCanvas(matrices, columns=2)
+    assert (canvas.width, canvas.height) == (24, 16)
+
+    canvas.set_pixel(5, 8).set_pixel(13, 9).show()
+
+    assert bytes(firmwares[0].frame) == _frame()
+    assert bytes(firmwares[2].frame) == _frame((5, 0x01))
+    assert bytes(firmwares[3].frame) == _frame((1, 0x02))
+
+
+def test_grayscale_tiles_keep_the_levels(make_bus):
+    matrices, firmwares = _matrices(make_bus, 2, use_grayscale=True)
+    canvas = LEDMatrixCanvas(matrices)
+
+    canvas.set_pixel(13, 2, 7).set_pixel(0, 0, 15).show()
+
+    expected = bytearray(48)
+    expected[0] = 0xF0  # Pixel (0, 0) is the high nibble
+    assert bytes(firmwares[0].frame) == bytes(expected)
+    expected = bytearray(48)
+    expected[(2 * 12 + 1) // 2] = 0x07  # Pixel (1, 2) is the low nibble
+    assert bytes(firmwares[1].frame) == bytes(expected)
+
+
+@pytest.mark.parametrize("use_grayscale", [False, True])
+def test_rotation_by_180_degrees_mirrors_the_tile(make_bus, use_grayscale):
+    matrices, firmwares = _matrices(make_bus, 2, use_grayscale)
+    canvas = LEDMatrixCanvas(matrices, rotations=[0, 180])
+
+    canvas.set_pixel(12, 0).set_pixel(14, 1).show()
+
+    # Canvas (12, 0) and (14, 1) are the matrix pixels (11, 7) and (9, 6)
+    if use_grayscale:
+        expected = bytearray(48)
+        expected[(7 * 12 + 11) // 2] = 0x0F
+        expected[(6 * 12 + 9) // 2] = 0x0F
+    else:
+        expected = _frame((11, 0x80), (9, 0x40))
+    assert bytes(firmwares[1].frame) == bytes(expected)
+
+
+def test_rotation_by_90_degrees(make_bus):
+    matrices, firmwares = _matrices(make_bus, 2)
+    canvas = LEDMatrixCanvas(matrices, rotations=[90, 90])
+    assert (canvas.width, canvas.height) == (16, 12)
+
+    # The top left corner of a matrix turned clockwise is at the top right of its tile
+    canvas.set_pixel(7, 0).set_pixel(0, 11).set_pixel(15, 1).show()
+
+    assert bytes(firmwares[0].frame) == _frame((0, 0x01), (11, 0x80))
+    assert bytes(firmwares[1].frame) == _frame((1, 0x01))
+
+
+def test_rotation_by_270_degrees(make_bus):
+    matrices, firmwares = _matrices(make_bus, 1)
+    canvas = LEDMatrixCanvas(matrices, rotations=[270])
+
+    # The top left corner of a matrix turned counter clockwise is at the bottom left of its tile
+    canvas.set_pixel(0, 11).set_pixel(7, 0).show()
+
+    assert bytes(firmwares[0].frame) == _frame((0, 0x01), (11, 0x80))
+
+
+def test_show_only_sends_changed_tiles(make_bus):
+    matrices, firmwares = _matrices(make_bus, 3)
+    canvas = LEDMatrixCanvas(matrices)
+    canvas.show()
+    for firmware in firmwares:
+        firmware.frames_received = 0
+
+    canvas.set_pixel(14, 0).show()
+    assert canvas.tiles_sent == 1
+    assert [firmware.frames_received for firmware in firmwares] == [0, 1, 0]
+
+    canvas.show()
+    assert canvas.tiles_sent == 0
+    assert [firmware.frames_received for firmware in firmwares] == [0, 1, 0]
+
+
+def test_invalid_layouts_are_rejected(make_bus):
+    matrices, _ = _matrices(make_bus, 2)
+    with pytest.raises(ValueError):
+        LEDMatrixCanvas([])
+    with pytest.raises(ValueError):
+        LEDMatrixCanvas(matrices, columns=3)
+    with pytest.raises(ValueError):
+        LEDMatrixCanvas(matrices, rotations=[0, 90])
+    with pytest.raises(ValueError):
+        LEDMatrixCanvas(matrices, rotations=[0, 45])
+    matrices[1].use_grayscale = True
+    with pytest.raises(ValueError):
+        LEDMatrixCanvas(matrices)
@@ -0,0 +1,19 @@
+import pytest
+
+import modulino
+
+
+def test_star_import_exports_the_lazy_drivers():
+    # Importing everything imports the sensor Modulinos as well
+    for dependency in ("lsm6dsox", "ltr381rgb", "micropython_hs3003"):
+        pytest.importorskip(dependency)
+    namespace = {}
+    exec("from modulino import *", namespace)
+    for name in ("ModulinoPixels", "ModulinoButtons", "ModulinoLEDMatrix", "DeviceManager", "Modulino", "map_value"):
+        assert name in namespace
+    assert namespace["ModulinoKnob"] is modulino.ModulinoKnob
+
+
+def test_all_lists_every_lazy_attribute():
+    for name in modulino._LAZY_ATTRIBUTES:
+        assert name in modulino.__all__
@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+import sim
+import modulino.pixel_effects
+from modulino import (ModulinoPixels, PixelAnimator, FadeEffect, GradientEffect, RainbowEffect,
+                      ChaseEffect, BreatheEffect, BlendEffect)
+from modulino.pixel_effects import hue_to_packed
+
+_RED = 0xFF0000
+_BLUE = 0x0000FF
+_WHITE = 0xFFFFFF
+
+
+@pytest.fixture
+def animator(make_bus):
+    firmware = sim.PixelsFirmware()
+    bus = make_bus(firmware)
+    # Without gamma correction the colors on the LEDs are the colors of the effects
+    animator = PixelAnimator(ModulinoPixels(bus), fps=50, gamma=False)
+    bus.reset_stats()
+    return animator, firmware, bus
+
+
+def _colors(firmware):
+    leds = firmware.leds
+    return [leds[i + 3] << 16 | leds[i + 2] << 8 | leds[i + 1] for i in range(0, len(leds), 4)]
+
+
+def test_fade_reaches_the_target_and_stops(animator):
+    animator, firmware, bus = animator
+    animator.play(FadeEffect(_RED, _BLUE, duration_ms=1000), now=0)
+
+    assert animator.tick(0) is True
+    assert _colors(firmware) == [_RED] * 8
+    animator.tick(500)
+    assert _colors(firmware) == [0x7F007F] * 8
+    assert animator.finished is False
+    animator.tick(1000)
+    assert _colors(firmware) == [_BLUE] * 8
+    assert animator.finished is True
+
+    # A finished effect isn't rendered or sent anymore
+    transactions = bus.stats.transactions
+    assert animator.tick(2000) is False
+    assert bus.stats.transactions == transactions
+
+
+def test_still_gradient_spans_the_leds(animator):
+    animator, firmware, _ = animator
+    animator.play(GradientEffect(0x000000, _BLUE), now=0)
+
+    animator.tick(0)
+
+    assert _colors(firmware) == [0xFF * ((i << 8) // 7) >> 8 for i in range(8)]
+    assert _colors(firmware)[7] == 0xFF
+    assert animator.finished is True
+
+
+def test_scrolling_gradient_wraps_without_a_jump(animator):
+    animator, firmware, _ = animator
+    animator.play(GradientEffect(0x000000, _BLUE, period_ms=800), 0, 3, now=0)
+
+    animator.tick(0)
+    assert _colors(firmware)[:4] == [0x00, 0x7F, 0xFF, 0x7F]
+    animator.tick(200)  # Scrolled by one LED
+    assert _colors(firmware)[:4] == [0x7F, 0xFF, 0x7F, 0x00]
+    assert animator.finished is False
+
+
+def test_rainbow_spreads_the_hues(animator):
+    animator, firmware, _ = animator
+    animator.play(RainbowEffect(period_ms=2560, spread=32), now=0)
+
+    animator.tick(0)
+    assert _colors(firmware) == [hue_to_packed(32 * i) for i in range(8)]
+    animator.tick(1280)  # Half a cycle
+    assert _colors(firmware) == [hue_to_packed(128 + 32 * i) for i in range(8)]
+    assert hue_to_packed(0) == _RED and hue_to_packed(256) == _RED
+
+
+def test_chase_moves_the_light_with_its_tail(animator):
+    animator, firmware, _ = animator
+    animator.play(ChaseEffect(_WHITE, period_ms=800, tail=1), now=0)
+
+    animator.tick(0)
+    assert _colors(firmware) == [_WHITE] + [0] * 6 + [0x7F7F7F]
+    animator.tick(100)  # The head moved to the next LED
+    assert _colors(firmware) == [0x7F7F7F, _WHITE] + [0] * 6
+
+
+def test_breathe_follows_the_wave(animator):
+    animator, firmware, _ = animator
+    animator.play(BreatheEffect(_BLUE, period_ms=1000), 0, 3, now=0)
+    animator.play(BreatheEffect(_BLUE, period_ms=1000, minimum=50), 4, 7, now=0)
+
+    animator.tick(0)
+    assert _colors(firmware) == [0] * 4 + [0x7F] * 4
+    animator.tick(500)  # The top of the breath
+    assert _colors(firmware) == [_BLUE] * 8
+
+
+def test_blend_cross_fades_every_led(animator):
+    animator, firmware, _ = animator
+    start = [_RED] * 4 + [_BLUE] * 4
+    end = [_BLUE] * 4 + [_RED] * 4
+    animator.play(BlendEffect(start, end, duration_ms=200), now=0)
+
+    animator.tick(0)
+    assert _colors(firmware) == start
+    animator.tick(100)
+    assert _colors(firmware) == [0x7F007F] * 8
+    animator.tick(200)
+    assert _colors(firmware) == end
+    assert animator.finished is True
+
+
+def test_ticks_are_limited_to_the_frame_rate(animator):
+    animator, _, bus = animator
+    animator.play(RainbowEffect(period_ms=2560, spread=0), now=0)
+
+    assert animator.tick(0) is True
+    assert animator.tick(10) is False  # The next frame is due at 20 ms
+    assert bus.stats.transactions == 1
+
+
+def test_unchanged_frames_arent_sent(animator):
+    animator, _, bus = animator
+    animator.play(BreatheEffect(0x000000), now=0)  # Renders black in every frame
+
+    assert animator.tick(0) is True
+    assert animator.tick(20) is False
+    assert animator.tick(40) is False
+    assert animator.finished is False
+    assert bus.stats.transactions == 1
+
+
+def test_run_plays_until_stopped(animator, clock, monkeypatch):
+    animator, firmware, _ = animator
+    clock.install(modulino.pixel_effects)
+    waits = []
+
+    async def sleep_ms(ms):
+        waits.append(ms)
+        clock.advance(ms)
+        if animator.finished:
+            animator.stop()
+
+    monkeypatch.setattr(asyncio, "sleep_ms", sleep_ms)
+    animator.play(FadeEffect(_RED, _BLUE, duration_ms=100))
+    asyncio.run(animator.run())
+
+    assert _colors(firmware) == [_BLUE] * 8
+    assert waits == [20] * 6  # One frame per interval from 0 to 100 ms
@@ -0,0 +1,86 @@
+import pytest
+
+import sim
+from modulino import ModulinoPixels, ModulinoColor, map_value_int
+
+
+def _pixels(make_bus):
+    firmware = sim.PixelsFirmware()
+    bus = make_bus(firmware)
+    pixels = ModulinoPixels(bus)
+    bus.reset_stats()
+    return pixels, firmware, bus
+
+
+def _legacy_led_bytes(r, g, b, brightness):
+    # The encoding of the LED frames before the frame buffer was written in place
+    mapped_brightness = map_value_int(brightness, 0, 100, 0, 0x1f)
+    return (int(ModulinoColor(r, g, b)) | mapped_brightness | 0xE0).to_bytes(4, 'little')
+
+
+@pytest.mark.parametrize("r, g, b, brightness", [
+    (255, 0, 0, 100),
+    (0, 255, 0, 50),
+    (0, 0, 255, 1),
+    (0x12, 0x34, 0x56, 0),
+    (255, 255, 255, 73),
+])
+def test_led_frames_match_the_legacy_encoding(make_bus, r, g, b, brightness):
+    pixels, firmware, _ = _pixels(make_bus)
+    expected = _legacy_led_bytes(r, g, b, brightness)
+
+    pixels.set_rgb(0, r, g, b, brightness)
+    pixels.set_color(1, ModulinoColor(r, g, b), brightness)
+    pixels.set_packed(2, ModulinoPixels.pack_rgb(r, g, b), brightness)
+    pixels[3] = (r, g, b, brightness)
+    pixels.set_range_rgb(4, 5, r, g, b, brightness)
+    pixels.show()
+
+    assert bytes(firmware.leds[:24]) == expected * 6
+    pixels.fill_packed(ModulinoPixels.pack_rgb(r, g, b), brightness).show()
+    assert bytes(firmware.leds) == expected * 8
+
+
+def test_pack_rgb_validates_the_components():
+    assert ModulinoPixels.pack_rgb(0x12, 0x34, 0x56) == 0x123456
+    with pytest.raises(ValueError):
+        ModulinoPixels.pack_rgb(256, 0, 0)
+
+
+def test_unchanged_frame_isnt_sent_again(make_bus):
+    pixels, firmware, bus = _pixels(make_bus)
+
+    assert pixels.set_all_rgb(0, 0, 255).show() is True
+    assert bus.stats.transactions == 1
+
+    assert pixels.set_all_rgb(0, 0, 255).show() is False  # Same content
+    assert pixels.show() is False
+    assert bus.stats.transactions == 1
+
+    assert pixels.set_rgb(7, 255, 0, 0).show() is True
+    assert bus.stats.transactions == 2
+    assert firmware.leds[31] == 255
+
+
+def test_forced_show_sends_an_unchanged_frame(make_bus):
+    pixels, firmware, bus = _pixels(make_bus)
+    pixels.set_all_rgb(0, 255, 0).show()
+    firmware.leds[:] = bytes(32)  # The module lost the colors without the driver noticing
+
+    assert pixels.show(force=True) is True
+    assert bus.stats.transactions == 2
+    assert bytes(firmware.leds) == _legacy_led_bytes(0, 255, 0, 100) * 8
+
+
+def test_reconnected_module_gets_the_frame_again(make_bus):
+    pixels, firmware, bus = _pixels(make_bus)
+    pixels.set_all_rgb(255, 0, 255).show()
+    restarted = sim.PixelsFirmware()
+    bus.detach(firmware)
+    bus.attach(restarted)
+
+    pixels._on_reconnected()
+
+    assert pixels.show() is True
+    assert bytes(restarted.leds) == _legacy_led_bytes(255, 0, 255, 100) * 8
+    assert pixels.show() is False
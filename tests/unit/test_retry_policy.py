@@ -0,0 +1,125 @@
+from errno import EIO, ENODEV, ETIMEDOUT
+
+import pytest
+
+import sim
+import modulino.modulino
+from modulino import Modulino, ModulinoBuzzer, ModulinoButtons, RetryPolicy
+
+_BUZZER = sim.BuzzerFirmware.pinstrap >> 1
+
+
+@pytest.fixture
+def backoffs(monkeypatch):
+    """
+    Records the backoff waits of the retry policies instead of sleeping.
+    """
+    waits = []
+    monkeypatch.setattr(modulino.modulino, "sleep_ms", waits.append)
+    return waits
+
+
+def _buzzer(make_bus, **kwargs):
+    firmware = sim.BuzzerFirmware()
+    bus = make_bus(firmware, sim.ButtonsFirmware(), **kwargs)
+    buzzer = ModulinoBuzzer(bus)
+    bus.reset_stats()
+    return buzzer, firmware, bus
+
+
+def test_errors_are_raised_right_away_by_default(make_bus):
+    buzzer, _, bus = _buzzer(make_bus)
+    bus.inject_fault(EIO, count=1)
+
+    assert Modulino.retry_policy is None
+    with pytest.raises(OSError):
+        buzzer.tone(440)
+    assert bus.stats.transactions == 1
+
+
+def test_policy_of_one_modulino_doesnt_affect_the_others(make_bus, backoffs):
+    buzzer, _, bus = _buzzer(make_bus)
+    buttons = ModulinoButtons(bus)
+    buzzer.retry_policy = RetryPolicy()
+
+    bus.inject_fault(EIO, count=1)
+    buzzer.tone(440)
+    bus.inject_fault(EIO, count=1)
+    with pytest.raises(OSError):
+        buttons.update()
+
+    assert buttons.retry_policy is None
+
+
+def test_transfer_is_retried_with_doubling_backoff(make_bus, backoffs):
+    buzzer, firmware, bus = _buzzer(make_bus)
+    policy = buzzer.retry_policy = RetryPolicy(retries=3, backoff_ms=4)
+    bus.inject_fault(ETIMEDOUT, count=3)
+
+    buzzer.tone(440, 100)
+
+    assert (firmware.frequency, firmware.duration) == (440, 100)
+    assert backoffs == [4, 8, 16]
+    assert policy.stats["retries"] == 3
+    assert policy.stats["resets"] == 0
+
+
+def test_failures_that_never_recover_are_raised_after_the_retries(make_bus, backoffs):
+    buzzer, _, bus = _buzzer(make_bus, scl=5, sda=4)
+    policy = buzzer.retry_policy = RetryPolicy(retries=2, backoff_ms=1, reset_after=1)
+    bus.inject_fault(EIO, count=100)  # A new controller doesn't help either
+
+    with pytest.raises(OSError) as error:
+        buzzer.tone(440)
+
+    assert error.value.args[0] == EIO
+    assert policy.stats["failures"] == 1
+    assert policy.stats["retries"] == 2
+    assert bus.stats.transactions == 3
+
+
+def test_missing_device_isnt_retried(make_bus, backoffs):
+    buzzer, _, bus = _buzzer(make_bus)
+    policy = buzzer.retry_policy = RetryPolicy()
+    bus.detach(_BUZZER)
+
+    with pytest.raises(OSError) as error:
+        buzzer.tone(440)
+
+    assert error.value.args[0] == ENODEV
+    assert backoffs == []
+    assert policy.stats["retries"] == 0
+
+
+def test_stuck_bus_is_recovered_only_when_enabled(make_bus, backoffs):
+    buzzer, firmware, bus = _buzzer(make_bus, scl=5, sda=4)
+    buttons = ModulinoButtons(bus)
+
+    buzzer.retry_policy = RetryPolicy(retries=2)
+    bus.inject_fault(EIO, stuck=True)
+    with pytest.raises(OSError):
+        buzzer.tone(440)
+    assert buzzer.i2c_bus is bus
+
+    policy = buzzer.retry_policy = RetryPolicy(retries=2, reset_after=1)
+    buzzer.tone(440)
+
+    assert firmware.frequency == 440
+    assert policy.stats["resets"] == 1
+    assert buzzer.i2c_bus is not bus
+    # The other Modulinos move to the new bus object on their next transaction
+    buttons.update()
+    assert buttons.i2c_bus is buzzer.i2c_bus
+
+
+def test_bus_without_known_pins_isnt_replaced(make_bus, backoffs, capsys):
+    buzzer, _, bus = _buzzer(make_bus)
+    policy = buzzer.retry_policy = RetryPolicy(retries=2, reset_after=1)
+    bus.inject_fault(EIO, stuck=True)
+
+    with pytest.raises(OSError):
+        buzzer.tone(440)
+
+    assert buzzer.i2c_bus is bus
+    assert policy.stats["resets"] == 0
+    assert policy.stats["failures"] == 1
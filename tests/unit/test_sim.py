@@ -0,0 +1,16 @@
+import sim
+
+
+def test_register_read_is_two_transactions(make_bus):
+    chip = sim.LSM6DSOXChip()
+    bus = make_bus(chip)
+
+    bus.readfrom_mem(chip.address, 0x0F, 1)
+    buffer = bytearray(6)
+    bus.readfrom_mem_into(chip.address, 0x28, buffer)
+
+    assert bus.stats.transactions == 4
+    assert bus.stats.bytes_written == 2
+    assert bus.stats.bytes_read == 7
+    assert bus.stats.per_address[chip.address] == [4, 2, 7]
+    assert [entry[2:] for entry in bus.log] == [(1, 0), (0, 1), (1, 0), (0, 6)]
@@ -0,0 +1,172 @@
+"""
+Script to generate the gamma correction tables (src/modulino/gamma.py)
+and the lookup tables of the pixel effects (src/modulino/_effect_tables.py).
+
+The LEDs emit light proportionally to the value they get, but the eye perceives brightness
+roughly logarithmically. The tables map a perceived intensity to the value to send.
+They are computed here with floating point math and stored as bytes literals,
+so the boards don't have to compute them (and allocate them on the heap) on every boot.
+The same applies to the hue and breathing tables of the pixel effects.
+
+Run it whenever a table is added or its parameters are changed:
+
+```
+python tools/generate_gamma.py
+```
+
+Usage: python generate_gamma.py [--check]
+
+Options:
+    --check: Don't write the tables but exit with status 1 if they're out of date.
+"""
+
+import argparse
+import os
+import sys
+from math import cos, pi
+
+MODULE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "modulino"))
+GAMMA_PATH = os.path.join(MODULE_DIR, "gamma.py")
+EFFECT_TABLES_PATH = os.path.join(MODULE_DIR, "_effect_tables.py")
+
+DEFAULT_GAMMA = 2.7
+
+# (name, description, levels, inputs, minimum)
+TABLES = (
+    ("GAMMA_8BIT", "Maps an 8-bit intensity (0..255) to an 8-bit color value, e.g. for the colors of the Pixels.", 256, 256, 0),
+    ("GAMMA_4BIT", "Maps an 8-bit intensity (0..255) to a level of the grayscale mode of the LED Matrix (0..15).", 16, 256, 0),
+    ("PERCEPTUAL_BRIGHTNESS", "Maps a brightness in percent (0..100) to the 5-bit brightness of the Pixels (0..31).\n"
+                              "# Every brightness above 0 keeps the LED on.", 32, 101, 1),
+)
+
+BYTES_PER_LINE = 16
+
+def gamma_table(levels: int = 256, inputs: int = 256, gamma: float = DEFAULT_GAMMA, minimum: int = 0) -> bytes:
+    """
+    Computes a table that maps a perceived intensity to an output level.
+
+    Parameters:
+        levels (int): The amount of output levels, e.g. 16 for the grayscale mode of the LED Matrix.
+        inputs (int): The amount of input values, e.g. 256 for 0..255 or 101 for a percentage.
+        gamma (float): The gamma exponent.
+        minimum (int): The lowest output level of a non-zero input. A minimum of 1 ensures that
+                       small intensities don't turn the LED off.
+
+    Returns:
+        bytes: The output level for every input value.
+    """
+    if levels < 2 or levels > 256 or inputs < 2:
+        raise ValueError("The table needs at least 2 input values and between 2 and 256 levels")
+    top_input = inputs - 1
+    top_level = levels - 1
+    table = bytearray(inputs)
+    for value in range(1, inputs):
+        table[value] = max(minimum, int((value / top_input) ** gamma * top_level + 0.5))
+    return bytes(table)
+
+def hue_table() -> bytes:
+    """
+    Computes the fully saturated colors of the 256 hues (red -> yellow -> green -> cyan -> blue -> magenta -> red).
+
+    Returns:
+        bytes: The red, green and blue byte of every hue.
+    """
+    table = bytearray(256 * 3)
+    for hue in range(256):
+        sector = hue * 6 // 256
+        rising = hue * 6 - sector * 256 # 0..255 within the sector
+        falling = 255 - rising
+        if sector == 0:
+            rgb = (255, rising, 0)
+        elif sector == 1:
+            rgb = (falling, 255, 0)
+        elif sector == 2:
+            rgb = (0, 255, rising)
+        elif sector == 3:
+            rgb = (0, falling, 255)
+        elif sector == 4:
+            rgb = (rising, 0, 255)
+        else:
+            rgb = (255, 0, falling)
+        table[hue * 3:hue * 3 + 3] = bytes(rgb)
+    return bytes(table)
+
+def wave_table() -> bytes:
+    """
+    Computes one period of a raised cosine (0 -> 255 -> 0) in 256 steps.
+
+    Returns:
+        bytes: The intensity of every step.
+    """
+    return bytes([int((1 - cos(2 * pi * i / 256)) * 127.5 + 0.5) for i in range(256)])
+
+def _append_table(lines: list, name: str, description: str, table: bytes) -> None:
+    """
+    Appends a table as a bytes literal that is split into lines of BYTES_PER_LINE bytes.
+    """
+    lines.append("")
+    lines.append(f"# {description}")
+    lines.append(f"{name} = (")
+    for start in range(0, len(table), BYTES_PER_LINE):
+        chunk = table[start:start + BYTES_PER_LINE]
+        lines.append("    b'" + "".join(f"\\x{value:02x}" for value in chunk) + "'")
+    lines.append(")")
+
+def generate() -> str:
+    """
+    Returns the source code of the gamma module.
+    """
+    lines = [
+        "# This file is generated by tools/generate_gamma.py. Do not edit it manually.",
+        "",
+        "# Gamma correction tables shared by the Pixels, the LED Matrix and the conversion tools.",
+        "# The eye perceives brightness roughly logarithmically, so fades between linear values seem to jump",
+        "# at the dark end and to stall at the bright end. The tables map a perceived intensity to the value to send.",
+        f"# They use a gamma of {DEFAULT_GAMMA}. This module doesn't import anything, the tools load it on the host.",
+    ]
+    for name, description, levels, inputs, minimum in TABLES:
+        _append_table(lines, name, description, gamma_table(levels, inputs, minimum=minimum))
+    return "\n".join(lines) + "\n"
+
+def generate_effect_tables() -> str:
+    """
+    Returns the source code of the module with the tables of the pixel effects.
+    """
+    lines = [
+        "# This file is generated by tools/generate_gamma.py. Do not edit it manually.",
+        "",
+        "# Lookup tables of the pixel effects, so that rendering a frame needs integer math only.",
+    ]
+    _append_table(lines, "HUE_TABLE", "The red, green and blue byte of the fully saturated color of each of the 256 hues.", hue_table())
+    _append_table(lines, "WAVE_TABLE", "One period of a raised cosine (0 -> 255 -> 0) in 256 steps, used for breathing.", wave_table())
+    return "\n".join(lines) + "\n"
+
+OUTPUTS = (
+    (GAMMA_PATH, generate),
+    (EFFECT_TABLES_PATH, generate_effect_tables),
+)
+
+parser = argparse.ArgumentParser(description="Generate the gamma correction tables.")
+parser.add_argument("--check", action="store_true", help="Exit with status 1 if the tables are out of date instead of writing them.")
+args = parser.parse_args()
+
+if args.check:
+    outdated = False
+    for path, generate_source in OUTPUTS:
+        try:
+            with open(path, "r") as f:
+                current = f.read()
+        except OSError:
+            current = None
+        if current != generate_source():
+            print(f"{path} is out of date. Run tools/generate_gamma.py.")
+            outdated = True
+    if outdated:
+        sys.exit(1)
+    print("Gamma tables are up to date.")
+    sys.exit(0)
+
+for path, generate_source in OUTPUTS:
+    with open(path, "w") as f:
+        f.write(generate_source())
+    print(f"Tables written to {path}")
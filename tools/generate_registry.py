@@ -0,0 +1,136 @@
+"""
+Script to generate the static Modulino registry (src/modulino/_registry.py).
+
+The registry maps the addresses of all discoverable Modulinos to the module and
+class that implement them. It lets the DeviceManager look up device classes
+without importing every driver or inspecting the loaded modules at runtime.
+The driver sources are parsed statically, so the sensor libraries the drivers
+depend on don't need to be installed to run this script.
+
+Run it whenever a Modulino class or one of its addresses is added or changed:
+
+```
+python tools/generate_registry.py
+```
+
+Usage: python generate_registry.py [--check]
+
+Options:
+    --check: Don't write the registry but exit with status 1 if it's out of date.
+"""
+
+import argparse
+import ast
+import os
+import sys
+
+PACKAGE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "modulino"))
+REGISTRY_PATH = os.path.join(PACKAGE_DIR, "_registry.py")
+
+# Modules that don't contain Modulino device classes
+EXCLUDED_MODULES = ("__init__", "_registry", "modulino", "helpers", "device_manager")
+
+def class_attribute(class_node: ast.ClassDef, name: str):
+    """
+    Returns the literal value assigned to a class attribute or None if it isn't assigned.
+    Calls of const() are unwrapped.
+    """
+    for node in class_node.body:
+        if isinstance(node, ast.Assign):
+            targets = [target.id for target in node.targets if isinstance(target, ast.Name)]
+            value = node.value
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+            targets = [node.target.id]
+            value = node.value
+        else:
+            continue
+        if name not in targets:
+            continue
+        if isinstance(value, ast.Call) and getattr(value.func, "id", None) == "const":
+            value = value.args[0]
+        return ast.literal_eval(value)
+    return None
+
+def find_modulinos() -> list:
+    """
+    Returns a list of (module name, class name, addresses, has_mcu, discoverable) tuples
+    for all Modulino classes in the package.
+    Classes that define `default_addresses` can be discovered by the DeviceManager.
+    Classes with a fixed `DEFAULT_ADDRESS` are only probed during auto discovery.
+    """
+    modulinos = []
+    for file_name in sorted(os.listdir(PACKAGE_DIR)):
+        module_name, extension = os.path.splitext(file_name)
+        if extension != ".py" or module_name in EXCLUDED_MODULES:
+            continue
+        with open(os.path.join(PACKAGE_DIR, file_name), "r") as f:
+            tree = ast.parse(f.read(), file_name)
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            if not any(getattr(base, "id", None) == "Modulino" for base in node.bases):
+                continue
+            has_mcu = class_attribute(node, "has_mcu")
+            has_mcu = True if has_mcu is None else has_mcu
+            addresses = class_attribute(node, "default_addresses")
+            if addresses:
+                modulinos.append((module_name, node.name, list(addresses), has_mcu, True))
+                continue
+            address = class_attribute(node, "DEFAULT_ADDRESS")
+            if address is not None:
+                modulinos.append((module_name, node.name, [address], has_mcu, False))
+    return modulinos
+
+def generate(modulinos: list) -> str:
+    """
+    Returns the source code of the registry module.
+    """
+    lines = [
+        "# This file is generated by tools/generate_registry.py. Do not edit it manually.",
+        "",
+        "# Maps the default addresses of the discoverable Modulinos to (module, class name).",
+        "# Modulinos with an MCU are listed with their pinstrap address.",
+        "ADDRESS_TO_CLASS = {",
+    ]
+    entries = []
+    for module_name, class_name, addresses, _, discoverable in modulinos:
+        if discoverable:
+            entries.extend((address, module_name, class_name) for address in addresses)
+    for address, module_name, class_name in sorted(entries):
+        lines.append(f"  0x{address:02X}: (\"{module_name}\", \"{class_name}\"),")
+    lines.append("}")
+    lines.append("")
+
+    lines.append("# 7-bit addresses of all Modulinos at their default address.")
+    lines.append("KNOWN_ADDRESSES = (")
+    known = []
+    for _, class_name, addresses, has_mcu, _ in modulinos:
+        # Modulinos with an MCU expose the pinstrap address shifted by one bit
+        known.extend((address >> 1 if has_mcu else address, class_name) for address in addresses)
+    for address, class_name in sorted(known):
+        lines.append(f"  0x{address:02X}, # {class_name}")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+parser = argparse.ArgumentParser(description="Generate the static Modulino registry.")
+parser.add_argument("--check", action="store_true", help="Exit with status 1 if the registry is out of date instead of writing it.")
+args = parser.parse_args()
+
+source = generate(find_modulinos())
+
+if args.check:
+    try:
+        with open(REGISTRY_PATH, "r") as f:
+            current = f.read()
+    except OSError:
+        current = None
+    if current != source:
+        print(f"{REGISTRY_PATH} is out of date. Run tools/generate_registry.py.")
+        sys.exit(1)
+    print("Registry is up to date.")
+    sys.exit(0)
+
+with open(REGISTRY_PATH, "w") as f:
+    f.write(source)
+print(f"Registry written to {REGISTRY_PATH}")
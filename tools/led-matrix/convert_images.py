@@ -4,6 +4,7 @@ Optionally rotate images to adjust for orientation.
 
 Example usage:
   python convert_frames_mpy.py images.zip --rotate -90 --fps 25 --format py > animation.py
+  python convert_frames_mpy.py images.zip --fps 25 --format py --compress > animation.py
 
 This script processes each image by:
 1. Loading the image and converting it to grayscale.
@@ -18,6 +19,8 @@ Arguments:
   --rotate: Optional rotation angle in degrees (positive values rotate counter-clockwise). Useful for adjusting portrait/landscape orientation.
   --format: Output format, either 'py' for Python list or 'c' for C array. Default is 'py'.
   --fps: Frames per second. Default is 25 FPS.
+  --compress: Store the frames delta encoded in a single bytes object (Python output only).
+              The result is played with DeltaAnimation and is usually a fraction of the size.
 
 Supported image formats include PNG, JPEG, BMP, and GIF. Non-image files and macOS metadata files are ignored gracefully.
 Example output format:
@@ -28,16 +31,36 @@ frames = [
     ...
 ]
 
+fps = 25
+
+Example output format with --compress:
+
+frames = b'\xef\x00\x81\x43\x20...'
+
 fps = 25
 """
 import argparse
+import importlib.util
 import sys
 import zipfile
 import io
-import math
 import os
 from typing import List, Tuple, Optional
 
+def load_gamma_tables():
+    """
+    Loads the gamma tables of the drivers (src/modulino/gamma.py) by file path,
+    so the converted frames look the same as frames drawn on the board.
+    The module has no imports, so the rest of the package isn't needed on the host.
+    """
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src", "modulino", "gamma.py")
+    spec = importlib.util.spec_from_file_location("modulino_gamma", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+GAMMA_4BIT = load_gamma_tables().GAMMA_4BIT
+
 try:
     from PIL import Image
 except ImportError:
@@ -48,8 +71,7 @@ def gamma_correct(pixel_value: int) -> int:
     """
     Apply gamma correction to a pixel value and scale it to 4-bit (0-15).
     """
-    corrected = int(math.pow(pixel_value / 255.0, 2.7) * 15.0 + 0.5)
-    return max(0, min(15, corrected))
+    return GAMMA_4BIT[max(0, min(255, pixel_value))]
 
 def process_image(image_data: bytes, rotation: int, target_size: Tuple[int, int] = (12, 8)) -> Optional[bytearray]:
     """
@@ -149,7 +171,7 @@ def process_file(file_path: str, rotation: int) -> Optional[bytearray]:
             sys.stderr.write(f"Error reading file {file_path}: {e}\n")
     return None
 
-def generate_output(frames: List[bytearray], output_format: str, fps: int):
+def generate_output(frames: List[bytearray], output_format: str, fps: int, compress: bool = False):
     """
     Print the generated code to stdout.
     """
@@ -157,7 +179,22 @@ def generate_output(frames: List[bytearray], output_format: str, fps: int):
         sys.stderr.write("Warning: FPS must be greater than 0. Defaulting to 25 FPS for C output.\n")
         return
 
-    if output_format == 'py':
+    if output_format == 'py' and compress:
+        from delta_codec import encode_frames
+        encoded = encode_frames([bytes(frame) for frame in frames])
+        raw_size = sum(len(frame) for frame in frames)
+        print(f"# Auto-generated frame data, delta encoded ({len(encoded)} bytes instead of {raw_size} bytes)")
+        print("# Play it with DeltaAnimation(led_matrix, frames, fps)")
+        print("")
+        print("frames = (")
+        # Split the literal into lines of 48 bytes
+        for start in range(0, len(encoded), 48):
+            hex_content = "".join(f"\\x{b:02x}" for b in encoded[start:start + 48])
+            print(f"    b'{hex_content}'")
+        print(")\n")
+        print(f"fps = {fps}")
+
+    elif output_format == 'py':
         print("# Auto-generated frame data")
         print("")
         print("frames = [")
@@ -187,6 +224,7 @@ def main():
     parser.add_argument('-rotate', '--rotate', type=int, default=0, help='Rotation angle in degrees (positive = counter-clockwise). Useful for adjusting portrait/landscape orientation.')
     parser.add_argument('-format', '--format', choices=['py', 'c'], default='py', dest='format', help='Output format: Python list (py) or C array (c)')
     parser.add_argument('-fps', '--fps', type=int, default=25, dest='fps', help='Frames per second (only used for C output)')
+    parser.add_argument('-compress', '--compress', action='store_true', help='Delta encode the frames into a single bytes object for DeltaAnimation (Python output only)')
     
     args = parser.parse_args()
     
@@ -201,7 +239,11 @@ def main():
             if res:
                 all_frames.append(res)
 
-    generate_output(all_frames, args.format, args.fps)
+    if args.compress and args.format != 'py':
+        sys.stderr.write("Error: --compress is only supported for Python output.\n")
+        sys.exit(1)
+
+    generate_output(all_frames, args.format, args.fps, args.compress)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,134 @@
+"""
+Convert MPJ files, images or videos into an MLA file that can be streamed
+onto the Modulino LED Matrix with MLAAnimation. E.g.:
+
+```
+from modulino import ModulinoLEDMatrix, MLAAnimation
+led_matrix = ModulinoLEDMatrix(use_grayscale=True)
+
+animation = MLAAnimation(led_matrix, '/animation.mla')
+animation.play()
+```
+
+Example usage:
+  python convert_to_mla.py animation.mpj -o animation.mla
+  python convert_to_mla.py images.zip -o animation.mla --rotate -90 --fps 25
+  python convert_to_mla.py clip.mp4 -o animation.mla --fps 25 --contrast 1.5 --crop "100,50,640,480"
+
+Arguments:
+  input_files: An MPJ file, a video file, or one or more image files or zip files containing images.
+  --output: The MLA file to write.
+  --fps: Frames per second for images and videos. Default is 25 FPS. MPJ files contain their own frame durations.
+  --rotate: Rotation angle in degrees for images and videos (positive values rotate counter-clockwise).
+  --contrast: Contrast factor for videos (1.0 = original).
+  --crop: Crop region "x,y,w,h" for videos. Applied before resizing.
+  --monochrome: Store monochrome frames. Grayscale pixels with a brightness of at least --threshold are turned on.
+  --grayscale: Store grayscale frames. MPJ pixels that are on get full brightness.
+  --threshold: Brightness threshold (0-15) used by --monochrome. Default is 8.
+
+By default MPJ files are stored as monochrome frames and images and videos as grayscale frames.
+Images and videos require Pillow, videos additionally require OpenCV (see convert_images.py and convert_video.py).
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from mla import write_mla, fps_durations, grayscale_to_monochrome, monochrome_to_grayscale, MATRIX_WIDTH, MATRIX_HEIGHT
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm', '.m4v')
+
+def load_mpj(path: str):
+    """
+    Loads the frames and durations of an MPJ (JSON) file as monochrome frames.
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    frames = []
+    durations = []
+    for frame_data in data:
+        matrix = frame_data['matrix']
+        buffer = bytearray(MATRIX_WIDTH)
+        for y in range(min(MATRIX_HEIGHT, len(matrix))):
+            for x in range(min(MATRIX_WIDTH, len(matrix[y]))):
+                if matrix[y][x]:
+                    buffer[x] |= (1 << y)
+        frames.append(bytes(buffer))
+        durations.append(int(frame_data['duration']))
+    return frames, durations
+
+def load_images(paths: list, rotation: int) -> list:
+    """
+    Loads image files and zip files containing images as grayscale frames.
+    """
+    from convert_images import process_zip, process_file
+    frames = []
+    for path in paths:
+        if path.lower().endswith('.zip'):
+            frames.extend(process_zip(path, rotation))
+        else:
+            frame = process_file(path, rotation)
+            if frame:
+                frames.append(frame)
+    return [bytes(frame) for frame in frames]
+
+def load_video(path: str, rotation: int, contrast: float, crop) -> list:
+    """
+    Extracts the frames of a video as grayscale frames.
+    """
+    from convert_video import video_to_zip
+    with tempfile.TemporaryDirectory() as directory:
+        zip_path = os.path.join(directory, 'frames.zip')
+        video_to_zip(path, zip_path, contrast, None, crop)
+        return load_images([zip_path], rotation)
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert MPJ files, images or videos into an MLA file for the Modulino LED Matrix.')
+    parser.add_argument('input_files', nargs='+', help='MPJ file, video file, or image files / zip files')
+    parser.add_argument('-o', '--output', required=True, help='The MLA file to write')
+    parser.add_argument('--fps', type=int, default=25, help='Frames per second for images and videos')
+    parser.add_argument('--rotate', type=int, default=0, help='Rotation angle in degrees (positive = counter-clockwise)')
+    parser.add_argument('--contrast', type=float, default=1.0, help='Contrast factor for videos (1.0 = original)')
+    parser.add_argument('--crop', type=str, help='Crop region for videos in format "x,y,w,h"')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--monochrome', action='store_true', help='Store monochrome frames')
+    mode.add_argument('--grayscale', action='store_true', help='Store grayscale frames')
+    parser.add_argument('--threshold', type=int, default=8, help='Brightness threshold (0-15) for --monochrome')
+    args = parser.parse_args()
+
+    if args.fps <= 0:
+        sys.stderr.write("Error: FPS must be greater than 0.\n")
+        sys.exit(1)
+
+    first_input = args.input_files[0].lower()
+    if first_input.endswith('.mpj'):
+        frames, durations = load_mpj(args.input_files[0])
+        grayscale = False
+    else:
+        if first_input.endswith(VIDEO_EXTENSIONS):
+            from convert_video import parse_crop_arg
+            frames = load_video(args.input_files[0], args.rotate, args.contrast, parse_crop_arg(args.crop))
+        else:
+            frames = load_images(args.input_files, args.rotate)
+        durations = fps_durations(len(frames), args.fps)
+        grayscale = True
+
+    if not frames:
+        sys.stderr.write("Error: No frames found.\n")
+        sys.exit(1)
+
+    if args.monochrome and grayscale:
+        frames = [grayscale_to_monochrome(frame, args.threshold) for frame in frames]
+        grayscale = False
+    elif args.grayscale and not grayscale:
+        frames = [monochrome_to_grayscale(frame) for frame in frames]
+        grayscale = True
+
+    size = write_mla(args.output, frames, durations, grayscale)
+    print(f"Wrote {len(frames)} {'grayscale' if grayscale else 'monochrome'} frames ({size} bytes) to {args.output}")
+
+if __name__ == '__main__':
+    main()
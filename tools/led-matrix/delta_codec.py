@@ -0,0 +1,121 @@
+"""
+Delta encoding of LED matrix frames as played by DeltaAnimation.
+
+Every frame is stored as a sequence of operations that turn the previous frame
+(a blank frame for the first one) into the current frame:
+  0x00-0x7F: Skip the next op + 1 bytes, they didn't change.
+  0x80-0xBF: Copy the following op - 0x7F bytes.
+  0xC0-0xFF: Repeat the following byte op - 0xBF times.
+The operations of a frame cover exactly the size of a frame, the next frame starts right after them.
+"""
+
+from typing import List
+
+MAX_SKIP = 128
+MAX_LITERAL = 64
+MAX_RUN = 64
+MIN_RUN = 3  # Shorter runs are cheaper as part of a literal
+MIN_SKIP = 2  # A single unchanged byte is cheaper as part of a literal
+
+def _run_length(frame: bytes, start: int) -> int:
+    """
+    Returns how often the byte at `start` repeats, capped at MAX_RUN.
+    """
+    end = start + 1
+    while end < len(frame) and end - start < MAX_RUN and frame[end] == frame[start]:
+        end += 1
+    return end - start
+
+def _skip_length(previous: bytes, frame: bytes, start: int) -> int:
+    """
+    Returns how many bytes starting at `start` are unchanged, capped at MAX_SKIP.
+    """
+    end = start
+    while end < len(frame) and end - start < MAX_SKIP and frame[end] == previous[end]:
+        end += 1
+    return end - start
+
+def encode_frame(previous: bytes, frame: bytes) -> bytes:
+    """
+    Encodes a frame as the difference to the previous frame.
+    """
+    if len(previous) != len(frame):
+        raise ValueError("Frames must have the same size")
+
+    encoded = bytearray()
+    literal = bytearray()
+
+    def flush_literal():
+        if literal:
+            encoded.append(0x80 + len(literal) - 1)
+            encoded.extend(literal)
+            literal.clear()
+
+    position = 0
+    size = len(frame)
+    while position < size:
+        skip = _skip_length(previous, frame, position)
+        # Trailing unchanged bytes always need a skip to complete the frame
+        if skip >= MIN_SKIP or (skip > 0 and position + skip == size and not literal):
+            flush_literal()
+            encoded.append(skip - 1)
+            position += skip
+            continue
+
+        run = _run_length(frame, position)
+        if run >= MIN_RUN:
+            flush_literal()
+            encoded.append(0xC0 + run - 1)
+            encoded.append(frame[position])
+            position += run
+            continue
+
+        literal.append(frame[position])
+        position += 1
+        if len(literal) == MAX_LITERAL:
+            flush_literal()
+
+    flush_literal()
+    return bytes(encoded)
+
+def encode_frames(frames: List[bytes]) -> bytes:
+    """
+    Encodes a list of frames into a single byte string.
+    """
+    if not frames:
+        return b''
+    previous = bytes(len(frames[0]))
+    encoded = bytearray()
+    for frame in frames:
+        encoded += encode_frame(previous, frame)
+        previous = frame
+    return bytes(encoded)
+
+def decode_frames(data: bytes, frame_size: int) -> List[bytes]:
+    """
+    Decodes a byte string created by encode_frames(). Used to verify the encoding.
+    """
+    frames = []
+    buffer = bytearray(frame_size)
+    offset = 0
+    while offset < len(data):
+        position = 0
+        while position < frame_size:
+            op = data[offset]
+            offset += 1
+            if op < 0x80:
+                position += op + 1
+            elif op < 0xC0:
+                count = op - 0x7F
+                buffer[position:position + count] = data[offset:offset + count]
+                position += count
+                offset += count
+            else:
+                count = op - 0xBF
+                buffer[position:position + count] = bytes([data[offset]]) * count
+                position += count
+                offset += 1
+        if position != frame_size:
+            raise ValueError("Encoded frame doesn't match the frame size")
+        frames.append(bytes(buffer))
+    return frames
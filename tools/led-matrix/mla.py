@@ -0,0 +1,130 @@
+"""
+Reading and writing of MLA files, the binary animation format played by MLAAnimation.
+
+File layout (all numbers are little-endian):
+  Header (8 bytes):
+    - b'MLA'
+    - Format version (1)
+    - Mode: 0 = monochrome (12 bytes per frame), 1 = grayscale (48 bytes per frame)
+    - Flags: reserved, 0
+    - Number of frames (uint16)
+  One record per frame:
+    - Display duration in milliseconds (uint16)
+    - Frame data as sent to the LED matrix
+      Monochrome: 12 bytes, one per column, bit 0 is the top row.
+      Grayscale: 48 bytes, row by row, two pixels per byte, the left pixel in the high nibble.
+"""
+
+import struct
+from typing import List, Tuple
+
+MAGIC = b'MLA'
+VERSION = 1
+MODE_MONOCHROME = 0
+MODE_GRAYSCALE = 1
+HEADER_FORMAT = '<3sBBBH'
+DURATION_FORMAT = '<H'
+FRAME_SIZES = {MODE_MONOCHROME: 12, MODE_GRAYSCALE: 48}
+MATRIX_WIDTH = 12
+MATRIX_HEIGHT = 8
+
+def write_mla(path: str, frames: List[bytes], durations: List[int], grayscale: bool) -> int:
+    """
+    Writes the frames to an MLA file.
+
+    Args:
+        path: The file to write.
+        frames: The frame data, 12 bytes per frame for monochrome and 48 bytes for grayscale.
+        durations: The display duration of each frame in milliseconds.
+        grayscale: Whether the frames are grayscale frames.
+
+    Returns:
+        The size of the written file in bytes.
+    """
+    mode = MODE_GRAYSCALE if grayscale else MODE_MONOCHROME
+    frame_size = FRAME_SIZES[mode]
+    if len(frames) != len(durations):
+        raise ValueError("Every frame needs a duration")
+    if len(frames) > 0xFFFF:
+        raise ValueError("MLA files can't contain more than 65535 frames")
+
+    data = bytearray(struct.pack(HEADER_FORMAT, MAGIC, VERSION, mode, 0, len(frames)))
+    for frame, duration in zip(frames, durations):
+        if len(frame) != frame_size:
+            raise ValueError(f"Frames must be {frame_size} bytes long, got {len(frame)}")
+        if not 0 <= duration <= 0xFFFF:
+            raise ValueError(f"Frame durations must be between 0 and 65535 ms, got {duration}")
+        data += struct.pack(DURATION_FORMAT, duration)
+        data += frame
+
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+def read_mla(path: str) -> Tuple[List[bytes], List[int], bool]:
+    """
+    Reads an MLA file.
+
+    Returns:
+        A tuple of the frames, their durations and whether they are grayscale frames.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    header_size = struct.calcsize(HEADER_FORMAT)
+    magic, version, mode, flags, count = struct.unpack_from(HEADER_FORMAT, data)
+    if magic != MAGIC or version != VERSION or mode not in FRAME_SIZES or flags != 0:
+        raise ValueError(f"{path} is not a supported MLA file")
+
+    frame_size = FRAME_SIZES[mode]
+    frames = []
+    durations = []
+    offset = header_size
+    for _ in range(count):
+        durations.append(struct.unpack_from(DURATION_FORMAT, data, offset)[0])
+        offset += 2
+        frames.append(bytes(data[offset:offset + frame_size]))
+        offset += frame_size
+    return frames, durations, mode == MODE_GRAYSCALE
+
+def fps_durations(frame_count: int, fps: int) -> List[int]:
+    """
+    Returns the frame durations for the given frame rate.
+    The durations alternate between neighbouring whole milliseconds to match the frame rate exactly.
+    """
+    durations = []
+    remainder = 0
+    for _ in range(frame_count):
+        remainder += 1000
+        duration = remainder // fps
+        remainder -= duration * fps
+        durations.append(duration)
+    return durations
+
+def grayscale_to_monochrome(frame: bytes, threshold: int = 8) -> bytes:
+    """
+    Converts a grayscale frame into a monochrome frame.
+    Pixels with a brightness of at least `threshold` (0-15) are turned on.
+    """
+    mono = bytearray(MATRIX_WIDTH)
+    for y in range(MATRIX_HEIGHT):
+        for x in range(MATRIX_WIDTH):
+            index = y * MATRIX_WIDTH + x
+            value = frame[index // 2]
+            value = value >> 4 if index % 2 == 0 else value & 0x0F
+            if value >= threshold:
+                mono[x] |= 1 << y
+    return bytes(mono)
+
+def monochrome_to_grayscale(frame: bytes, brightness: int = 15) -> bytes:
+    """
+    Converts a monochrome frame into a grayscale frame.
+    Pixels that are on get the given brightness (0-15).
+    """
+    gray = bytearray(MATRIX_WIDTH * MATRIX_HEIGHT // 2)
+    for y in range(MATRIX_HEIGHT):
+        for x in range(MATRIX_WIDTH):
+            if frame[x] & (1 << y):
+                index = y * MATRIX_WIDTH + x
+                gray[index // 2] |= brightness << 4 if index % 2 == 0 else brightness
+    return bytes(gray)